@@ -107,10 +107,9 @@ def generate_dummy_schedule(
     return schedules
 
 
-import pandas as pd
-
-
 def generate_jadwal():
+    import pandas as pd
+
     jadwal = generate_dummy_schedule(target_sks=random.randint(20, 24), seed=17)
     jadwal_df = pd.DataFrame(
         [
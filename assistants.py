@@ -0,0 +1,174 @@
+"""
+Jadwal sibuk asisten versi batch + pool asisten yang dipakai ulang.
+
+generate_busy_batch(n) membangkitkan jadwal sibuk n asisten sekaligus,
+langsung ke array (format CSR: baris asisten k = slot offsets[k]:offsets[k+1]),
+tanpa DataFrame. Aturannya sama dengan assistant_schedule.generate_dummy_schedule:
+target 20–24 SKS, SKS per kelas dari [1, 2, 2, 3, 3] yang tidak melewati
+target, hari Senin–Sabtu, 07:00–18:00, jeda 10 menit antar kelas. Bedanya,
+rejection sampling jalan paralel untuk semua asisten: tiap ronde semua
+asisten yang belum penuh mencoba satu kandidat (sks, hari, jam) sekaligus.
+
+AssistantPool: asisten tetap per mata kuliah (catatan: satu aslab hanya
+pegang satu mata kuliah, 2–5 aslab per mata kuliah). Gene cukup merujuk
+AssistantSchedule dari pool (id sama), tidak dibangkitkan ulang per gene.
+"""
+
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+
+from assistant_schedule import DAY_NAMES, sks_to_seconds
+from data_type import AssistantSchedule, new_id
+
+SKS_OPTIONS = np.array([1, 2, 2, 3, 3])  # bobot sampling SKS (urut naik)
+DAYS = np.array([1, 2, 3, 4, 5, 6])  # Senin–Sabtu
+BUSY_DAY_START = 7 * 3600
+BUSY_DAY_END = 18 * 3600
+BUSY_GAP = 10 * 60
+MAX_ROUNDS = 5000
+
+
+@dataclass
+class BusySchedules:
+    """Jadwal sibuk banyak asisten dalam array CSR, terurut (day, start) per asisten."""
+
+    offsets: np.ndarray  # (n + 1,)
+    day: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+    sks: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def row(self, k: int) -> slice:
+        return slice(int(self.offsets[k]), int(self.offsets[k + 1]))
+
+    def to_schedule(self, k: int, asst_id: str) -> AssistantSchedule:
+        sl = self.row(k)
+        day = self.day[sl].tolist()
+        start = self.start[sl].tolist()
+        end = self.end[sl].tolist()
+        return AssistantSchedule(
+            id=asst_id,
+            day_name=[DAY_NAMES[d] for d in day],
+            day=day,
+            start_time=start,
+            end_time=end,
+            duration=[round((e - s) / 60, 1) for s, e in zip(start, end)],
+            sks=self.sks[sl].tolist(),
+        )
+
+
+def generate_busy_batch(n: int, rng=random) -> BusySchedules:
+    """Jadwal sibuk n asisten sekaligus (seed numpy diambil dari 'rng')."""
+    gen = np.random.default_rng(rng.getrandbits(64))
+    target = gen.integers(20, 25, size=n)
+    total = np.zeros(n, dtype=np.int64)
+
+    max_k = int(target.max(initial=0))  # paling banyak max_k kelas 1 SKS
+    placed = np.zeros((n, max_k, 3), dtype=np.int64)  # (day, start, end)
+    sks_out = np.zeros((n, max_k), dtype=np.int64)
+    count = np.zeros(n, dtype=np.int64)
+
+    for _ in range(MAX_ROUNDS):
+        active = np.flatnonzero(total < target)
+        if active.size == 0:
+            break
+        m = active.size
+
+        # sks dari opsi yang tidak melewati target (opsi urut naik → prefix)
+        remaining = target[active] - total[active]
+        n_opt = np.searchsorted(SKS_OPTIONS, remaining, side="right")
+        sks = SKS_OPTIONS[(gen.random(m) * n_opt).astype(np.int64)]
+        dur = sks * sks_to_seconds(1)
+        day = DAYS[gen.integers(0, len(DAYS), size=m)]
+        start = gen.integers(BUSY_DAY_START, BUSY_DAY_END - dur, endpoint=True)
+        end = start + dur
+
+        # cek bentrok (dengan jeda) terhadap kelas yang sudah terpasang
+        s = np.maximum(BUSY_DAY_START, start - BUSY_GAP)
+        e = np.minimum(BUSY_DAY_END, end + BUSY_GAP)
+        mine = placed[active]
+        used = np.arange(max_k) < count[active, None]
+        clash = (
+            used
+            & (mine[:, :, 0] == day[:, None])
+            & (mine[:, :, 1] < e[:, None])
+            & (s[:, None] < mine[:, :, 2])
+        ).any(axis=1)
+
+        ok = ~clash
+        rows, slot = active[ok], count[active[ok]]
+        placed[rows, slot] = np.stack([day[ok], start[ok], end[ok]], axis=1)
+        sks_out[rows, slot] = sks[ok]
+        count[rows] += 1
+        total[rows] += sks[ok]
+
+    # ratakan ke CSR, urut (asisten, day, start)
+    owner = np.repeat(np.arange(n), count)
+    used = np.arange(max_k) < count[:, None]
+    flat, flat_sks = placed[used], sks_out[used]
+    order = np.lexsort((flat[:, 1], flat[:, 0], owner))
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(count, out=offsets[1:])
+    return BusySchedules(
+        offsets=offsets,
+        day=flat[order, 0],
+        start=flat[order, 1],
+        end=flat[order, 2],
+        sks=flat_sks[order],
+    )
+
+
+def new_assistant_id(rng=random) -> str:
+    """uuid4 (hex) dari 'rng', jadi ikut random.seed(...)."""
+    return new_id(rng)
+
+
+@dataclass
+class AssistantPool:
+    """Asisten ber-index: schedules[i].id == ids[i], by_subject → index asisten."""
+
+    busy: BusySchedules
+    ids: List[str]
+    schedules: List[AssistantSchedule]
+    by_subject: Dict[str, List[int]] = field(default_factory=dict)
+    index: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self.index = {a: i for i, a in enumerate(self.ids)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def get(self, asst_id: str) -> AssistantSchedule:
+        return self.schedules[self.index[asst_id]]
+
+    def for_subject(self, subject_id: str) -> List[AssistantSchedule]:
+        """Asisten tetap milik mata kuliah ini (list baru, objek dari pool)."""
+        return [self.schedules[i] for i in self.by_subject[subject_id]]
+
+    @classmethod
+    def generate(cls, n: int, rng=random) -> "AssistantPool":
+        busy = generate_busy_batch(n, rng)
+        ids = [new_assistant_id(rng) for _ in range(n)]
+        schedules = [busy.to_schedule(k, ids[k]) for k in range(n)]
+        return cls(busy, ids, schedules)
+
+    @classmethod
+    def for_subjects(
+        cls, subject_ids, min_per_subject: int = 2, max_per_subject: int = 5, rng=random
+    ) -> "AssistantPool":
+        """Pool dengan min..max asisten per mata kuliah (subject_id unik, urutan tetap)."""
+        subjects = list(dict.fromkeys(subject_ids))
+        sizes = [rng.randint(min_per_subject, max_per_subject) for _ in subjects]
+        pool = cls.generate(sum(sizes), rng)
+        k = 0
+        for sid, size in zip(subjects, sizes):
+            pool.by_subject[sid] = list(range(k, k + size))
+            k += size
+        return pool
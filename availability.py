@@ -0,0 +1,167 @@
+"""
+Indeks ketersediaan asisten untuk aturan "minimal dua aslab hadir" (catatan.txt).
+
+- Tiap asisten punya bitmask sibuk mingguan: bit (day * SLOTS_PER_DAY + slot)
+  menyala kalau jadwal sibuknya menyentuh slot GRID itu. Untuk interval di grid
+  ini persis sama dengan cek overlap() per entri jadwal.
+- Tiap roster mata kuliah (himpunan id asisten di gene) + durasi punya tabel
+  counts[day][slot] = jumlah asisten yang bebas selama [slot, slot + durasi).
+  Cari slot dengan >= 2 asisten bebas cukup lookup tabel.
+
+Tabel di-cache per (roster, durasi). Roster yang berubah otomatis dapat key
+baru; jadwal sibuk asisten yang berubah (objek baru dengan id sama, atau
+lewat update()) membuang tabel yang memuat asisten tsb.
+Interval yang tidak pas grid dicek langsung ke jadwal sibuk (scan lama).
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import metrics
+from data_type import AssistantSchedule
+from fitness import GRID, overlap
+from occupancy import SLOTS_PER_DAY, slot_bounds
+
+N_DAYS = 8  # hari 0..7 (seeder 0..5, asisten 1..6, try_mutation1 1..7)
+
+Roster = Tuple[str, ...]
+
+
+def _on_grid(s: int, e: int) -> bool:
+    return 0 <= s < e <= SLOTS_PER_DAY * GRID and s % GRID == 0 and e % GRID == 0
+
+
+def busy_mask(asst: AssistantSchedule) -> int:
+    """Bitmask sibuk mingguan satu asisten."""
+    mask = 0
+    for d, s, e in zip(asst.day, asst.start_time, asst.end_time):
+        if not 0 <= d < N_DAYS or e <= s:
+            continue
+        lo, hi = slot_bounds(s, e)
+        hi = min(hi, SLOTS_PER_DAY)
+        if hi > lo:
+            mask |= ((1 << (hi - lo)) - 1) << (d * SLOTS_PER_DAY + lo)
+    return mask
+
+
+def _scan_is_free(asst: AssistantSchedule, day: int, start: int, end: int) -> bool:
+    for i, d in enumerate(asst.day):
+        if d == day and overlap(asst.start_time[i], asst.end_time[i], start, end):
+            return False
+    return True
+
+
+class CourseTable:
+    """counts[day][slot]: asisten roster yang bebas di [slot, slot + k) (k slot)."""
+
+    def __init__(self, masks: List[int], k: int):
+        self.k = k
+        window = (1 << k) - 1
+        last = SLOTS_PER_DAY - k
+        self.counts: List[List[int]] = []
+        for d in range(N_DAYS):
+            base = d * SLOTS_PER_DAY
+            row = [0] * (SLOTS_PER_DAY - k + 1) if last >= 0 else []
+            for m in masks:
+                day_bits = (m >> base) & ((1 << SLOTS_PER_DAY) - 1)
+                if not day_bits:
+                    row = [c + 1 for c in row]
+                    continue
+                for j in range(len(row)):
+                    if not (day_bits >> j) & window:
+                        row[j] += 1
+            self.counts.append(row)
+        self._at_least: Dict[int, List[Tuple[int, int]]] = {}
+
+    def at_least(self, need: int) -> List[Tuple[int, int]]:
+        """(day, start_slot) dengan >= need asisten bebas (di-cache per need)."""
+        res = self._at_least.get(need)
+        if res is None:
+            res = self._at_least[need] = [
+                (d, j)
+                for d, row in enumerate(self.counts)
+                for j, c in enumerate(row)
+                if c >= need
+            ]
+        return res
+
+
+class AvailabilityIndex:
+    def __init__(self):
+        self._masks: Dict[str, int] = {}
+        self._objs: Dict[str, AssistantSchedule] = {}
+        self._tables: Dict[Tuple[Roster, int], CourseTable] = {}
+
+    # ---------- asisten ----------
+    def update(self, asst: AssistantSchedule) -> bool:
+        """(Re)hitung bitmask asisten; return True kalau jadwal sibuknya berubah."""
+        mask = busy_mask(asst)
+        old = self._masks.get(asst.id)
+        self._masks[asst.id] = mask
+        self._objs[asst.id] = asst
+        if old is None or old == mask:
+            return False
+        self._tables = {
+            key: t for key, t in self._tables.items() if asst.id not in key[0]
+        }
+        return True
+
+    def mask(self, asst: AssistantSchedule) -> int:
+        if self._objs.get(asst.id) is not asst:
+            self.update(asst)
+        return self._masks[asst.id]
+
+    def is_free(self, asst: AssistantSchedule, day: int, start: int, end: int) -> bool:
+        if not (_on_grid(start, end) and 0 <= day < N_DAYS):
+            return _scan_is_free(asst, day, start, end)
+        lo, hi = start // GRID, end // GRID
+        window = ((1 << (hi - lo)) - 1) << (day * SLOTS_PER_DAY + lo)
+        return not self.mask(asst) & window
+
+    # ---------- roster mata kuliah ----------
+    def roster(self, assistants: Iterable[AssistantSchedule]) -> Roster:
+        uniq = {a.id: a for a in assistants}
+        for a in uniq.values():
+            self.mask(a)
+        return tuple(sorted(uniq))
+
+    def table(self, assistants: Iterable[AssistantSchedule], dur: int) -> CourseTable:
+        """Tabel roster untuk durasi 'dur' detik (dibulatkan ke atas ke GRID)."""
+        roster = self.roster(assistants)
+        k = max(1, -(-dur // GRID))
+        t = self._tables.get((roster, k))
+        if t is None:
+            metrics.incr("availability_table_misses")
+            t = self._tables[(roster, k)] = CourseTable(
+                [self._masks[a] for a in roster], k
+            )
+        else:
+            metrics.incr("availability_table_hits")
+        return t
+
+    def count_free(
+        self, assistants: List[AssistantSchedule], day: int, start: int, end: int
+    ) -> int:
+        """Jumlah asisten unik yang bebas di [start, end) pada 'day'."""
+        if not (_on_grid(start, end) and 0 <= day < N_DAYS):
+            uniq = {a.id: a for a in assistants}.values()
+            return sum(1 for a in uniq if _scan_is_free(a, day, start, end))
+        return self.table(assistants, end - start).counts[day][start // GRID]
+
+    def slots_with(
+        self,
+        assistants: List[AssistantSchedule],
+        dur: int,
+        need: int = 2,
+        days: Optional[Iterable[int]] = None,
+        earliest: int = 0,
+        latest: int = SLOTS_PER_DAY * GRID,
+    ) -> List[Tuple[int, int]]:
+        """(day, start detik) dengan >= need asisten bebas, start di [earliest, latest - dur]."""
+        t = self.table(assistants, dur)
+        days = None if days is None else set(days)
+        lo, hi = -(-earliest // GRID), (latest - dur) // GRID
+        return [
+            (d, j * GRID)
+            for d, j in t.at_least(need)
+            if lo <= j <= hi and (days is None or d in days)
+        ]
@@ -0,0 +1,319 @@
+"""
+Micro-benchmark hot path GA, hasil disimpan sebagai JSON.
+
+    python bench.py run --out baseline.json
+    python bench.py run --out current.json --only fitness cx_
+    python bench.py compare baseline.json current.json --threshold 0.10
+
+'run' men-sweep ukuran populasi (--pops) dan panjang kromosom (--genes) dengan
+seed tetap: populasi dibangkitkan sekali per panjang kromosom lalu dipotong.
+Tiap case diulang sampai >= --min-time detik per repeat, disimpan best & median
+per panggilan. 'compare' membandingkan 'best' tiap case; rasio > 1 + threshold
+ditandai REGRESI dan exit code 1.
+
+Case yang mengubah input (repair, operator mutasi) bekerja pada clone(), jadi
+biaya clone copy-on-write ikut terukur.
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+from bench_bitset import random_intervals
+from context import GAContext, set_default_context
+
+FORMAT = 1
+
+
+# ---------- timing ----------
+def measure(fn: Callable[[], object], repeat: int, min_time: float) -> dict:
+    """
+    Jumlah panggilan per repeat dinaikkan sampai >= min_time; return detik per
+    panggilan. Seperti timeit: satu panggilan pemanasan dan GC dimatikan.
+    """
+    fn()
+    gc.collect()
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _measure(fn, repeat, min_time)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _measure(fn: Callable[[], object], repeat: int, min_time: float) -> dict:
+    number = 1
+    while True:
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        dt = time.perf_counter() - t
+        if dt >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if dt <= 0 else max(2, min(10, int(min_time / dt) + 1))
+    runs = [dt / number]
+    for _ in range(repeat - 1):
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        runs.append((time.perf_counter() - t) / number)
+    return {"best": min(runs), "median": statistics.median(runs), "number": number}
+
+
+# ---------- case ----------
+# tiap case: nama → (scope, setup). scope "pop" di-sweep n_pop × n_gene,
+# "gene" hanya n_gene (satu individu), "pairs" ukuran bucket interval.
+# setup(pop, rng) → fungsi tanpa argumen yang diukur.
+def _cases() -> Dict[str, tuple]:
+    import crossover as cx
+    import try_crossover1 as tc
+    import try_mutation1 as tm
+    from fitness import _count_pairs, fitness
+    from mutation import mutation
+    from occupancy import OccupancyGrid
+
+    def per_gene(op, with_grid=False):
+        def setup(pop, rng):
+            ind = pop[0]
+            genes = list(ind.chromosome)
+            grid = OccupancyGrid(genes) if with_grid else None
+
+            def run():
+                for g in genes:
+                    if grid is None:
+                        op(g)
+                        continue
+                    grid.remove_gene(g)
+                    op(g, grid)
+                    grid.add_gene(g)
+
+            return run
+
+        return ("gene", setup)
+
+    def pairwise(op):
+        def setup(pop, rng):
+            pairs = list(zip(pop[0::2], pop[1::2]))
+            return lambda: [op(a, b) for a, b in pairs]
+
+        return ("pop", setup)
+
+    def fitness_case(backend):
+        return ("pop", lambda pop, rng: lambda: fitness(pop, backend=backend, cache=False))
+
+    def fits_of(pop):
+        return fitness(pop, backend="bitset")
+
+    def count_pairs_case(pop, rng):
+        ints = random_intervals(rng, len(pop))
+        return lambda: _count_pairs(ints)
+
+    def repair_case(pop, rng):
+        return lambda: [cx.repair_individual(ind.clone()) for ind in pop]
+
+    def repair_conflicts_case(pop, rng):
+        from repair import repair_conflicts
+
+        return lambda: [repair_conflicts(ind.clone()) for ind in pop]
+
+    def roulette_case(pop, rng):
+        fits = fits_of(pop)
+        return lambda: cx.roulette_select(pop, fits)
+
+    def sus_case(pop, rng):
+        fits = fits_of(pop)
+        return lambda: tc.sus_select(fits, pop, len(pop))
+
+    def crossover_case(pop, rng):
+        fits = fits_of(pop)
+        return lambda: cx.crossover(fits, pop)
+
+    def mutation_case(pop, rng):
+        return lambda: mutation([ind.clone() for ind in pop], rate=1.0)
+
+    def swap_case(pop, rng):
+        ind = pop[0]
+        return lambda: [tm.op_swap_two_genes(ind.clone()) for _ in ind.chromosome]
+
+    def regenerate_case(pop, rng):
+        return lambda: tm.op_regenerate_gene()
+
+    def seed_case(pop, rng):
+        from seeder import generate_population
+
+        n_pop, n_gene = len(pop), len(pop[0].chromosome)
+        return lambda: generate_population(n_gene, n_pop)
+
+    return {
+        "fitness.python": fitness_case("python"),
+        "fitness.numpy": fitness_case("numpy"),
+        "fitness.bitset": fitness_case("bitset"),
+        "_count_pairs": ("pairs", count_pairs_case),
+        "repair_individual": ("pop", repair_case),
+        "repair_conflicts": ("pop", repair_conflicts_case),
+        "roulette_select": ("pop", roulette_case),
+        "sus_select": ("pop", sus_case),
+        "crossover": ("pop", crossover_case),
+        "mutation": ("pop", mutation_case),
+        "cx_one_point": pairwise(tc.cx_one_point),
+        "cx_two_point": pairwise(tc.cx_two_point),
+        "cx_uniform_gene": pairwise(tc.cx_uniform_gene),
+        "cx_uniform_schedule_fields": pairwise(tc.cx_uniform_schedule_fields),
+        "op_time_shift": per_gene(tm.op_time_shift, with_grid=True),
+        "op_day_swap": per_gene(tm.op_day_swap),
+        "op_room_preferred": per_gene(tm.op_room_preferred, with_grid=True),
+        "op_fit_for_two_asst": per_gene(tm.op_fit_for_two_asst),
+        "op_swap_two_genes": ("gene", swap_case),
+        "op_regenerate_gene": ("once", regenerate_case),
+        "generate_population": ("pop", seed_case),
+    }
+
+
+def _git_rev() -> str:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def run(args) -> int:
+    from seeder import generate_population
+
+    random.seed(args.seed)
+    ctx = GAContext()
+    set_default_context(ctx)
+    cases = _cases()
+    names = [n for n in cases if not args.only or any(o in n for o in args.only)]
+    if not names:
+        print(f"tidak ada case yang cocok dengan {args.only}", file=sys.stderr)
+        return 2
+
+    # populasi per panjang kromosom, dipotong ke tiap n_pop
+    pops = {}
+    for n_gene in args.genes:
+        random.seed(f"{args.seed}:{n_gene}")
+        pops[n_gene] = generate_population(n_gene, max(args.pops), ctx)
+
+    results = {}
+
+    def bench(key: str, name: str, params: dict, setup, pop):
+        # seed tetap per case supaya urutan/subset case tidak mengubah input
+        rng = random.Random(f"{args.seed}:{key}")
+        random.seed(f"{args.seed}:{key}")
+        fn = setup(pop, rng)
+        res = measure(fn, args.repeat, args.min_time)
+        results[key] = {"case": name, "params": params, **res}
+        print(
+            f"{key:<58} {res['best'] * 1e3:>10.3f} ms  "
+            f"(median {res['median'] * 1e3:.3f}, n={res['number']})",
+            flush=True,
+        )
+
+    for name in names:
+        scope, setup = cases[name]
+        if scope == "pairs":
+            for size in args.pair_sizes:
+                pop = [None] * size
+                bench(f"{name}[n={size}]", name, {"n": size}, setup, pop)
+        elif scope == "once":
+            bench(name, name, {}, setup, pops[args.genes[0]])
+        elif scope == "gene":
+            for n_gene in args.genes:
+                key = f"{name}[n_gene={n_gene}]"
+                bench(key, name, {"n_gene": n_gene}, setup, pops[n_gene])
+        else:
+            for n_gene in args.genes:
+                for n_pop in args.pops:
+                    key = f"{name}[n_pop={n_pop},n_gene={n_gene}]"
+                    params = {"n_pop": n_pop, "n_gene": n_gene}
+                    bench(key, name, params, setup, pops[n_gene][:n_pop])
+
+    doc = {
+        "format": FORMAT,
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "git": _git_rev(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(doc, f, indent=2)
+    print(f"hasil → {args.out}")
+    return 0
+
+
+def compare(args) -> int:
+    with open(args.baseline) as f:
+        base = json.load(f)["results"]
+    with open(args.current) as f:
+        cur = json.load(f)["results"]
+
+    regressions: List[str] = []
+    print(f"{'case':<58} {'base ms':>10} {'now ms':>10} {'ratio':>7}")
+    for key in sorted(set(base) & set(cur)):
+        b, c = base[key]["best"], cur[key]["best"]
+        ratio = c / b if b > 0 else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESI"
+            regressions.append(key)
+        elif ratio < 1 / (1 + args.threshold):
+            flag = "  lebih cepat"
+        print(f"{key:<58} {b * 1e3:>10.3f} {c * 1e3:>10.3f} {ratio:>6.2f}x{flag}")
+
+    for key in sorted(set(base) - set(cur)):
+        print(f"{key:<58} hilang di {args.current}")
+    for key in sorted(set(cur) - set(base)):
+        print(f"{key:<58} baru (tidak ada di baseline)")
+
+    if regressions:
+        print(f"{len(regressions)} regresi > {args.threshold:.0%}")
+        return 1
+    print("tidak ada regresi")
+    return 0
+
+
+def main():
+    p = argparse.ArgumentParser(description="Micro-benchmark hot path GA")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    r = sub.add_parser("run", help="jalankan benchmark, simpan JSON")
+    r.add_argument("--out", default="bench_results.json")
+    r.add_argument("--seed", type=int, default=0)
+    r.add_argument("--repeat", type=int, default=5)
+    r.add_argument("--min-time", type=float, default=0.05, help="detik minimum per repeat")
+    r.add_argument("--pops", type=int, nargs="+", default=[10, 40])
+    r.add_argument("--genes", type=int, nargs="+", default=[20, 80])
+    r.add_argument("--pair-sizes", type=int, nargs="+", default=[8, 64, 512])
+    r.add_argument("--only", nargs="+", default=None, help="substring nama case")
+
+    c = sub.add_parser("compare", help="bandingkan hasil dengan baseline")
+    c.add_argument("baseline")
+    c.add_argument("current")
+    c.add_argument("--threshold", type=float, default=0.10, help="toleransi (0.10 = 10%%)")
+
+    args = p.parse_args()
+    sys.exit(run(args) if args.cmd == "run" else compare(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark hitung pasangan bentrok: heap (_count_pairs) vs bitset (bitset.py).
+
+    python bench_bitset.py --seed 0 --repeat 5
+
+Bagian 1: satu bucket sintetis berukuran n (interval acak di grid 07:00–17:00).
+Bagian 2: fitness() penuh vs backend bitset pada populasi dari seeder.
+"""
+
+import argparse
+import random
+import timeit
+
+from bitset import count_pairs, count_pairs_bits, interval_mask
+from fitness import DAY_CLOSE, DAY_OPEN, GRID, _count_pairs, fitness
+
+
+def random_intervals(rng: random.Random, n: int):
+    ints = []
+    for _ in range(n):
+        dur = rng.choice([4, 6]) * GRID  # 120 / 180 menit
+        s = rng.randrange(DAY_OPEN, DAY_CLOSE - dur + 1, GRID)
+        ints.append((s, s + dur))
+    return ints
+
+
+def best_of(fn, repeat: int, number: int) -> float:
+    return min(timeit.repeat(fn, repeat=repeat, number=number)) / number
+
+
+def main():
+    p = argparse.ArgumentParser(description="Benchmark heap vs bitset pair counting")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--sizes", type=int, nargs="+", default=[2, 4, 8, 16, 32, 64])
+    p.add_argument("--pop", type=int, nargs=2, default=[40, 20], metavar=("N_GENE", "N_POP"))
+    args = p.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{'n':>4} {'heap us':>10} {'bitset us':>10} {'masks us':>10} {'speedup':>8}")
+    for n in args.sizes:
+        ints = random_intervals(rng, n)
+        masks = [interval_mask(s, e) for s, e in ints]
+        assert _count_pairs(ints) == count_pairs(ints) == count_pairs_bits(masks)
+        number = max(1, 20000 // n)
+        t_heap = best_of(lambda: _count_pairs(ints), args.repeat, number)
+        t_bits = best_of(lambda: count_pairs(ints), args.repeat, number)
+        t_mask = best_of(lambda: count_pairs_bits(masks), args.repeat, number)
+        print(
+            f"{n:>4} {t_heap * 1e6:>10.2f} {t_bits * 1e6:>10.2f} "
+            f"{t_mask * 1e6:>10.2f} {t_heap / t_bits:>7.2f}x"
+        )
+
+    from seeder import generate_population
+
+    random.seed(args.seed)
+    pop = generate_population(*args.pop)
+    assert fitness(pop, cache=False) == fitness(pop, backend="bitset", cache=False)
+    t_heap = best_of(lambda: fitness(pop, cache=False), args.repeat, 1)
+    t_bits = best_of(lambda: fitness(pop, backend="bitset", cache=False), args.repeat, 1)
+    print(
+        f"fitness() pop={args.pop}: heap {t_heap * 1e3:.2f} ms, "
+        f"bitset {t_bits * 1e3:.2f} ms ({t_heap / t_bits:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
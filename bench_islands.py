@@ -0,0 +1,79 @@
+"""
+Benchmark waktu mencapai target: satu populasi (ga.solve) vs island model.
+
+    python bench_islands.py --seeds 0 1 2 --target 0.5 --islands 4
+
+Total populasi, target dan max_iter sama untuk kedua mode. Waktu dihitung
+tanpa seeding (GAResult.time_to_target); run yang tidak mencapai target
+dicatat sebagai gagal. Speedup island model butuh >= 'islands' core.
+"""
+
+import argparse
+import statistics
+
+from context import GAContext
+from ga import GAConfig, solve
+
+
+def run(config: GAConfig, ctx: GAContext):
+    res = solve(config, ctx)
+    return res.time_to_target, res.fitness, res.iteration
+
+
+def summarize(name: str, rows):
+    hits = [t for t, _, _ in rows if t is not None]
+    med = f"{statistics.median(hits):.2f}s" if hits else "-"
+    best = max(f for _, f, _ in rows)
+    print(
+        f"{name:>12}: {len(hits)}/{len(rows)} mencapai target, "
+        f"median {med}, best fitness {best:.4f}"
+    )
+
+
+def main():
+    p = argparse.ArgumentParser(description="Benchmark single population vs island model")
+    p.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    p.add_argument("--pop", type=int, nargs=2, default=[40, 40], metavar=("N_GENE", "N_POP"))
+    p.add_argument("--islands", type=int, default=4)
+    p.add_argument("--migration-interval", type=int, default=5)
+    p.add_argument("--migrants", type=int, default=2)
+    p.add_argument("--topology", choices=["ring", "full"], default="ring")
+    p.add_argument("--target", type=float, default=0.5)
+    p.add_argument("--max-iter", type=int, default=200)
+    p.add_argument("--fitness-backend", choices=["python", "numpy", "bitset"], default="bitset")
+    args = p.parse_args()
+
+    single, island = [], []
+    for seed in args.seeds:
+        base = dict(
+            n_gene=args.pop[0],
+            n_pop=args.pop[1],
+            seed=seed,
+            fitness_backend=args.fitness_backend,
+            max_iter=args.max_iter,
+            target=args.target,
+        )
+        # context baru per seed supaya Rooms/pool asisten sama untuk kedua mode
+        single.append(run(GAConfig(**base), GAContext()))
+        island.append(
+            run(
+                GAConfig(
+                    **base,
+                    islands=args.islands,
+                    migration_interval=args.migration_interval,
+                    migrants=args.migrants,
+                    topology=args.topology,
+                ),
+                GAContext(),
+            )
+        )
+        for name, (t, f, it) in (("single", single[-1]), ("islands", island[-1])):
+            t = f"{t:.2f}s" if t is not None else "-"
+            print(f"seed {seed} {name:>8}: t={t:>8} fitness={f:.4f} iter={it}")
+
+    summarize("single", single)
+    summarize(f"islands x{args.islands}", island)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark waktu mencapai jadwal feasible: GA biasa vs GA + local search (memetic.py).
+
+    python bench_memetic.py --seeds 0 1 2 --pop 80 20 --memetic tabu
+
+Seed, populasi awal, target dan max_iter sama untuk kedua mode; waktu dihitung
+tanpa seeding (GAResult.time_to_target). Run yang tidak mencapai target dicatat
+sebagai gagal.
+"""
+
+import argparse
+import statistics
+
+from bench_islands import run, summarize
+from context import GAContext
+from ga import GAConfig
+
+
+def main():
+    p = argparse.ArgumentParser(description="Benchmark GA biasa vs memetic")
+    p.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    p.add_argument("--pop", type=int, nargs=2, default=[80, 20], metavar=("N_GENE", "N_POP"))
+    p.add_argument("--memetic", choices=["tabu", "descent"], default="tabu")
+    p.add_argument("--elites", type=int, default=2)
+    p.add_argument("--evals", type=int, default=200)
+    p.add_argument("--time", type=float, default=None, help="detik per generasi")
+    p.add_argument("--target", type=float, default=1.0)
+    p.add_argument("--max-iter", type=int, default=300)
+    p.add_argument("--fitness-backend", choices=["python", "numpy", "bitset"], default="bitset")
+    args = p.parse_args()
+
+    plain, memetic = [], []
+    for seed in args.seeds:
+        base = dict(
+            n_gene=args.pop[0],
+            n_pop=args.pop[1],
+            seed=seed,
+            fitness_backend=args.fitness_backend,
+            max_iter=args.max_iter,
+            target=args.target,
+        )
+        plain.append(run(GAConfig(**base), GAContext()))
+        memetic.append(
+            run(
+                GAConfig(
+                    **base,
+                    memetic=args.memetic,
+                    memetic_elites=args.elites,
+                    memetic_evals=args.evals,
+                    memetic_time=args.time,
+                ),
+                GAContext(),
+            )
+        )
+        for name, (t, f, it) in (("plain", plain[-1]), ("memetic", memetic[-1])):
+            t = f"{t:.2f}s" if t is not None else "-"
+            print(f"seed {seed} {name:>8}: t={t:>8} fitness={f:.4f} iter={it}")
+
+    summarize("plain", plain)
+    summarize(f"memetic {args.memetic}", memetic)
+    pairs = [
+        (a[0], b[0])
+        for a, b in zip(plain, memetic)
+        if a[0] is not None and b[0] is not None and b[0] > 0
+    ]
+    if pairs:
+        ratio = statistics.median(a / b for a, b in pairs)
+        print(f"speedup median (seed yang keduanya mencapai target): {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
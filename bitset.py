@@ -0,0 +1,102 @@
+"""
+Encoding bitset untuk hitung bentrok: interval [start, end) yang sudah di grid
+GRID jadi bitmask slot dalam satu hari (bit k = slot k*GRID .. (k+1)*GRID).
+
+Dua interval di grid bentrok  <=>  mask_a & mask_b != 0  (sama dengan semantik
+half-open [start, end) di overlap()).
+
+Per bucket (day, resource) disimpan OR semua mask yang sudah masuk. Interval
+baru yang AND-nya dengan union = 0 pasti tidak bentrok (kasus paling umum,
+cukup satu AND); hanya kalau union kena baru dicek AND per anggota. Tidak ada
+sort maupun heap seperti di _count_pairs.
+
+Individu yang punya interval di luar grid / durasi tidak positif otomatis
+dihitung lewat fitness() (heap) supaya hasil tetap identik.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from fitness import ALPHA, BETA, GAMMA, GRID, _count_pairs, _fitness, norm_group
+
+
+def interval_mask(s: int, e: int) -> int:
+    """Bitmask slot untuk [s, e); s & e harus kelipatan GRID."""
+    return ((1 << ((e - s) // GRID)) - 1) << (s // GRID)
+
+
+def _on_grid(s: int, e: int) -> bool:
+    return s < e and s >= 0 and s % GRID == 0 and e % GRID == 0
+
+
+def count_pairs_bits(masks: List[int]) -> int:
+    """Jumlah pasangan bentrok dari bitmask interval dalam satu bucket."""
+    union = 0
+    pairs = 0
+    for k, m in enumerate(masks):
+        if union & m:
+            for x in masks[:k]:
+                if x & m:
+                    pairs += 1
+        union |= m
+    return pairs
+
+
+def count_pairs(ints: List[Tuple[int, int]]) -> int:
+    """Pengganti _count_pairs berbasis bitset (fallback ke heap kalau tidak di grid)."""
+    if len(ints) < 2:
+        return 0
+    if not all(_on_grid(s, e) for s, e in ints):
+        return _count_pairs(ints)
+    return count_pairs_bits([interval_mask(s, e) for s, e in ints])
+
+
+def _add(buckets: Dict[tuple, List[int]], key: tuple, m: int) -> int:
+    """Masukkan mask ke bucket [union, mask...]; return jumlah pasangan baru."""
+    b = buckets.get(key)
+    if b is None:
+        buckets[key] = [m, m]
+        return 0
+    n = 0
+    if b[0] & m:
+        for x in b[1:]:
+            if x & m:
+                n += 1
+    b[0] |= m
+    b.append(m)
+    return n
+
+
+def _individual_pairs(chromosome) -> Optional[Tuple[int, int, int]]:
+    """(room, group, asst) pasangan bentrok; None kalau ada interval di luar grid."""
+    by_day_room: Dict[tuple, List[int]] = {}
+    by_day_group: Dict[tuple, List[int]] = {}
+    by_day_asst: Dict[tuple, List[int]] = {}
+    room = group = asst = 0
+    for g in chromosome:
+        s, e = g.start_time, g.end_time
+        if s % GRID or e % GRID or e <= s or s < 0:
+            return None
+        m = ((1 << ((e - s) // GRID)) - 1) << (s // GRID)
+        room += _add(by_day_room, (g.day, g.room_id), m)
+        gnorm = norm_group(getattr(g, "group", ""))
+        if gnorm:
+            group += _add(by_day_group, (g.day, gnorm), m)
+        for a in getattr(g, "assistant", []) or []:
+            asst_id = getattr(a, "id", None)
+            if asst_id:
+                asst += _add(by_day_asst, (g.day, asst_id), m)
+    return room, group, asst
+
+
+def fitness_bits(pop: List["Individuals"]) -> List[float]:
+    fitnesses: List[float] = []
+    for individu in pop:
+        counts = _individual_pairs(individu.chromosome)
+        if counts is None:
+            # ada interval di luar grid → pakai jalur heap untuk individu ini
+            fitnesses.append(_fitness([individu], "python")[0])
+            continue
+        room, group, asst = counts
+        penalty = ALPHA * room + BETA * group + GAMMA * asst
+        fitnesses.append(1.0 / (1.0 + penalty))
+    return fitnesses
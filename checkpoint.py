@@ -0,0 +1,393 @@
+"""
+Checkpoint & resume run GA dalam format biner yang bisa di-memory-map.
+
+File <path>:
+    MAGIC (8 byte) | panjang header (uint64 LE) | header JSON | padding 64 byte
+    | buffer PopulationArray (int64: gene, placement, day_name, lengths)
+    | fitness (float64, n_pop)
+
+Header memuat generation, evaluations, elapsed, state RNG (random.getstate()),
+state AdaptivePursuit (operators='adaptive', to_dict() per jenis operator),
+config dan panjang + sha256 table gene.
+
+Table gene statis (mata kuliah, asisten, preferred_lab, group, id) ditulis
+sekali ke <path>.table-<sha256[:16]> (pickle) dan hanya ditulis ulang kalau
+bertambah; checkpoint periodik cukup menulis array penempatan. Semua file
+ditulis ke file sementara lalu os.replace. Table baru punya nama baru dan
+table lama baru dihapus setelah header yang menunjuk table baru ter-commit,
+jadi proses yang mati di tengah jalan tidak merusak checkpoint sebelumnya.
+
+Di sistem yang punya os.fork, save() setelah checkpoint pertama berjalan di
+background: proses di-fork (snapshot copy-on-write populasi, beberapa ms)
+dan anaknya yang meng-encode & menulis, jadi loop GA tidak menunggu encode
+List[Individuals]. Save berikutnya / wait() menunggu anak sebelumnya dan
+membaca laporannya lewat pipe (gene & nama hari baru, file + sha table yang
+ditulis), jadi table di parent ikut bertambah dan tidak ditulis ulang utuh
+di save berikutnya.
+
+    ck = Checkpointer("run.ckpt", every=10, config=config)
+    for rec in evolve(config):
+        if ck.due(rec):
+            ck.save(rec)
+    ck.wait()
+
+    state = load("run.ckpt")
+    for rec in evolve(state.ga_config(), resume=state):
+        ...
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import random
+import struct
+import sys
+import traceback
+from operator import attrgetter
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from assistant_schedule import DAY_NAMES
+from data_type import Gene, Individuals, PopulationArray
+
+MAGIC = b"GACKPT01"
+VERSION = 1
+ALIGN = 64
+# checkpoint hanya di akhir generasi: lanjutannya selalu crossover berikutnya
+END_STAGES = ("init", "mutation", "resume")
+
+_ID, _DAY_NAME = attrgetter("id"), attrgetter("day_name")
+# urutan kolom placement: DAY, START, END, ROOM
+_PLACEMENT = [attrgetter(f) for f in ("day", "start_time", "end_time", "room_id")]
+
+
+@dataclass
+class Checkpoint:
+    """Isi checkpoint; 'population' & 'fitnesses' menumpang di memmap (read-only)."""
+
+    path: str
+    generation: int
+    evaluations: int
+    elapsed: float
+    reached: bool
+    rng_state: tuple
+    config: Optional[dict]
+    population: PopulationArray
+    fitnesses: np.ndarray
+    operator_stats: Optional[dict] = None  # {jenis: AdaptivePursuit.to_dict()}
+    table_sha: str = field(default="", repr=False)
+    table_file: str = field(default="", repr=False)  # nama file table (tanpa direktori)
+
+    def individuals(self) -> List[Individuals]:
+        return self.population.to_individuals()
+
+    def ga_config(self):
+        from ga import GAConfig
+
+        return GAConfig(**self.config) if self.config is not None else GAConfig()
+
+
+def _write_atomic(path: str, chunks) -> None:
+    tmp = f"{path}.tmp-{os.getpid()}"
+    try:
+        with open(tmp, "wb") as f:
+            for c in chunks:
+                f.write(c)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _rng_to_json(state) -> list:
+    version, internal, gauss = state
+    return [version, list(internal), gauss]
+
+
+def _rng_from_json(state) -> tuple:
+    version, internal, gauss = state
+    return (version, tuple(internal), gauss)
+
+
+class Checkpointer:
+    """
+    Penulis checkpoint untuk satu run. Menyimpan table gene (index id → baris)
+    supaya index di semua checkpoint run ini konsisten dan table cukup ditulis sekali.
+    """
+
+    def __init__(self, path: str, every: int = 10, config=None, background: bool = None):
+        if every < 1:
+            raise ValueError("every harus >= 1")
+        self.path = path
+        self.every = every
+        self.config = asdict(config) if is_dataclass(config) else config
+        self.table: List[Gene] = []
+        self.index: Dict[str, int] = {}
+        self.day_names: List[str] = list(DAY_NAMES.values())
+        self.codes: Dict[str, int] = {n: i for i, n in enumerate(self.day_names)}
+        self._written = -1  # panjang table yang sudah ada di _table_file
+        self._sha = ""
+        self._table_file = ""
+        # background=None → otomatis kalau os.fork ada
+        self.background = hasattr(os, "fork") if background is None else background
+        self._child: Optional[int] = None
+        self._report: Optional[int] = None  # fd pipe laporan dari anak
+
+    @classmethod
+    def resume_from(cls, state: Checkpoint, path: str = None, every: int = 10):
+        """Lanjutkan menulis dengan table & nama hari dari checkpoint 'state'."""
+        ck = cls(path or state.path, every, state.config)
+        ck.table = list(state.population.table)
+        ck.index = {g.id: i for i, g in enumerate(ck.table)}
+        ck.day_names = list(state.population.day_names)
+        ck.codes = {n: i for i, n in enumerate(ck.day_names)}
+        if ck.path == state.path:
+            ck._written, ck._sha = len(ck.table), state.table_sha
+            ck._table_file = state.table_file
+        return ck
+
+    def due(self, rec) -> bool:
+        """Record akhir generasi ke-N·every (atau yang memenuhi aturan berhenti)."""
+        return rec.stage in ("init", "mutation") and (
+            rec.generation % self.every == 0 or rec.reached
+        )
+
+    # ---------- encode ----------
+    def _encode(self, pop: List[Individuals]) -> PopulationArray:
+        lengths = [len(ind.chromosome) for ind in pop]
+        genes = [g for ind in pop for g in ind.chromosome]
+        n, width = len(pop), max(lengths, default=0)
+        pa = PopulationArray.allocate(n, width, self.table, self.day_names)
+        pa.gene[:] = -1
+        pa.lengths[:] = lengths
+        if not genes:
+            return pa
+
+        # per kolom lewat map/fromiter: tanpa loop Python per gene
+        rows = list(map(self.index.get, map(_ID, genes)))
+        codes = list(map(self.codes.get, map(_DAY_NAME, genes)))
+        if None in rows or None in codes:
+            for j, g in enumerate(genes):
+                if rows[j] is None:
+                    rows[j] = self._table_row(g)
+                if codes[j] is None:
+                    codes[j] = self._day_code(g.day_name)
+
+        # posisi (baris, kolom) tiap gene dalam urutan kromosom
+        r = np.repeat(np.arange(n), lengths)
+        c = np.arange(len(genes)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        pa.gene[r, c] = rows
+        pa.day_name[r, c] = codes
+        for k, get in enumerate(_PLACEMENT):
+            pa.placement[r, c, k] = np.fromiter(
+                map(get, genes), dtype=np.int64, count=len(genes)
+            )
+        return pa
+
+    def _table_row(self, g: Gene) -> int:
+        t = self.index.get(g.id)
+        if t is None:
+            t = self.index[g.id] = len(self.table)
+            self.table.append(g)
+        return t
+
+    def _day_code(self, name: str) -> int:
+        c = self.codes.get(name)
+        if c is None:
+            c = self.codes[name] = len(self.day_names)
+            self.day_names.append(name)
+        return c
+
+    # ---------- tulis ----------
+    def _write_table(self) -> None:
+        if len(self.table) == self._written:
+            return
+        blob = pickle.dumps(self.table, protocol=pickle.HIGHEST_PROTOCOL)
+        sha = hashlib.sha256(blob).hexdigest()
+        name = f"{os.path.basename(self.path)}.table-{sha[:16]}"
+        _write_atomic(os.path.join(os.path.dirname(self.path), name), [blob])
+        self._written, self._sha, self._table_file = len(self.table), sha, name
+
+    def _drop_stale_tables(self) -> None:
+        """Hapus table yang tidak dipakai header sekarang (dipanggil setelah header ter-commit)."""
+        d = os.path.dirname(self.path)
+        keep = os.path.join(d, self._table_file)
+        stale = glob.glob(f"{glob.escape(self.path)}.table-*") + [f"{self.path}.table"]
+        for f in stale:
+            if f != keep and ".tmp-" not in f and os.path.exists(f):
+                os.remove(f)
+
+    def save(self, rec) -> str:
+        """Tulis checkpoint dari record evolve() (harus di akhir generasi)."""
+        if rec.stage not in END_STAGES:
+            raise ValueError(f"checkpoint hanya di akhir generasi, bukan '{rec.stage}'")
+        args = (
+            rec.population,
+            rec.fitnesses,
+            rec.generation,
+            rec.evaluations,
+            rec.elapsed,
+            rec.reached,
+            rec.operator_stats,
+            # diambil di sini: modul random di-seed ulang di proses anak setelah fork
+            random.getstate(),
+        )
+        # checkpoint pertama sinkron: table gene ditulis di proses ini, jadi
+        # anak berikutnya hanya menulis ulang table kalau ada gene baru
+        if not self.background or self._written < 0:
+            self.wait()
+            return self.write(*args)
+        self._fork(args)
+        return self.path
+
+    def _fork(self, args) -> None:
+        self.wait()
+        r, w = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # anak: tulis lalu keluar tanpa cleanup/atexit milik parent
+            code = 0
+            try:
+                os.close(r)
+                n_table, n_days = len(self.table), len(self.day_names)
+                self.write(*args)
+                report = (
+                    self.table[n_table:],
+                    self.day_names[n_days:],
+                    self._written,
+                    self._sha,
+                    self._table_file,
+                )
+                with os.fdopen(w, "wb") as f:
+                    pickle.dump(report, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                traceback.print_exc()
+                code = 1
+            finally:
+                sys.stderr.flush()
+                os._exit(code)
+        os.close(w)
+        self._child, self._report = pid, r
+
+    def wait(self) -> None:
+        """Tunggu save background yang masih jalan; RuntimeError kalau gagal."""
+        if self._child is None:
+            return
+        # baca dulu sebelum waitpid: laporan besar bisa memenuhi buffer pipe
+        with os.fdopen(self._report, "rb") as f:
+            raw = f.read()
+        _, status = os.waitpid(self._child, 0)
+        self._child = self._report = None
+        code = os.waitstatus_to_exitcode(status)
+        if code != 0:
+            raise RuntimeError(f"checkpoint background ke {self.path} gagal (exitcode {code})")
+        # table anak = table parent + gene baru (urutan sama), index tetap cocok
+        genes, days, self._written, self._sha, self._table_file = pickle.loads(raw)
+        for g in genes:
+            self._table_row(g)
+        for name in days:
+            self._day_code(name)
+
+    def write(
+        self,
+        population,
+        fitnesses,
+        generation: int,
+        evaluations: int = 0,
+        elapsed: float = 0.0,
+        reached: bool = False,
+        operator_stats: Optional[dict] = None,
+        rng_state=None,
+    ) -> str:
+        """population: List[Individuals] atau PopulationArray (table sama dengan ini)."""
+        pa = population if hasattr(population, "placement") else self._encode(population)
+        self._write_table()
+
+        fits = np.ascontiguousarray(fitnesses, dtype=np.float64)
+        flat = np.concatenate(
+            [pa.gene.ravel(), pa.placement.ravel(), pa.day_name.ravel(), pa.lengths]
+        ).astype(np.int64, copy=False)
+        header = {
+            "version": VERSION,
+            "generation": int(generation),
+            "evaluations": int(evaluations),
+            "elapsed": float(elapsed),
+            "reached": bool(reached),
+            "n_pop": int(pa.n_pop),
+            "width": int(pa.width),
+            "day_names": list(pa.day_names),
+            "table_len": len(self.table),
+            "table_sha": self._sha,
+            "table_file": self._table_file,
+            "rng_state": _rng_to_json(rng_state or random.getstate()),
+            "operator_stats": operator_stats,
+            "config": self.config,
+        }
+        raw = json.dumps(header).encode()
+        head_len = len(MAGIC) + 8 + len(raw)
+        pad = b"\0" * (-head_len % ALIGN)
+        _write_atomic(
+            self.path,
+            [
+                MAGIC,
+                struct.pack("<Q", len(raw)),
+                raw,
+                pad,
+                memoryview(flat),
+                memoryview(fits),
+            ],
+        )
+        self._drop_stale_tables()
+        return self.path
+
+
+def load(path: str) -> Checkpoint:
+    """Baca checkpoint; array populasi & fitness di-memory-map, tidak dibaca penuh."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: bukan file checkpoint GA")
+        (n,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(n))
+    if header["version"] != VERSION:
+        raise ValueError(f"{path}: versi checkpoint {header['version']} tidak didukung")
+
+    # checkpoint lama (sebelum table_file) memakai <path>.table
+    table_file = header.get("table_file") or f"{os.path.basename(path)}.table"
+    table_path = os.path.join(os.path.dirname(path), table_file)
+    with open(table_path, "rb") as f:
+        blob = f.read()
+    if hashlib.sha256(blob).hexdigest() != header["table_sha"]:
+        raise ValueError(f"{table_path} tidak cocok dengan checkpoint")
+    table = pickle.loads(blob)
+    if len(table) != header["table_len"]:
+        raise ValueError(f"{table_path} tidak cocok dengan checkpoint")
+
+    n_pop, width = header["n_pop"], header["width"]
+    offset = len(MAGIC) + 8 + n
+    offset += -offset % ALIGN
+    n_cells = PopulationArray.nbytes(n_pop, width) // 8
+    mm = np.memmap(path, dtype=np.int64, mode="r", offset=offset, shape=(n_cells,))
+    fits = np.memmap(
+        path, dtype=np.float64, mode="r", offset=offset + n_cells * 8, shape=(n_pop,)
+    )
+    pa = PopulationArray.allocate(n_pop, width, table, header["day_names"], buffer=mm)
+    return Checkpoint(
+        path=path,
+        generation=header["generation"],
+        evaluations=header["evaluations"],
+        elapsed=header["elapsed"],
+        reached=header["reached"],
+        rng_state=_rng_from_json(header["rng_state"]),
+        config=header["config"],
+        population=pa,
+        fitnesses=fits,
+        operator_stats=header.get("operator_stats"),
+        table_sha=header["table_sha"],
+        table_file=table_file,
+    )
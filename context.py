@@ -0,0 +1,88 @@
+"""
+Context eksplisit untuk data yang mahal dibuat: dataset, katalog mata kuliah,
+ruang_list, Rooms dan pool asisten.
+
+Semuanya dibuat lazy saat pertama diakses (bukan saat import modul), jadi
+worker & tools bisa import operator GA tanpa baca dataset / acak kapasitas
+ruang. Rooms & pool asisten dibangkitkan dengan `random` global, jadi kalau
+dibuat setelah random.seed(...) hasilnya ikut reproducible.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import List, Optional
+
+from data_type import Room
+
+
+@dataclass
+class GAContext:
+    # None → dataset.file_path
+    data_path: Optional[str] = None
+
+    @cached_property
+    def dataset(self):
+        import dataset
+
+        return dataset.get_dataset(self.data_path or dataset.file_path)
+
+    @cached_property
+    def columns(self):
+        """Kolom dataset sebagai array NumPy (tanpa pandas)."""
+        import dataset
+
+        return dataset.load_columns(self.data_path or dataset.file_path)
+
+    @cached_property
+    def subjects(self):
+        from subjects import SubjectTable
+
+        return SubjectTable.from_columns(self.columns)
+
+    @cached_property
+    def ruang_list(self) -> List[int]:
+        import numpy as np
+
+        # unik, urut kemunculan pertama (sama seperti Series.unique()), tanpa NaN
+        col = np.asarray(self.columns["id_ruang_kuliah"], dtype=float)
+        col = col[~np.isnan(col)]
+        _, first = np.unique(col, return_index=True)
+        return [int(i) for i in col[np.sort(first)].tolist()]
+
+    @cached_property
+    def rooms(self) -> List[Room]:
+        from seeder import generate_rooms
+
+        return [generate_rooms(self.ruang_list) for _ in self.ruang_list]
+
+    @cached_property
+    def assistants(self):
+        """AssistantPool: 2–5 asisten tetap per kode_matakuliah."""
+        from assistants import AssistantPool
+
+        return AssistantPool.for_subjects(self.subjects.subject_id.tolist())
+
+    @cached_property
+    def availability(self):
+        """AvailabilityIndex: bitmask sibuk asisten + tabel jumlah asisten bebas per roster."""
+        from availability import AvailabilityIndex
+
+        return AvailabilityIndex()
+
+
+_default: Optional[GAContext] = None
+
+
+def default_context() -> GAContext:
+    """Context bersama untuk kode lama yang masih pakai global (Rooms, ruang_list, dataset_df)."""
+    global _default
+    if _default is None:
+        _default = GAContext()
+    return _default
+
+
+def set_default_context(ctx: Optional[GAContext]) -> Optional[GAContext]:
+    """Ganti context default; return context sebelumnya."""
+    global _default
+    prev, _default = _default, ctx
+    return prev
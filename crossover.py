@@ -1,117 +1,132 @@
 from typing import List, Set, Dict
-from data_type import Room, Gene, AssistantSchedule, Individuals
-from seeder import generate_population, _allowed_in_day
+from data_type import Room, Gene, AssistantSchedule, Individuals, share_genes
+from seeder import generate_population, _allowed_in_day, feasible_starts
 from fitness import fitness, overlap, norm_group, DAY_OPEN, DAY_CLOSE, GRID, _snap
+from occupancy import OccupancyGrid
+from selection import get_selection, roulette_indices
+from repair import get_repair
+import metrics
 import random
-import itertools, random, copy
+from operator import is_
 
 
 def roulette_select(pop, fitnesses):
-    total = sum(fitnesses)
-    if total <= 0:
-        # fallback: uniform
-        idxs = [random.randrange(len(pop)) for _ in range(len(pop))]
-        return [copy.deepcopy(pop[i]) for i in idxs]
-
-    probs = [f / total for f in fitnesses]
-    cum = list(itertools.accumulate(probs))
-    # Pastikan elemen terakhir = 1.0 (hindari celah floating)
-    cum[-1] = 1.0
-
-    picks = []
-    for _ in range(len(pop)):
-        r = random.random()
-        j = next(i for i, c in enumerate(cum) if r <= c)
-        picks.append(j)
-    return [copy.deepcopy(pop[i]) for i in picks]
+    return [pop[i].clone() for i in roulette_indices(fitnesses, len(pop))]
 
 
+@metrics.timed("repair")
 def repair_individual(individu: Individuals):
-    by_day: Dict[int, List[Gene]] = {}
-    for g in individu.chromosome:
-        by_day.setdefault(g.day, []).append(g)
-
-    def slot_free(day: int, room_id: int, s: int, e: int, skip_gene=None) -> bool:
-        if not _allowed_in_day(day, s, e):
-            return False
-        for x in by_day.get(day, []):
-            if x is skip_gene:
-                continue
-            if x.room_id == room_id and overlap(x.start_time, x.end_time, s, e):
-                return False
-        return True
+    # bekerja dengan index gene; gene hanya di-copy (copy-on-write) saat benar-benar diubah
+    m = metrics.active  # counter hanya disentuh kalau instrumentasi aktif
+    chrom = individu.chromosome
+    grid = OccupancyGrid(chrom)
+    by_day: Dict[int, List[int]] = {}
+    for j, g in enumerate(chrom):
+        by_day.setdefault(g.day, []).append(j)
+
+    def slot_free(day: int, room_id: int, s: int, e: int) -> bool:
+        # gene yang sedang dipindah harus sudah di-release dari grid
+        return grid.is_free(day, room_id, s, e) and _allowed_in_day(day, s, e)
 
     def capacity_ok(room: Room, cap: int) -> bool:
         return cap <= room.room_capacity
 
+    def try_shift(k: int, muls):
+        """Geser gene k ±mul*GRID ke posisi pertama yang bebas (kalau ada)."""
+        g = chrom[k]
+        grid.remove_gene(g)
+        moved = False
+        for mul in muls:
+            s2 = g.start_time + mul * GRID
+            e2 = g.end_time + mul * GRID
+            if slot_free(g.day, g.room_id, s2, e2):
+                g = individu.mutable_gene(k)
+                g.start_time, g.end_time = s2, e2
+                moved = True
+                break
+        grid.add_gene(g)
+        if m is not None:
+            m.incr("repair_shift_attempts")
+            if moved:
+                m.incr("repair_shift_moves")
+
     for day, items in by_day.items():
-        items.sort(key=lambda x: (x.room_id, x.start_time, x.end_time))
+        items.sort(key=lambda k: (chrom[k].room_id, chrom[k].start_time, chrom[k].end_time))
 
         # clamp awal (kalau di luar bound / nabrak lunch)
-        for gi in items:
+        for k in items:
+            gi = chrom[k]
             dur = gi.end_time - gi.start_time
             if not _allowed_in_day(gi.day, gi.start_time, gi.end_time):
-                # coba snap ke awal hari
-                gi.start_time = _snap(DAY_OPEN)
+                grid.remove_gene(gi)
+                gi = individu.mutable_gene(k)
+                # start sah paling awal di hari itu (tabel start sudah hindari lunch);
+                # kalau durasi tidak muat sama sekali, snap ke awal hari
+                starts = feasible_starts(gi.day, dur)
+                gi.start_time = starts[0] if starts else _snap(DAY_OPEN)
                 gi.end_time = gi.start_time + dur
-                # kalau masih nabrak (mis. Jumat & dur besar), geser maju grid sampai valid
-                for _ in range(40):
-                    if _allowed_in_day(gi.day, gi.start_time, gi.end_time):
-                        break
-                    gi.start_time += GRID
-                    gi.end_time += GRID
-
-        # perbaiki bentrok per-ruang
-        for i in range(len(items)):
-            gi = items[i]
-            for j in range(i + 1, len(items)):
-                gj = items[j]
-                if gi.room_id != gj.room_id:
-                    continue
-                if not overlap(gi.start_time, gi.end_time, gj.start_time, gj.end_time):
-                    continue
+                grid.add_gene(gi)
+                if m is not None:
+                    m.incr("repair_clamps")
+
+        # perbaiki bentrok per-ruang: cukup cek slot gene di occupancy grid
+        for k in items:
+            g = chrom[k]
+            if not grid.is_clashing(g):
+                continue
 
-                # coba pindah ruang (kapasitas & slot_free termasuk cek lunch)
-                moved = False
-                for r in getattr(gj, "preferred_lab", []) or []:
-                    if r.id == gj.room_id or not capacity_ok(r, gj.capacity):
-                        continue
-                    if slot_free(day, r.id, gj.start_time, gj.end_time, skip_gene=gj):
-                        gj.room_id = r.id
-                        moved = True
-                        break
-                if moved:
+            # coba pindah ruang (kapasitas & slot_free termasuk cek lunch)
+            grid.remove_gene(g)
+            for r in getattr(g, "preferred_lab", []) or []:
+                if r.id == g.room_id or not capacity_ok(r, g.capacity):
                     continue
+                if slot_free(day, r.id, g.start_time, g.end_time):
+                    g = individu.mutable_gene(k)
+                    g.room_id = r.id
+                    break
+            grid.add_gene(g)
+            if m is not None:
+                m.incr("repair_room_attempts")
+            if not grid.is_clashing(g):
+                if m is not None:
+                    m.incr("repair_room_moves")
+                continue
 
-                # geser di grid ±n step tapi hindari jendela terlarang
-                for mul in (1, -1, 2, -2, 3, -3, 4, -4):
-                    s2 = gj.start_time + mul * GRID
-                    e2 = gj.end_time + mul * GRID
-                    if slot_free(day, gj.room_id, s2, e2, skip_gene=gj):
-                        gj.start_time, gj.end_time = s2, e2
-                        break
+            # geser di grid ±n step tapi hindari jendela terlarang
+            try_shift(k, (1, -1, 2, -2, 3, -3, 4, -4))
 
         # perbaiki bentrok per-group (pakai slot_free yang sudah aware lunch)
-        groups: Dict[str, List[Gene]] = {}
-        for g in items:
-            ng = norm_group(getattr(g, "group", ""))
+        groups: Dict[str, List[int]] = {}
+        for k in items:
+            ng = norm_group(getattr(chrom[k], "group", ""))
             if ng:
-                groups.setdefault(ng, []).append(g)
+                groups.setdefault(ng, []).append(k)
 
         for glist in groups.values():
-            glist.sort(key=lambda x: x.start_time)
-            for a, b in zip(glist, glist[1:]):
+            glist.sort(key=lambda k: chrom[k].start_time)
+            for ka, kb in zip(glist, glist[1:]):
+                a, b = chrom[ka], chrom[kb]
                 if overlap(a.start_time, a.end_time, b.start_time, b.end_time):
-                    for mul in (1, -1, 2, -2, 3, -3):
-                        s2 = b.start_time + mul * GRID
-                        e2 = b.end_time + mul * GRID
-                        if slot_free(b.day, b.room_id, s2, e2, skip_gene=b):
-                            b.start_time, b.end_time = s2, e2
-                            break
-
-
-def crossover(fitnesses: List[float], pop: List[Individuals], rate=0.5):
-    offsprings = roulette_select(pop, fitnesses)
+                    try_shift(kb, (1, -1, 2, -2, 3, -3))
+
+
+@metrics.timed("crossover")
+def crossover(
+    fitnesses: List[float],
+    pop: List[Individuals],
+    rate=0.5,
+    selection="roulette",
+    repair="legacy",
+):
+    """
+    selection: 'roulette' | 'sus' | 'tournament' atau callable(fitnesses, k) → indices.
+    repair: 'legacy' | 'conflict' (repair.py) atau callable(individu).
+    """
+    fix = get_repair(repair)
+    with metrics.phase("selection"):
+        picks = get_selection(selection)(fitnesses, len(pop))
+    with metrics.phase("clone"):
+        offsprings = [pop[i].clone() for i in picks]
 
     if not offsprings:
         return []
@@ -121,7 +136,7 @@ def crossover(fitnesses: List[float], pop: List[Individuals], rate=0.5):
     if len(cand) < 2 or L < 2:
         # still repair/dedup every offspring to reduce drift
         for k in range(len(offsprings)):
-            repair_individual(offsprings[k])
+            fix(offsprings[k])
         return offsprings
 
     for i in range(0, len(cand) - 1, 2):
@@ -129,12 +144,15 @@ def crossover(fitnesses: List[float], pop: List[Individuals], rate=0.5):
         point = random.randint(1, L - 1)
         ca = offsprings[a].chromosome
         cb = offsprings[b].chromosome
-        offsprings[a].chromosome = ca[:point] + cb[point:]
-        offsprings[b].chromosome = cb[:point] + ca[point:]
-        repair_individual(offsprings[a])
-        repair_individual(offsprings[b])
+        # ekor kedua induk objek gene yang sama (mis. clone induk yang sama) →
+        # anak identik dengan induknya, jadi kromosom & cache fitness tetap
+        if len(ca) != len(cb) or not all(map(is_, ca[point:], cb[point:])):
+            offsprings[a].chromosome = share_genes(ca[:point] + cb[point:])
+            offsprings[b].chromosome = share_genes(cb[:point] + ca[point:])
+        fix(offsprings[a])
+        fix(offsprings[b])
 
     # Light pass over all
     for k in range(len(offsprings)):
-        repair_individual(offsprings[k])
+        fix(offsprings[k])
     return offsprings
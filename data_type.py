@@ -1,15 +1,14 @@
 from __future__ import annotations
 
-import pandas as pd
 import random
+import copy
 
-
-from dataset import dataset_df
-from assistant_schedule import generate_jadwal
+# numpy / pandas / dataset di-import lazy (di dalam fungsi) supaya
+# `import data_type` tetap ringan untuk worker & tools
 import uuid
 
-from dataclasses import dataclass, asdict, field
-from typing import List, Dict, Tuple
+from dataclasses import dataclass, asdict, field, replace
+from typing import List, Dict, Optional, Tuple
 
 from pathlib import Path
 import re
@@ -84,6 +83,21 @@ class Gene:
     room_id: int
     group: str
     id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    # copy-on-write: True kalau objek ini dipakai bersama >1 kromosom,
+    # jadi harus di-copy dulu sebelum field penempatannya diubah
+    shared: bool = field(default=False, repr=False, compare=False)
+
+
+def new_id(rng=random) -> str:
+    """uuid4 (hex) dari 'rng' (deterministik kalau rng di-seed), pengganti uuid.uuid4()."""
+    return uuid.UUID(int=rng.getrandbits(128), version=4).hex
+
+
+def share_genes(genes: List[Gene]) -> List[Gene]:
+    """Tandai gene sebagai milik bersama (tanpa copy) lalu kembalikan list yang sama."""
+    for g in genes:
+        g.shared = True
+    return genes
 
 
 @dataclass
@@ -106,6 +120,8 @@ class AssistantSchedule:
 
 def _sec_to_hms_str(sec: int) -> str:
     """Konversi detik ke 'HH:MM:SS' (untuk csv/parquet)."""
+    import pandas as pd
+
     if pd.isna(sec):
         return ""
     sec = int(sec)
@@ -118,8 +134,51 @@ def _sec_to_hms_str(sec: int) -> str:
 @dataclass
 class Individuals:
     chromosome: List[Gene]
+    # cache hasil fitness.fitness() / fitness.evaluate(); None = dirty (perlu
+    # dievaluasi). Di-reset oleh mutable_gene(), assignment 'chromosome' dan
+    # invalidate() — operator yang menulis chromosome[j] langsung wajib invalidate().
+    fitness_cache: Optional[float] = field(default=None, repr=False, compare=False)
+    breakdown_cache: Optional[object] = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        if name == "chromosome":
+            object.__setattr__(self, "fitness_cache", None)
+            object.__setattr__(self, "breakdown_cache", None)
+        object.__setattr__(self, name, value)
+
+    def invalidate(self):
+        """Tandai dirty: fitness dihitung ulang pada evaluasi berikutnya."""
+        self.fitness_cache = None
+        self.breakdown_cache = None
+
+    def clone(self) -> "Individuals":
+        """
+        Salinan copy-on-write: list kromosom baru, objek Gene dipakai bersama.
+        Data statis (asisten, preferred_lab) tidak pernah di-copy; field
+        penempatan baru di-copy saat ditulis lewat mutable_gene(). Cache
+        fitness ikut (kromosomnya sama).
+        """
+        return Individuals(
+            share_genes(list(self.chromosome)), self.fitness_cache, self.breakdown_cache
+        )
+
+    def mutable_gene(self, j: int) -> Gene:
+        """
+        Gene ke-j yang aman diubah in-place (shallow copy kalau masih dipakai
+        bersama). Individu ditandai dirty karena gene-nya akan ditulis.
+        """
+        self.fitness_cache = None
+        self.breakdown_cache = None
+        g = self.chromosome[j]
+        if g.shared:
+            g = copy.copy(g)
+            g.shared = False
+            self.chromosome[j] = g
+        return g
 
     def to_dataframe(self) -> pd.DataFrame:
+        import pandas as pd
+
         data = []
         for gene in self.chromosome:
             assistants_info = [
@@ -168,6 +227,8 @@ class Individuals:
         - .csv/.parquet: diisi hasil konversi 'HH:MM:SS'
         Kolom disejajarkan: subject_id, group, day_name, start_converted, end_converted, room_id.
         """
+        import pandas as pd
+
         df = self.to_dataframe().copy()
 
         out_dir = Path(path)
@@ -332,9 +393,171 @@ class Individuals:
         return str(out_path)
 
 
-ruang_list = [
-    int(i) for i in dataset_df["id_ruang_kuliah"].unique().tolist() if pd.notna(i)
-]
+# kolom placement di PopulationArray
+DAY, START, END, ROOM = 0, 1, 2, 3
+
+
+@dataclass
+class PopulationArray:
+    """
+    Populasi dalam bentuk structure-of-arrays.
+
+    - table: template Gene statis (mata kuliah, asisten, preferred_lab, group, id),
+      disimpan sekali dan dipakai bersama oleh semua individu
+    - gene: (n_pop, width) index ke table, -1 = padding
+    - placement: (n_pop, width, 4) kolom DAY, START, END, ROOM
+    - day_name: (n_pop, width) index ke day_names
+    - lengths: (n_pop,) panjang kromosom tiap individu
+    Gene.id dianggap kunci data statis (deepcopy / replace tetap mempertahankannya).
+    """
+
+    table: List[Gene]
+    gene: np.ndarray
+    placement: np.ndarray
+    day_name: np.ndarray
+    lengths: np.ndarray
+    day_names: List[str] = field(default_factory=list)
+    # data turunan dari table (index id → baris, kode group/asisten, dst.)
+    cache: Dict = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def n_pop(self) -> int:
+        return self.gene.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.gene.shape[1]
+
+    @staticmethod
+    def nbytes(n_pop: int, width: int) -> int:
+        """Ukuran buffer int64 yang dibutuhkan allocate()."""
+        import numpy as np
+
+        return (6 * n_pop * width + n_pop) * np.dtype(np.int64).itemsize
+
+    @classmethod
+    def allocate(
+        cls,
+        n_pop: int,
+        width: int,
+        table: List[Gene],
+        day_names: List[str] = None,
+        buffer=None,
+    ) -> "PopulationArray":
+        """Buat array kosong; kalau 'buffer' diisi (mis. shared memory), semua kolom menumpang di situ."""
+        import numpy as np
+
+        n_cells = cls.nbytes(n_pop, width) // np.dtype(np.int64).itemsize
+        if buffer is None:
+            flat = np.zeros(n_cells, dtype=np.int64)
+        else:
+            flat = np.ndarray((n_cells,), dtype=np.int64, buffer=buffer)
+        block = n_pop * width
+        return cls(
+            table=table,
+            gene=flat[:block].reshape(n_pop, width),
+            placement=flat[block : 5 * block].reshape(n_pop, width, 4),
+            day_name=flat[5 * block : 6 * block].reshape(n_pop, width),
+            lengths=flat[6 * block :],
+            day_names=list(day_names or []),
+        )
+
+    @classmethod
+    def from_individuals(
+        cls, pop: List[Individuals], table: List[Gene] = None, buffer=None
+    ) -> "PopulationArray":
+        table = list(table or [])
+        width = max((len(ind.chromosome) for ind in pop), default=0)
+        pa = cls.allocate(len(pop), width, table, buffer=buffer)
+        pa.gene[:] = -1
+        for k, ind in enumerate(pop):
+            pa.set_individual(k, ind)
+        return pa
+
+    def _table_index(self) -> Dict[str, int]:
+        idx = self.cache.get("index")
+        if idx is None or len(idx) != len(self.table):
+            idx = self.cache["index"] = {g.id: i for i, g in enumerate(self.table)}
+        return idx
+
+    def _day_name_code(self, name: str) -> int:
+        try:
+            return self.day_names.index(name)
+        except ValueError:
+            self.day_names.append(name)
+            return len(self.day_names) - 1
+
+    def set_individual(self, k: int, ind: Individuals):
+        """Tulis individu ke baris k (gene baru otomatis masuk table)."""
+        index = self._table_index()
+        n = len(ind.chromosome)
+        if n > self.width:
+            raise ValueError(f"Kromosom {n} gen melebihi width {self.width}")
+        self.lengths[k] = n
+        self.gene[k, n:] = -1
+        for j, g in enumerate(ind.chromosome):
+            t = index.get(g.id)
+            if t is None:
+                t = index[g.id] = len(self.table)
+                self.table.append(g)
+            self.gene[k, j] = t
+            self.placement[k, j] = (g.day, g.start_time, g.end_time, g.room_id)
+            self.day_name[k, j] = self._day_name_code(g.day_name)
+
+    def individual(self, k: int) -> Individuals:
+        """Bangun kembali Individuals dari baris k (lossless)."""
+        chrom = []
+        for j in range(int(self.lengths[k])):
+            day, s, e, room = self.placement[k, j].tolist()
+            chrom.append(
+                replace(
+                    self.table[self.gene[k, j]],
+                    shared=False,
+                    day_name=self.day_names[self.day_name[k, j]],
+                    day=day,
+                    start_time=s,
+                    end_time=e,
+                    room_id=room,
+                )
+            )
+        return Individuals(chrom)
+
+    def to_individuals(self) -> List[Individuals]:
+        return [self.individual(k) for k in range(self.n_pop)]
+
+    def to_dataframe(self, k: int) -> pd.DataFrame:
+        return self.individual(k).to_dataframe()
+
+    def save_dataframe(self, k: int, *args, **kwargs) -> str:
+        return self.individual(k).save_dataframe(*args, **kwargs)
+
+    # ---------- operasi baris (dipakai operator berbasis array) ----------
+    def take(self, rows) -> None:
+        """Ganti seluruh populasi dengan baris 'rows' (seleksi), in-place."""
+        import numpy as np
+
+        rows = np.asarray(rows)
+        self.gene[:] = self.gene[rows]
+        self.placement[:] = self.placement[rows]
+        self.day_name[:] = self.day_name[rows]
+        self.lengths[:] = self.lengths[rows]
+
+    def swap_tails(self, a: int, b: int, point: int) -> None:
+        """One-point crossover antar baris a & b mulai indeks 'point'."""
+        for col in (self.gene, self.placement, self.day_name):
+            tail = col[a, point:].copy()
+            col[a, point:] = col[b, point:]
+            col[b, point:] = tail
+        self.lengths[[a, b]] = self.lengths[[b, a]]
+
+
+def __getattr__(name):
+    # ruang_list dibangun lazy dari context default (baca dataset saat pertama dipakai)
+    if name == "ruang_list":
+        from context import default_context
+
+        return default_context().ruang_list
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 type Population = List[Individuals]
@@ -1,10 +1,161 @@
+"""
+Loader dataset kelas praktikum.
+
+xlsx cuma di-parse sekali; hasilnya disimpan sebagai cache biner di folder
+sebelahnya (".<nama file>.cache/"): satu file .npy per kolom + meta.json.
+Cache di-key dengan (size, mtime) dan sha256 file sumber:
+- size & mtime sama       → langsung pakai cache (tanpa baca xlsx)
+- mtime beda, hash sama   → cache tetap valid, meta di-update
+- hash beda               → parse ulang & tulis ulang cache
+
+Load berikutnya memory-map file .npy (np.load(mmap_mode="r")), jadi
+dataset_df tersedia dalam hitungan milidetik.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
 import pandas as pd
 
+import metrics
+
 # ganti path ke lokasi file kamu
 file_path = "kelas praktikum baru.xlsx"
 
-# baca semua sheet
-excel = pd.ExcelFile(file_path)
+CACHE_VERSION = 1
+
+
+def cache_dir(path=file_path) -> Path:
+    path = Path(path)
+    return path.with_name(f".{path.name}.cache")
+
+
+def _file_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_meta(cdir: Path) -> Optional[dict]:
+    try:
+        with open(cdir / "meta.json", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == CACHE_VERSION else None
+
+
+def _write_meta(cdir: Path, meta: dict):
+    tmp = cdir / "meta.json.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1)
+    os.replace(tmp, cdir / "meta.json")
+
+
+def _parse_xlsx(path: Path) -> pd.DataFrame:
+    # baca semua sheet, pilih sheet pertama
+    excel = pd.ExcelFile(path)
+    return pd.read_excel(excel, sheet_name=excel.sheet_names[0])
+
+
+def _write_cache(df: pd.DataFrame, cdir: Path, meta: dict):
+    cdir.mkdir(exist_ok=True)
+    columns = []
+    for i, name in enumerate(df.columns):
+        col = df[name]
+        entry = {"name": str(name), "file": f"c{i}.npy"}
+        if pd.api.types.is_numeric_dtype(col.dtype):
+            np.save(cdir / entry["file"], col.to_numpy())
+            entry["kind"] = "num"
+        else:
+            # teks → unicode fixed-width (bisa di-mmap), NaN disimpan di mask
+            na = col.isna().to_numpy()
+            np.save(cdir / entry["file"], np.where(na, "", col.astype(object)).astype(str))
+            if na.any():
+                entry["na"] = f"c{i}.na.npy"
+                np.save(cdir / entry["na"], na)
+            entry["kind"] = "str"
+        columns.append(entry)
+    meta["columns"] = columns
+    _write_meta(cdir, meta)
+
+
+def load_columns(path=file_path) -> Dict[str, np.ndarray]:
+    """
+    Kolom dataset sebagai array NumPy (read-only, memory-mapped dari cache).
+    Kolom teks berupa array unicode; nilai kosong asli tercatat di '<kolom>.na'.
+    """
+    path = Path(path)
+    cdir = cache_dir(path)
+    st = path.stat()
+    meta = _read_meta(cdir)
+
+    if meta is None or (meta["size"], meta["mtime_ns"]) != (st.st_size, st.st_mtime_ns):
+        digest = _file_hash(path)
+        if meta is not None and meta["sha256"] == digest:
+            metrics.incr("dataset_cache_hits")
+            meta.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+            _write_meta(cdir, meta)
+        else:
+            metrics.incr("dataset_cache_misses")
+            meta = {
+                "version": CACHE_VERSION,
+                "source": path.name,
+                "sha256": digest,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+            _write_cache(_parse_xlsx(path), cdir, meta)
+
+    else:
+        metrics.incr("dataset_cache_hits")
+
+    cols: Dict[str, np.ndarray] = {}
+    for entry in meta["columns"]:
+        cols[entry["name"]] = np.load(cdir / entry["file"], mmap_mode="r")
+        if "na" in entry:
+            cols[entry["name"] + ".na"] = np.load(cdir / entry["na"], mmap_mode="r")
+    return cols
+
+
+def load_dataset(path=file_path) -> pd.DataFrame:
+    """DataFrame dataset (sama dengan hasil read_excel sheet pertama)."""
+    cols = load_columns(path)
+    data = {}
+    for name, arr in cols.items():
+        if name.endswith(".na"):
+            continue
+        if arr.dtype.kind == "U":
+            values = arr.astype(object)
+            na = cols.get(name + ".na")
+            if na is not None:
+                values[na] = np.nan
+            data[name] = values
+        else:
+            data[name] = np.asarray(arr)
+    return pd.DataFrame(data)
+
+
+_loaded: Dict[str, pd.DataFrame] = {}
+
+
+def get_dataset(path=file_path) -> pd.DataFrame:
+    """load_dataset() sekali per path, hasilnya dipakai bersama."""
+    key = str(Path(path).resolve())
+    df = _loaded.get(key)
+    if df is None:
+        df = _loaded[key] = load_dataset(path)
+    return df
+
 
-# misal pilih sheet pertama
-dataset_df = pd.read_excel(excel, sheet_name=excel.sheet_names[0])
+def __getattr__(name):
+    # dataset_df dimuat saat pertama diakses, bukan saat import
+    if name == "dataset_df":
+        return get_dataset()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,241 @@
+"""
+Fitness inkremental (delta) untuk satu individu.
+
+ConflictState menyimpan bucket by_day_room / by_day_group / by_day_asst
+(isinya index gene) dan jumlah pasangan bentrok per jenis. Perubahan penalty
+karena memindah / mengganti satu gene dihitung hanya terhadap isi bucket
+lama & baru gene tsb, jadi O(ukuran bucket), bukan rescoring penuh.
+
+Angka penalty & fitness sama dengan fitness() di fitness.py, termasuk input
+aneh: pasangan dinilai dengan aturan sweep _count_pairs (lihat pair_counted,
+bukan overlap(), beda untuk gene berdurasi 0) dan bucket berupa list, jadi
+asisten yang tercantum dua kali di satu gene dihitung dua kali seperti di sana.
+Semua perubahan gene harus lewat apply_*() supaya bucket tetap sinkron.
+"""
+
+from collections import Counter
+from dataclasses import replace
+from typing import Dict, List, Set, Tuple
+
+from data_type import Gene, Individuals
+from fitness import ALPHA, BETA, GAMMA, norm_group
+
+ROOM, GROUP, ASST = 0, 1, 2
+WEIGHTS = (ALPHA, BETA, GAMMA)
+
+Key = Tuple[int, tuple]
+
+
+def _bucket_keys(g: Gene) -> List[Key]:
+    """Semua bucket yang ditempati gene: (jenis, kunci bucket)."""
+    keys: List[Key] = [(ROOM, (g.day, g.room_id))]
+    gnorm = norm_group(getattr(g, "group", ""))
+    if gnorm:
+        keys.append((GROUP, (g.day, gnorm)))
+    for a in getattr(g, "assistant", []) or []:
+        asst_id = getattr(a, "id", None)
+        if asst_id:
+            keys.append((ASST, (g.day, asst_id)))
+    return keys
+
+
+def pair_counted(j: int, s: int, e: int, k: int, xs: int, xe: int) -> bool:
+    """
+    Apakah _count_pairs menghitung pasangan gene j [s, e) & gene k [xs, xe).
+    Sweep urut (start, index gene): yang lebih dulu bentrok dengan yang
+    berikutnya kalau belum selesai saat yang berikutnya mulai. Untuk durasi
+    > 0 sama dengan overlap().
+    """
+    if xs < s or (xs == s and k < j):
+        return xe > s
+    return e > xs
+
+
+class ConflictState:
+    def __init__(self, individu: Individuals):
+        self.individu = individu
+        self.buckets: Dict[Key, List[int]] = {}  # index bisa muncul >1x (asisten dobel)
+        self.keys: Dict[int, List[Key]] = {}  # bucket tiap gene (cache _bucket_keys)
+        self.counts = [0, 0, 0]  # pasangan bentrok ROOM, GROUP, ASST
+        for j, g in enumerate(individu.chromosome):
+            self._insert(j, g)
+
+    @classmethod
+    def from_sweep(
+        cls,
+        individu: Individuals,
+        keys: List[List[Key]],
+        buckets: Dict[Key, List[int]],
+        counts: List[int],
+    ) -> "ConflictState":
+        """
+        State dari sweep yang sudah dilakukan caller (lihat repair.conflict_pairs):
+        keys per gene, bucket (dipakai langsung, jangan diubah caller) dan
+        jumlah pasangan per jenis, tanpa menghitung ulang pasangan.
+        """
+        state = cls.__new__(cls)
+        state.individu = individu
+        state.buckets = buckets
+        state.keys = dict(enumerate(keys))
+        state.counts = list(counts)
+        return state
+
+    # ---------- skor ----------
+    @property
+    def penalty(self) -> float:
+        return (
+            ALPHA * self.counts[ROOM]
+            + BETA * self.counts[GROUP]
+            + GAMMA * self.counts[ASST]
+        )
+
+    @property
+    def fitness(self) -> float:
+        return 1.0 / (1.0 + self.penalty)
+
+    def placement_penalty(
+        self,
+        j: int,
+        day: int = None,
+        start_time: int = None,
+        end_time: int = None,
+        room_id: int = None,
+    ) -> float:
+        """
+        Penalty pasangan antara gene j dan gene lain kalau j ditempatkan di
+        (day, start_time, end_time, room_id); field None = posisi sekarang.
+        Selisih dua nilai ini = delta memindah satu gene, tanpa membuat Gene baru.
+        """
+        g = self.individu.chromosome[j]
+        day = g.day if day is None else day
+        s = g.start_time if start_time is None else start_time
+        e = g.end_time if end_time is None else end_time
+        room = g.room_id if room_id is None else room_id
+        skip = {j}
+        total = 0.0
+        for kind, key in self.keys[j]:
+            key = (day, room) if kind == ROOM else (day, key[1])
+            total += WEIGHTS[kind] * self._clashes((kind, key), j, s, e, skip)
+        return total
+
+    # ---------- bucket ----------
+    def _clashes(self, key: Key, j: int, s: int, e: int, skip: Set[int]) -> int:
+        """Jumlah pasangan gene j [s, e) dengan isi bucket 'key' (pair_counted, inline)."""
+        chrom = self.individu.chromosome
+        n = 0
+        for k in self.buckets.get(key, ()):
+            if k in skip:
+                continue
+            x = chrom[k]
+            xs = x.start_time
+            if xs < s or (xs == s and k < j):
+                if x.end_time > s:
+                    n += 1
+            elif e > xs:
+                n += 1
+        return n
+
+    def _insert(self, j: int, g: Gene):
+        keys = self.keys[j] = _bucket_keys(g)
+        for key in keys:
+            self.counts[key[0]] += self._clashes(key, j, g.start_time, g.end_time, ())
+            self.buckets.setdefault(key, []).append(j)
+
+    def _remove(self, j: int):
+        g = self.individu.chromosome[j]
+        for key in self.keys.pop(j):
+            members = self.buckets[key]
+            members.remove(j)
+            self.counts[key[0]] -= self._clashes(key, j, g.start_time, g.end_time, ())
+            if not members:
+                del self.buckets[key]
+
+    # ---------- delta ----------
+    def _delta(self, changes: Dict[int, Gene]) -> List[int]:
+        """Perubahan jumlah pasangan per jenis kalau gene di 'changes' diganti."""
+        chrom = self.individu.chromosome
+        moved = set(changes)
+        diff = [0, 0, 0]
+        # lepas pasangan lama terhadap gene yang tidak ikut berubah
+        for j in moved:
+            g = chrom[j]
+            for key in self.keys[j]:
+                diff[key[0]] -= self._clashes(key, j, g.start_time, g.end_time, moved)
+        # pasang pasangan baru terhadap gene yang tidak ikut berubah
+        new_keys = {j: _bucket_keys(ng) for j, ng in changes.items()}
+        for j, ng in changes.items():
+            for key in new_keys[j]:
+                diff[key[0]] += self._clashes(key, j, ng.start_time, ng.end_time, moved)
+        # pasangan di antara sesama gene yang berubah (lama vs baru), termasuk
+        # pasangan gene dengan dirinya sendiri kalau satu bucket tercantum dobel
+        for sign, genes, keys in (
+            (-1, {j: chrom[j] for j in changes}, self.keys),
+            (1, changes, new_keys),
+        ):
+            items = [(j, g, Counter(keys[j])) for j, g in genes.items()]
+            for a, (ja, ga, ca) in enumerate(items):
+                if ga.end_time > ga.start_time:
+                    for key, c in ca.items():
+                        diff[key[0]] += sign * (c * (c - 1) // 2)
+                for jb, gb, cb in items[a + 1 :]:
+                    if pair_counted(
+                        ja, ga.start_time, ga.end_time, jb, gb.start_time, gb.end_time
+                    ):
+                        for key, c in ca.items():
+                            if key in cb:
+                                diff[key[0]] += sign * c * cb[key]
+        return diff
+
+    def replace_delta(self, changes: Dict[int, Gene]) -> float:
+        """Selisih penalty (baru - lama) jika chromosome[j] diganti changes[j]."""
+        d = self._delta(changes)
+        return ALPHA * d[ROOM] + BETA * d[GROUP] + GAMMA * d[ASST]
+
+    def move_delta(self, j: int, **fields) -> float:
+        """Selisih penalty kalau field penempatan gene j (day, start_time, end_time, room_id, ...) diubah."""
+        return self.replace_delta({j: replace(self.individu.chromosome[j], **fields)})
+
+    def swap_delta(self, i: int, j: int) -> float:
+        """Selisih penalty kalau slot (day, start, end, room) gene i dan j ditukar."""
+        return self.replace_delta(self._swapped(i, j))
+
+    # ---------- apply ----------
+    def apply_replace(self, changes: Dict[int, Gene]) -> float:
+        before = self.penalty
+        chrom = self.individu.chromosome
+        self.individu.invalidate()
+        for j in changes:
+            self._remove(j)
+        for j, ng in changes.items():
+            chrom[j] = ng
+        for j, ng in changes.items():
+            self._insert(j, ng)
+        return self.penalty - before
+
+    def apply_move(self, j: int, **fields) -> float:
+        return self.apply_replace({j: replace(self.individu.chromosome[j], **fields)})
+
+    def apply_swap(self, i: int, j: int) -> float:
+        return self.apply_replace(self._swapped(i, j))
+
+    def _swapped(self, i: int, j: int) -> Dict[int, Gene]:
+        chrom = self.individu.chromosome
+        g1, g2 = chrom[i], chrom[j]
+        return {
+            i: replace(
+                g1,
+                day=g2.day,
+                day_name=g2.day_name,
+                start_time=g2.start_time,
+                end_time=g2.end_time,
+                room_id=g2.room_id,
+            ),
+            j: replace(
+                g2,
+                day=g1.day,
+                day_name=g1.day_name,
+                start_time=g1.start_time,
+                end_time=g1.end_time,
+                room_id=g1.room_id,
+            ),
+        }
@@ -1,6 +1,9 @@
-from typing import List, Tuple, Dict
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import List, Set, Tuple, Dict
 import heapq, re
 from data_type import Gene
+import metrics
 
 
 def overlap(s1: int, e1: int, s2: int, e2: int) -> bool:
@@ -11,6 +14,9 @@ GRID = 30 * 60  # 30-minute grid
 DAY_OPEN = 7 * 3600  # 07:00
 DAY_CLOSE = 17 * 3600  # 17:00
 
+# bobot penalti: bentrok ruang, bentrok group, bentrok asisten
+ALPHA, BETA, GAMMA = 3.0, 1.0, 2.0
+
 
 def _snap(x: int) -> int:
     return (x // GRID) * GRID
@@ -50,42 +56,197 @@ def _count_pairs(ints: List[Tuple[int, int]]) -> int:
     return overlaps
 
 
-def fitness(pop: List["Individuals"]) -> List[float]:
-    fitnesses: List[float] = []
-    for individu in pop:
-        gene = individu.chromosome
-
-        by_day_room: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
-        by_day_group: Dict[Tuple[int, str], List[Tuple[int, int]]] = {}
-        by_day_asst: Dict[Tuple[int, str], List[Tuple[int, int]]] = {}
+def conflicts(individu: "Individuals") -> Tuple[int, int, int]:
+    """Jumlah pasangan bentrok (ruang, group, asisten) satu individu."""
+    by_day_room: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+    by_day_group: Dict[Tuple[int, str], List[Tuple[int, int]]] = {}
+    by_day_asst: Dict[Tuple[int, str], List[Tuple[int, int]]] = {}
 
-        for g in gene:
-            by_day_room.setdefault((g.day, g.room_id), []).append(
+    for g in individu.chromosome:
+        by_day_room.setdefault((g.day, g.room_id), []).append(
+            (g.start_time, g.end_time)
+        )
+        gnorm = norm_group(getattr(g, "group", ""))
+        if gnorm:
+            by_day_group.setdefault((g.day, gnorm), []).append(
                 (g.start_time, g.end_time)
             )
-            gnorm = norm_group(getattr(g, "group", ""))
-            if gnorm:
-                by_day_group.setdefault((g.day, gnorm), []).append(
+        # optional: asisten
+        for a in getattr(g, "assistant", []) or []:
+            asst_id = getattr(a, "id", None)
+            if asst_id:
+                by_day_asst.setdefault((g.day, asst_id), []).append(
                     (g.start_time, g.end_time)
                 )
-            # optional: asisten
-            for a in getattr(g, "assistant", []) or []:
-                asst_id = getattr(a, "id", None)
-                if asst_id:
-                    by_day_asst.setdefault((g.day, asst_id), []).append(
-                        (g.start_time, g.end_time)
-                    )
-
-        room_pair_conflicts = sum(_count_pairs(v) for v in by_day_room.values())
-        group_pair_conflicts = sum(_count_pairs(v) for v in by_day_group.values())
-        asst_pair_conflicts = sum(_count_pairs(v) for v in by_day_asst.values())
-
-        alpha, beta, gamma = 3.0, 1.0, 2.0
-        penalty = (
-            alpha * room_pair_conflicts
-            + beta * group_pair_conflicts
-            + gamma * asst_pair_conflicts
-        )
-        fit = 1.0 / (1.0 + penalty)
-        fitnesses.append(fit)
-    return fitnesses
+
+    return (
+        sum(_count_pairs(v) for v in by_day_room.values()),
+        sum(_count_pairs(v) for v in by_day_group.values()),
+        sum(_count_pairs(v) for v in by_day_asst.values()),
+    )
+
+
+@dataclass(slots=True)
+class Breakdown:
+    """
+    Rincian skor satu individu: jumlah pasangan bentrok per jenis dan index
+    gene (urut) yang terlibat, untuk operator yang mau membidik gene bermasalah.
+    """
+
+    fitness: float
+    penalty: float
+    room: int
+    group: int
+    asst: int
+    room_genes: Tuple[int, ...]
+    group_genes: Tuple[int, ...]
+    asst_genes: Tuple[int, ...]
+
+    @property
+    def genes(self) -> Tuple[int, ...]:
+        """Semua gene yang terlibat bentrok jenis apa pun."""
+        return tuple(sorted({*self.room_genes, *self.group_genes, *self.asst_genes}))
+
+
+_START = itemgetter(0)
+
+
+def _sweep(items: List[Tuple[int, int, int]], hit: Set[int]) -> int:
+    """_count_pairs untuk (start, end, index gene); index yang bentrok dimasukkan ke 'hit'."""
+    items.sort(key=_START)
+    heap: List[Tuple[int, int]] = []
+    overlaps = 0
+    for s, e, j in items:
+        while heap and heap[0][0] <= s:
+            heapq.heappop(heap)
+        if heap:
+            overlaps += len(heap)
+            hit.add(j)
+            hit.update(k for _, k in heap)
+        heapq.heappush(heap, (e, j))
+    return overlaps
+
+
+def breakdown(individu: "Individuals") -> Breakdown:
+    """Skor + rincian bentrok satu individu dalam satu sweep (angka sama dengan fitness())."""
+    if individu.breakdown_cache is not None:
+        return individu.breakdown_cache
+    bd = _breakdown(individu)
+    individu.breakdown_cache, individu.fitness_cache = bd, bd.fitness
+    return bd
+
+
+def _breakdown(individu: "Individuals") -> Breakdown:
+    buckets: Tuple[Dict[tuple, list], ...] = ({}, {}, {})  # ruang, group, asisten
+    for j, g in enumerate(individu.chromosome):
+        item = (g.start_time, g.end_time, j)
+        buckets[0].setdefault((g.day, g.room_id), []).append(item)
+        gnorm = norm_group(getattr(g, "group", ""))
+        if gnorm:
+            buckets[1].setdefault((g.day, gnorm), []).append(item)
+        for a in getattr(g, "assistant", []) or []:
+            asst_id = getattr(a, "id", None)
+            if asst_id:
+                buckets[2].setdefault((g.day, asst_id), []).append(item)
+
+    counts, genes = [], []
+    for b in buckets:
+        hit: Set[int] = set()
+        counts.append(sum(_sweep(v, hit) for v in b.values() if len(v) > 1))
+        genes.append(tuple(sorted(hit)))
+    room, group, asst = counts
+    penalty = ALPHA * room + BETA * group + GAMMA * asst
+    return Breakdown(1.0 / (1.0 + penalty), penalty, room, group, asst, *genes)
+
+
+def evaluate(pop: List["Individuals"]) -> List[Breakdown]:
+    """Seperti fitness(pop) tapi per individu mengembalikan Breakdown (di-cache juga)."""
+    m = metrics.active
+    if m is not None:
+        todo = dirty(pop, breakdowns=True)
+        m.incr("fitness_evaluations", todo)
+        m.incr("fitness_cache_hits", len(pop) - todo)
+        with m.phase("fitness"):
+            return [breakdown(ind) for ind in pop]
+    return [breakdown(ind) for ind in pop]
+
+
+def dirty(pop: List["Individuals"], breakdowns: bool = False) -> int:
+    """Jumlah individu yang belum punya cache fitness (atau Breakdown)."""
+    return sum(1 for ind in pop if _dirty(ind, breakdowns))
+
+
+def fitness(
+    pop: List["Individuals"],
+    backend: str = "python",
+    cache: bool = True,
+    breakdowns: bool = False,
+) -> List[float]:
+    """
+    Skor tiap individu = 1 / (1 + penalty).
+    backend="python" pakai sweep-line heap per bucket, backend="numpy" hitung
+    seluruh populasi sekaligus (lihat fitness_np.py), backend="bitset" pakai
+    bitmask slot per bucket (lihat bitset.py). Hasil ketiganya identik.
+
+    cache=True: hanya individu dirty (fitness_cache None) yang dievaluasi,
+    hasilnya disimpan di individu. cache=False: evaluasi semua, cache tidak
+    disentuh (benchmark / perbandingan backend).
+
+    breakdowns=True (mis. mutasi terarah): dirty berarti breakdown_cache None,
+    dan individu itu dinilai lewat breakdown() apa pun backend-nya, jadi skor
+    dan Breakdown keluar dari sweep yang sama. Backend python dengan cache
+    selalu begitu.
+    """
+    if cache:
+        todo = [ind for ind in pop if _dirty(ind, breakdowns)]
+    else:
+        todo = pop
+    store = cache and (breakdowns or backend == "python")
+    m = metrics.active
+    if m is not None:
+        m.incr("fitness_evaluations", len(todo))
+        if cache:
+            m.incr("fitness_cache_hits", len(pop) - len(todo))
+        with m.phase("fitness"):
+            fits = _evaluate(todo, backend, store)
+    else:
+        fits = _evaluate(todo, backend, store)
+    if not cache:
+        return fits
+    if not store:
+        for ind, f in zip(todo, fits):
+            ind.fitness_cache = f
+    return [ind.fitness_cache for ind in pop]
+
+
+def _dirty(ind: "Individuals", breakdowns: bool) -> bool:
+    if breakdowns:
+        return ind.breakdown_cache is None
+    return ind.fitness_cache is None
+
+
+def _evaluate(todo: List["Individuals"], backend: str, store: bool) -> List[float]:
+    """store=True: lewat _breakdown, fitness_cache & breakdown_cache diisi sekaligus."""
+    if not store:
+        return _fitness(todo, backend) if todo else []
+    if backend not in ("python", "numpy", "bitset"):
+        raise ValueError(f"Unknown fitness backend: {backend}")
+    for ind in todo:
+        bd = _breakdown(ind)
+        ind.breakdown_cache, ind.fitness_cache = bd, bd.fitness
+    return []
+
+
+def _fitness(pop: List["Individuals"], backend: str) -> List[float]:
+    if backend == "numpy":
+        from fitness_np import fitness_np
+
+        return fitness_np(pop)
+    if backend == "bitset":
+        from bitset import fitness_bits
+
+        return fitness_bits(pop)
+    if backend != "python":
+        raise ValueError(f"Unknown fitness backend: {backend}")
+
+    return [_breakdown(individu).fitness for individu in pop]
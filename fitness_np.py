@@ -0,0 +1,241 @@
+"""
+Backend NumPy untuk fitness: seluruh populasi dihitung dalam satu pass batch.
+
+Populasi di-encode jadi array integer datar (satu baris per gene):
+    ind, day, start, end, room, group   (group = -1 kalau kosong)
+plus pasangan (asst_gene, asst) untuk tiap asisten di tiap gene.
+
+Jumlah pasangan bentrok per bucket dihitung tanpa heap:
+    bentrok = C(n, 2) - #pasangan (i, j) dengan end_i <= start_j
+Untuk interval [start, end) dengan durasi positif, ini sama persis dengan
+hitungan _count_pairs (heap) di fitness.py. Individu yang punya gene dengan
+end <= start dihitung lewat jalur heap (seperti bitset.fitness_bits), jadi
+hasilnya tetap identik dengan backend python.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+
+from data_type import DAY, END, START
+from data_type import ROOM as ROOM_COL
+from fitness import ALPHA, BETA, GAMMA, _fitness, norm_group
+
+# urutan jenis resource di hasil conflict_counts()
+ROOM, GROUP, ASST = 0, 1, 2
+
+
+@dataclass
+class PopulationArrays:
+    n_individuals: int
+    ind: np.ndarray  # (N,) index individu pemilik gene
+    day: np.ndarray  # (N,)
+    start: np.ndarray  # (N,) detik
+    end: np.ndarray  # (N,) detik
+    room: np.ndarray  # (N,)
+    group: np.ndarray  # (N,) id group ter-normalisasi, -1 = tanpa group
+    asst_gene: np.ndarray  # (M,) index baris gene
+    asst: np.ndarray  # (M,) id asisten (integer)
+
+
+def encode_population(pop: List["Individuals"]) -> PopulationArrays:
+    """Ubah List[Individuals] jadi PopulationArrays (group & asisten di-map ke int)."""
+    group_ids: dict = {}
+    asst_ids: dict = {}
+    ind, day, start, end, room, group = [], [], [], [], [], []
+    asst_gene, asst = [], []
+
+    row = 0
+    for i, individu in enumerate(pop):
+        for g in individu.chromosome:
+            ind.append(i)
+            day.append(g.day)
+            start.append(g.start_time)
+            end.append(g.end_time)
+            room.append(g.room_id)
+            gnorm = norm_group(getattr(g, "group", ""))
+            group.append(group_ids.setdefault(gnorm, len(group_ids)) if gnorm else -1)
+            for a in getattr(g, "assistant", []) or []:
+                asst_id = getattr(a, "id", None)
+                if asst_id:
+                    asst_gene.append(row)
+                    asst.append(asst_ids.setdefault(asst_id, len(asst_ids)))
+            row += 1
+
+    def arr(x):
+        return np.asarray(x, dtype=np.int64)
+
+    return PopulationArrays(
+        len(pop),
+        arr(ind),
+        arr(day),
+        arr(start),
+        arr(end),
+        arr(room),
+        arr(group),
+        arr(asst_gene),
+        arr(asst),
+    )
+
+
+def _static_codes(pa: "PopulationArray"):
+    """
+    Kode group & asisten per baris table, di-cache di pa.cache dan hanya
+    diperpanjang untuk entri table yang baru.
+    """
+    c = pa.cache.setdefault(
+        "fitness_np",
+        {"n": 0, "group_ids": {}, "asst_ids": {}, "group": [], "ptr": [0], "asst": []},
+    )
+    for g in pa.table[c["n"] :]:
+        gnorm = norm_group(getattr(g, "group", ""))
+        c["group"].append(
+            c["group_ids"].setdefault(gnorm, len(c["group_ids"])) if gnorm else -1
+        )
+        for a in getattr(g, "assistant", []) or []:
+            asst_id = getattr(a, "id", None)
+            if asst_id:
+                c["asst"].append(c["asst_ids"].setdefault(asst_id, len(c["asst_ids"])))
+        c["ptr"].append(len(c["asst"]))
+    if c["n"] != len(pa.table) or "arrays" not in c:
+        c["n"] = len(pa.table)
+        c["arrays"] = (
+            np.asarray(c["group"], dtype=np.int64),
+            np.asarray(c["ptr"], dtype=np.int64),
+            np.asarray(c["asst"], dtype=np.int64),
+        )
+    return c["arrays"]
+
+
+def encode_population_array(pa: "PopulationArray") -> PopulationArrays:
+    """Encode langsung dari PopulationArray (data_type.py) tanpa loop per gene."""
+    group_of, ptr, asst_of = _static_codes(pa)
+    valid = pa.gene >= 0
+    rows, _ = np.nonzero(valid)
+    t = pa.gene[valid]
+    pl = pa.placement[valid]
+
+    counts = ptr[t + 1] - ptr[t]
+    asst_gene = np.repeat(np.arange(len(t)), counts)
+    offsets = np.arange(len(asst_gene)) - np.repeat(np.cumsum(counts) - counts, counts)
+    asst = asst_of[np.repeat(ptr[t], counts) + offsets]
+
+    return PopulationArrays(
+        pa.n_pop,
+        rows.astype(np.int64),
+        pl[:, DAY],
+        pl[:, START],
+        pl[:, END],
+        pl[:, ROOM_COL],
+        group_of[t],
+        asst_gene,
+        asst,
+    )
+
+
+def _compose_key(*cols: np.ndarray) -> np.ndarray:
+    """Gabungkan beberapa kolom jadi satu kunci int64 (kolom pertama paling signifikan)."""
+    key = np.zeros(len(cols[0]), dtype=np.int64)
+    for c in cols:
+        uniq, inv = np.unique(c, return_inverse=True)
+        key = key * len(uniq) + inv
+    return key
+
+
+def conflict_counts(arr: PopulationArrays) -> np.ndarray:
+    """
+    Hitung pasangan bentrok untuk semua individu sekaligus.
+    Return array (3, n_individuals): baris ROOM, GROUP, ASST.
+    """
+    P = arr.n_individuals
+    out = np.zeros((3, P), dtype=np.int64)
+    if P == 0 or len(arr.ind) == 0:
+        return out
+    if np.any(arr.end <= arr.start):
+        raise ValueError("backend numpy butuh interval dengan end > start")
+
+    has_group = arr.group >= 0
+    ag = arr.asst_gene
+
+    # satu tabel entri untuk ketiga jenis resource: (kind, ind, day, resource)
+    kind = np.concatenate(
+        [
+            np.full(len(arr.ind), ROOM),
+            np.full(int(has_group.sum()), GROUP),
+            np.full(len(ag), ASST),
+        ]
+    )
+    ind = np.concatenate([arr.ind, arr.ind[has_group], arr.ind[ag]])
+    day = np.concatenate([arr.day, arr.day[has_group], arr.day[ag]])
+    res = np.concatenate([arr.room, arr.group[has_group], arr.asst])
+    start = np.concatenate([arr.start, arr.start[has_group], arr.start[ag]])
+    end = np.concatenate([arr.end, arr.end[has_group], arr.end[ag]])
+
+    _, first, bucket = np.unique(
+        _compose_key(kind, ind, day, res), return_index=True, return_inverse=True
+    )
+
+    # geser waktu supaya >= 0, lalu T > semua waktu → bucket*T + t tidak tumpang tindih
+    t0 = start.min()
+    start = start - t0
+    end = end - t0
+    T = int(end.max()) + 1
+
+    base = bucket * T
+    end_keys = np.sort(base + end)
+    # jumlah interval di bucket yang sama yang sudah selesai sebelum start ini
+    done_before = np.searchsorted(end_keys, base + start, side="right") - np.searchsorted(
+        end_keys, base, side="left"
+    )
+
+    n_b = np.bincount(bucket)
+    free_b = np.bincount(bucket, weights=done_before, minlength=len(n_b))
+    pairs_b = n_b * (n_b - 1) // 2 - free_b.astype(np.int64)
+
+    slot = kind[first] * P + ind[first]
+    out += np.bincount(slot, weights=pairs_b, minlength=3 * P).astype(np.int64).reshape(3, P)
+    return out
+
+
+def _select(arr: PopulationArrays, keep: np.ndarray) -> PopulationArrays:
+    """Sub-populasi individu dengan keep[i] = True (index individu & baris di-renumber)."""
+    rows = keep[arr.ind]
+    new_ind = np.cumsum(keep) - 1
+    new_row = np.cumsum(rows) - 1
+    a_rows = rows[arr.asst_gene]
+    return PopulationArrays(
+        int(keep.sum()),
+        new_ind[arr.ind[rows]],
+        arr.day[rows],
+        arr.start[rows],
+        arr.end[rows],
+        arr.room[rows],
+        arr.group[rows],
+        new_row[arr.asst_gene[a_rows]],
+        arr.asst[a_rows],
+    )
+
+
+def fitness_arrays(arr: PopulationArrays) -> np.ndarray:
+    counts = conflict_counts(arr)
+    penalty = ALPHA * counts[ROOM] + BETA * counts[GROUP] + GAMMA * counts[ASST]
+    return 1.0 / (1.0 + penalty)
+
+
+def fitness_np(pop) -> List[float]:
+    """pop boleh List[Individuals] atau PopulationArray."""
+    is_array = hasattr(pop, "placement")
+    arr = encode_population_array(pop) if is_array else encode_population(pop)
+    bad = np.zeros(arr.n_individuals, dtype=bool)
+    bad[arr.ind[arr.end <= arr.start]] = True
+    if not bad.any():
+        return fitness_arrays(arr).tolist()
+
+    # conflict_counts butuh end > start → individu itu lewat jalur heap
+    fits = np.empty(arr.n_individuals)
+    fits[~bad] = fitness_arrays(_select(arr, ~bad))
+    for k in np.flatnonzero(bad).tolist():
+        individu = pop.individual(k) if is_array else pop[k]
+        fits[k] = _fitness([individu], "python")[0]
+    return fits.tolist()
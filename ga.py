@@ -0,0 +1,473 @@
+"""
+Entry point library GA penjadwalan praktikum.
+
+    from ga import GAConfig, evolve, solve
+    result = solve(GAConfig(n_gene=40, n_pop=20, seed=1))
+    result.best.save_dataframe()
+
+    # atau streaming per generasi (bisa break kapan saja / ubah config di tengah)
+    for rec in evolve(GAConfig(seed=1, max_iter=50)):
+        log.write(json.dumps(rec.to_dict()) + "\n")
+
+Import modul ini (dan operator-operatornya) tidak melakukan kerja apa pun:
+dataset, ruang_list dan Rooms baru dibuat lewat GAContext saat solve() jalan.
+"""
+
+import random
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Iterator, List, Optional
+
+import metrics
+from context import GAContext, default_context
+from data_type import Individuals
+
+
+@dataclass
+class GAConfig:
+    n_gene: int = 40  # jumlah gen per individu
+    n_pop: int = 20  # jumlah individu dalam populasi
+    seed: Optional[int] = None
+    fitness_backend: str = "python"  # 'python' | 'numpy' | 'bitset'
+    selection: str = "roulette"  # 'roulette' | 'sus' | 'tournament'
+    repair: str = "legacy"  # 'legacy' | 'conflict' (repair.py)
+    mutation_rate: float = 0.3
+    targeted_mutation: bool = False  # mutasi pilih gene dari daftar bentrok
+    # 'classic' = crossover.py + mutation.py; 'mixed' = operator try_crossover1 +
+    # try_mutation1 dengan bobot statis; 'adaptive' = bobotnya dipelajari
+    # (operator_select.py). Selain 'classic' hanya untuk loop serial.
+    operators: str = "classic"
+    operator_cost: str = "cpu"  # 'cpu' (gain per detik CPU) | 'calls' (deterministik)
+    operator_weights: Optional[dict] = None  # bobot awal {"crossover": {...}, "mutation": {...}}
+    # local search pada elit tiap generasi (memetic.py); tidak untuk workers
+    memetic: Optional[str] = None  # None | 'tabu' | 'descent'
+    memetic_elites: int = 2
+    memetic_evals: int = 200  # gerakan yang dinilai per individu
+    memetic_time: Optional[float] = None  # detik per generasi untuk semua elit
+    workers: Optional[int] = None  # None → serial
+    max_iter: Optional[int] = None
+    data_path: Optional[str] = None  # None → dataset.file_path
+    # island model (islands.py): n_pop dibagi ke 'islands' sub-populasi
+    islands: Optional[int] = None  # None → satu populasi
+    migration_interval: int = 5  # migrasi tiap M generasi
+    migrants: int = 2  # individu terbaik yang dikirim per migrasi
+    topology: str = "ring"  # 'ring' | 'full'
+    target: Optional[float] = None  # None → > 0.9 (crossover) / >= 0.99 (mutasi)
+    # checkpoint periodik (checkpoint.py), hanya untuk loop serial
+    checkpoint: Optional[str] = None  # path file checkpoint
+    checkpoint_every: int = 10  # tiap N generasi
+
+
+@dataclass
+class GAResult:
+    best: Individuals
+    fitness: float
+    iteration: int
+    history: List[float] = field(default_factory=list)  # max fitness per iterasi
+    elapsed: float = 0.0  # detik, tanpa seeding
+    time_to_target: Optional[float] = None  # detik sampai target tercapai
+    operator_stats: Optional[dict] = None  # operators='adaptive': bobot & credit akhir
+
+
+@dataclass(slots=True)
+class Generation:
+    """
+    Ringkasan satu evaluasi populasi (dibuat evolve()). Statistik hanya dari
+    list fitness yang sudah ada + hitung bentrok satu individu terbaik.
+    'population' & 'fitnesses' adalah referensi (bukan salinan), hanya sah
+    sampai generator dilanjutkan.
+    """
+
+    generation: int
+    stage: str  # 'init' | 'crossover' | 'mutation'
+    best: float
+    mean: float
+    worst: float
+    room: int  # pasangan bentrok individu terbaik
+    group: int
+    asst: int
+    elapsed: float  # detik sejak evolve() mulai (tanpa seeding)
+    evaluations: int  # total individu yang sudah dievaluasi (+ gerakan local search memetic)
+    reached: bool  # aturan berhenti / target terpenuhi di record ini
+    best_index: int
+    population: List[Individuals] = field(repr=False, compare=False)
+    fitnesses: List[float] = field(repr=False, compare=False)
+    # operators='adaptive': AdaptivePursuit.to_dict() per jenis operator
+    operator_stats: Optional[dict] = None
+
+    @property
+    def individual(self) -> Individuals:
+        return self.population[self.best_index]
+
+    def to_dict(self) -> dict:
+        """Field skalar saja, siap untuk json.dumps (JSONL)."""
+        return {k: getattr(self, k) for k in RECORD_FIELDS}
+
+
+RECORD_FIELDS = [
+    f for f in Generation.__dataclass_fields__ if f not in ("population", "fitnesses")
+]
+
+
+def _check(config: GAConfig):
+    if config.n_gene <= 0 or config.n_pop <= 0:
+        raise ValueError("n_gene dan n_pop harus > 0")
+    from repair import get_repair
+
+    get_repair(config.repair)
+    if config.operators not in OPERATORS:
+        raise ValueError(f"Unknown operators: {config.operators}. Use one of {OPERATORS}")
+    if config.operators != "classic" and (
+        config.workers is not None or config.islands is not None
+    ):
+        raise ValueError(f"operators='{config.operators}' hanya untuk loop serial")
+    if config.memetic is not None:
+        from memetic import METHODS
+
+        if config.memetic not in METHODS:
+            raise ValueError(f"Unknown memetic method: {config.memetic}. Use one of {METHODS}")
+        if config.workers is not None and config.islands is None:
+            raise ValueError("memetic belum didukung untuk workers (run_parallel)")
+
+
+OPERATORS = ("classic", "mixed", "adaptive")
+
+
+def _bandits(config: GAConfig, state: Optional[dict] = None) -> dict:
+    """
+    AdaptivePursuit untuk operator crossover & mutasi (bobot awal: config atau
+    statis). state = operator_stats dari checkpoint → dipulihkan persis.
+    """
+    from operator_select import AdaptivePursuit
+    from try_crossover1 import CX_WEIGHTS
+    from try_mutation1 import MUTATION_WEIGHTS
+
+    if state:
+        return {
+            k: AdaptivePursuit.from_dict(d, cost=config.operator_cost)
+            for k, d in state.items()
+        }
+
+    warm = config.operator_weights or {}
+    out = {}
+    for kind, default in (("crossover", CX_WEIGHTS), ("mutation", MUTATION_WEIGHTS)):
+        w = warm.get(kind) or default
+        w = w.get("weights", w)  # boleh langsung operator_stats dari run sebelumnya
+        if set(w) != set(default):
+            raise ValueError(f"operator_weights['{kind}'] harus memuat {sorted(default)}")
+        out[kind] = AdaptivePursuit(w, cost=config.operator_cost)
+    return out
+
+
+def _crossover_step(config: GAConfig, fits, population, bandits):
+    from crossover import crossover
+
+    if config.operators == "classic":
+        return crossover(
+            fits, population, selection=config.selection, repair=config.repair
+        )
+    import try_crossover1
+    from repair import get_repair
+
+    adaptive = bandits["crossover"] if bandits is not None else None
+    out = try_crossover1.crossover(
+        fits, population, selection=config.selection, adaptive=adaptive
+    )
+    fix = get_repair(config.repair)
+    for ind in out:
+        fix(ind)
+    return out
+
+
+def _mutation_step(config: GAConfig, population, bandits, ctx: GAContext):
+    from mutation import mutation
+
+    if config.operators == "classic":
+        return mutation(
+            population, config.mutation_rate, config.repair, config.targeted_mutation
+        )
+    import try_mutation1
+    from repair import get_repair
+
+    adaptive = bandits["mutation"] if bandits is not None else None
+    out = try_mutation1.mutation(
+        population, config.mutation_rate, adaptive=adaptive, verbose=False, ctx=ctx
+    )
+    fix = get_repair(config.repair)
+    for ind in out:
+        fix(ind)
+    return out
+
+
+def _seed(config: GAConfig, ctx: GAContext) -> List[Individuals]:
+    from seeder import generate_population
+
+    if config.seed is not None:
+        random.seed(config.seed)
+    return generate_population(
+        config.n_gene, config.n_pop, ctx, seed=config.seed, workers=config.workers
+    )
+
+
+def _resume_context(config: GAConfig) -> GAContext:
+    """
+    Context untuk run yang di-resume tanpa ctx. Rooms & pool asisten dibuat
+    dari `random` global tepat setelah random.seed(config.seed) (lihat _seed),
+    jadi run ber-seed mendapat context yang identik dengan run aslinya.
+    State RNG dikembalikan sesudahnya.
+    """
+    ctx = GAContext(config.data_path)
+    state = random.getstate()
+    if config.seed is not None:
+        random.seed(config.seed)
+    ctx.rooms, ctx.assistants  # urutan sama dengan generate_population
+    random.setstate(state)
+    return ctx
+
+
+def evolve(
+    config: GAConfig = None,
+    ctx: Optional[GAContext] = None,
+    population: Optional[List[Individuals]] = None,
+    resume=None,
+) -> Iterator[Generation]:
+    """
+    GA serial sebagai generator: yield satu Generation setelah tiap evaluasi
+    (populasi awal, crossover, mutasi). Berhenti sendiri dengan aturan solve()
+    (config.target / 0.9 / 0.99, fitness 1.0, max_iter); caller boleh break
+    lebih awal. fitness_backend, selection, repair, operators, mutation_rate,
+    memetic* dan target dibaca
+    ulang dari 'config' tiap generasi, jadi boleh diubah di antara next().
+
+    resume: checkpoint.Checkpoint → lanjut dari generasi, fitness dan state
+    RNG yang tersimpan (record pertama ber-stage 'resume', tanpa evaluasi ulang).
+
+    ctx dipakai operator yang membangkitkan gene / cek asisten (operators
+    mixed & adaptive). Default: context baru untuk seeding, context default
+    untuk 'population' dari caller, _resume_context() untuk resume.
+    """
+    from bitset import _individual_pairs
+    from fitness import conflicts, dirty, fitness
+    from islands import reached
+    from memetic import improve_elites
+
+    config = config or GAConfig()
+    _check(config)
+    if resume is not None:
+        population = resume.individuals()
+        ctx = ctx if ctx is not None else _resume_context(config)
+    elif population is None:
+        ctx = ctx if ctx is not None else GAContext(config.data_path)
+        population = _seed(config, ctx)
+    else:
+        # populasi dari caller (mis. CLI) dibangkitkan dengan context default
+        ctx = ctx if ctx is not None else default_context()
+
+    t0 = time.perf_counter() - (resume.elapsed if resume is not None else 0.0)
+    evaluations = resume.evaluations if resume is not None else 0
+    bandits = None  # dibuat saat operators='adaptive' pertama kali dipakai
+    if resume is not None and resume.operator_stats:
+        bandits = _bandits(config, resume.operator_stats)
+
+    def score(pop):
+        # mutasi terarah butuh Breakdown: dihitung di sweep yang sama dengan skornya
+        return fitness(
+            pop,
+            backend=config.fitness_backend,
+            breakdowns=config.targeted_mutation,
+        )
+
+    def record(gen: int, stage: str, pop, fits, hit: bool) -> Generation:
+        best = max(fits)
+        idx = fits.index(best)
+        # jalur bitmask (murah); interval di luar grid → hitung heap
+        counts = _individual_pairs(pop[idx].chromosome)
+        room, group, asst = counts if counts is not None else conflicts(pop[idx])
+        return Generation(
+            gen,
+            stage,
+            best,
+            sum(fits) / len(fits),
+            min(fits),
+            room,
+            group,
+            asst,
+            time.perf_counter() - t0,
+            evaluations,
+            hit,
+            idx,
+            pop,
+            fits,
+            {k: b.to_dict() for k, b in bandits.items()} if bandits else None,
+        )
+
+    if resume is not None:
+        fits = resume.fitnesses.tolist()
+        for ind, f in zip(population, fits):
+            ind.fitness_cache = f
+        gen, hit = resume.generation, resume.reached
+        random.setstate(resume.rng_state)
+        yield record(gen, "resume", population, fits, hit)
+    else:
+        if metrics.active is not None:
+            metrics.active.next_generation(0)
+        # individu yang tidak berubah pakai cache
+        evaluations += dirty(population, config.targeted_mutation)
+        fits = score(population)
+        gen = 0
+        hit = config.target is not None and max(fits) >= config.target
+        yield record(gen, "init", population, fits, hit)
+
+    while (
+        not hit
+        and max(fits) < 1.0
+        and (config.max_iter is None or gen < config.max_iter)
+    ):
+        gen += 1
+        if metrics.active is not None:
+            metrics.active.next_generation(gen)
+        if config.operators == "adaptive" and bandits is None:
+            bandits = _bandits(config)
+        active = bandits if config.operators == "adaptive" else None
+        population = _crossover_step(config, fits, population, active)
+        evaluations += dirty(population, config.targeted_mutation)
+        fits = score(population)
+        hit = reached(max(fits), "crossover", config.target)
+        yield record(gen, "crossover", population, fits, hit)
+        if hit:
+            break
+
+        population = _mutation_step(config, population, active, ctx)
+        evaluations += dirty(population, config.targeted_mutation)
+        fits = score(population)
+        if config.memetic is not None:
+            # gerakan yang dinilai local search ikut dihitung sebagai evaluasi
+            evaluations += improve_elites(
+                population,
+                fits,
+                config.memetic_elites,
+                config.memetic,
+                config.memetic_evals,
+                config.memetic_time,
+            )
+        hit = reached(max(fits), "mutation", config.target)
+        yield record(gen, "mutation", population, fits, hit)
+
+
+def solve(
+    config: GAConfig = None,
+    ctx: Optional[GAContext] = None,
+    resume: Optional[str] = None,
+) -> GAResult:
+    """
+    Jalankan GA sampai selesai. Aturan berhenti sama dengan mutation.main():
+    > 0.9 setelah crossover, >= 0.99 setelah mutasi (atau config.target),
+    atau max_iter tercapai.
+
+    resume: path checkpoint → lanjutkan run serial itu (config default dari
+    checkpoint, tanpa seeding ulang).
+    """
+    from islands import run_islands
+    from mutation import mutate_individual
+
+    if resume is not None:
+        from checkpoint import load
+
+        state = load(resume)
+        config = config or state.ga_config()
+        return _run_serial(config, ctx, None, state)
+
+    config = config or GAConfig()
+    _check(config)
+    ctx = ctx if ctx is not None else GAContext(config.data_path)
+    population = _seed(config, ctx)
+
+    if config.islands is not None:
+        res = run_islands(
+            population,
+            config.islands,
+            seed=config.seed,
+            interval=config.migration_interval,
+            migrants=config.migrants,
+            topology=config.topology,
+            backend=config.fitness_backend,
+            selection=config.selection,
+            repair=config.repair,
+            mutation_rate=config.mutation_rate,
+            targeted_mutation=config.targeted_mutation,
+            memetic=config.memetic,
+            memetic_elites=config.memetic_elites,
+            memetic_evals=config.memetic_evals,
+            memetic_time=config.memetic_time,
+            max_iter=config.max_iter,
+            target=config.target,
+        )
+        # max fitness per generasi dari pulau yang masih jalan di generasi itu
+        runs = [i["history"] for i in res.islands]
+        history = [
+            max(h[g] for h in runs if g < len(h)) for g in range(res.iteration)
+        ]
+        return GAResult(
+            res.best,
+            res.fitness,
+            res.iteration,
+            history,
+            res.elapsed,
+            res.time_to_target,
+        )
+
+    if config.workers is not None:
+        from parallel import run_parallel
+
+        best, best_fit, iteration = run_parallel(
+            population,
+            config.workers,
+            seed=config.seed,
+            mutate_fn=partial(
+                mutate_individual,
+                repair=config.repair,
+                targeted=config.targeted_mutation,
+            ),
+            backend=config.fitness_backend,
+            max_iter=config.max_iter,
+            selection=config.selection,
+            repair=config.repair,
+        )
+        return GAResult(best, best_fit, iteration)
+
+    return _run_serial(config, ctx, population)
+
+
+def _run_serial(config: GAConfig, ctx, population, state=None) -> GAResult:
+    ck = None
+    if config.checkpoint is not None:
+        from checkpoint import Checkpointer
+
+        ck = (
+            Checkpointer.resume_from(state, config.checkpoint, config.checkpoint_every)
+            if state is not None
+            else Checkpointer(config.checkpoint, config.checkpoint_every, config)
+        )
+
+    history: List[float] = []
+    try:
+        for rec in evolve(config, ctx, population, resume=state):
+            if rec.stage == "mutation" or (rec.stage == "crossover" and rec.reached):
+                history.append(rec.best)
+            if ck is not None and ck.due(rec):
+                ck.save(rec)
+        if ck is not None and rec.stage == "mutation" and not ck.due(rec):
+            ck.save(rec)  # berhenti karena max_iter di luar kelipatan 'every'
+    finally:
+        if ck is not None:
+            ck.wait()  # save background terakhir harus selesai sebelum return
+    return GAResult(
+        rec.individual,
+        rec.best,
+        rec.generation,
+        history,
+        rec.elapsed,
+        rec.elapsed if rec.reached else None,
+        rec.operator_stats,
+    )
@@ -0,0 +1,324 @@
+"""
+Island model: K sub-populasi berevolusi di proses terpisah dengan operator
+yang sama (crossover.crossover + mutation.mutation), lalu tiap M generasi
+bertukar individu terbaik.
+
+- Topologi: "ring" (pulau i → i+1) atau "full" (pulau i → semua pulau lain).
+- Migrasi sinkron per epoch (tiap pulau menunggu kiriman tetangga-masuknya),
+  jadi hasil tiap pulau ditentukan seed saja, bukan urutan proses.
+- Payload migrasi hanya data penempatan: baris PopulationArray
+  (index gene ke table, placement day/start/end/room, kode day_name).
+  Table gene statis (mata kuliah, asisten, preferred_lab) dikirim sekali
+  saat pulau dibuat, sama seperti parallel.run_parallel.
+- Pulau yang berhenti (target, fitness 1.0, max_iter) mengirim tanda berhenti
+  ke tetangganya; tetangga ikut berhenti di batas epoch berikutnya, jadi
+  titik berhenti tiap pulau juga hanya ditentukan seed. time_to_target diukur
+  per pulau dari awal evolusinya (tanpa spawn proses), lalu diambil minimum.
+"""
+
+import multiprocessing as mp
+import queue
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from assistant_schedule import DAY_NAMES
+from data_type import Individuals, PopulationArray
+
+TOPOLOGIES = ("ring", "full")
+
+# (gene index, placement, day_name) satu individu
+Payload = Tuple[list, list, list]
+
+
+@dataclass
+class IslandResult:
+    best: Individuals
+    fitness: float
+    iteration: int  # generasi terbanyak yang dijalani satu pulau
+    elapsed: float
+    time_to_target: Optional[float] = None  # None → target tidak tercapai
+    islands: List[dict] = field(default_factory=list)  # ringkasan per pulau
+
+
+def neighbors(i: int, k: int, topology: str) -> List[int]:
+    """Pulau tujuan migrasi dari pulau i."""
+    if topology == "ring":
+        return [(i + 1) % k] if k > 1 else []
+    if topology == "full":
+        return [j for j in range(k) if j != i]
+    raise ValueError(f"Unknown topology: {topology}. Use one of {TOPOLOGIES}")
+
+
+def sources(i: int, k: int, topology: str) -> List[int]:
+    """Pulau yang mengirim migran ke pulau i."""
+    return [j for j in range(k) if i in neighbors(j, k, topology)]
+
+
+def encode(pa: PopulationArray, ind: Individuals) -> Payload:
+    """Individu → payload penempatan (pa = scratch 1 baris dengan table bersama)."""
+    n_table, n_names = len(pa.table), len(pa.day_names)
+    pa.set_individual(0, ind)
+    if len(pa.table) != n_table or len(pa.day_names) != n_names:
+        raise RuntimeError("migran memuat gene / nama hari di luar table bersama")
+    n = int(pa.lengths[0])
+    return (
+        pa.gene[0, :n].tolist(),
+        pa.placement[0, :n].tolist(),
+        pa.day_name[0, :n].tolist(),
+    )
+
+
+def decode(pa: PopulationArray, payload: Payload) -> Individuals:
+    gene, placement, day_name = payload
+    n = len(gene)
+    pa.gene[0, :] = -1
+    pa.gene[0, :n] = gene
+    pa.placement[0, :n] = placement
+    pa.day_name[0, :n] = day_name
+    pa.lengths[0] = n
+    return pa.individual(0)
+
+
+def reached(best: float, stage: str, target: Optional[float]) -> bool:
+    """target None → aturan lama: > 0.9 setelah crossover, >= 0.99 setelah mutasi."""
+    if target is not None:
+        return best >= target
+    return best > 0.9 if stage == "crossover" else best >= 0.99
+
+
+def _collect(i, gen, ins, inboxes, mailbox, stopped, abort) -> Tuple[List[Payload], bool]:
+    """
+    Tunggu epoch 'gen' dari tiap tetangga-masuk: migran untuk gen itu atau
+    tanda berhenti (payload None) di generasi <= gen. Kiriman epoch lain
+    disimpan di mailbox, jadi hasilnya tidak bergantung urutan proses.
+    Return (migran urut pulau asal, ada tetangga yang sudah berhenti).
+    """
+    while not all((gen, src) in mailbox or stopped.get(src, gen + 1) <= gen for src in ins):
+        if abort.is_set():
+            return [], True
+        try:
+            g, src, migrants = inboxes[i].get(timeout=0.05)
+        except queue.Empty:
+            continue
+        if migrants is None:
+            stopped[src] = g
+        else:
+            mailbox[(g, src)] = migrants
+    got = {src: mailbox.pop((gen, src)) for src in ins if (gen, src) in mailbox}
+    incoming = [m for src in sorted(got) for m in got[src]]
+    return incoming, any(stopped.get(src, gen + 1) <= gen for src in ins)
+
+
+def _island_main(i: int, rows: List[Payload], shared: dict, inboxes, out_q, abort):
+    from crossover import crossover
+    from fitness import fitness
+    from memetic import improve_elites
+    from mutation import mutation
+
+    cfg = shared["cfg"]
+    random.seed(f"{cfg['seed']}:island:{i}")
+    pa = PopulationArray.allocate(
+        1, shared["width"], shared["table"], shared["day_names"]
+    )
+    pop = [decode(pa, r) for r in rows]
+    k = shared["k"]
+    outs = neighbors(i, k, cfg["topology"])
+    ins = sources(i, k, cfg["topology"])
+    mailbox: Dict[Tuple[int, int], List[Payload]] = {}
+    stopped: Dict[int, int] = {}  # pulau asal → generasi saat berhenti
+
+    def score(p):
+        return fitness(
+            p, backend=cfg["backend"], breakdowns=cfg["targeted_mutation"]
+        )
+
+    # diukur dari awal evolusi pulau ini (tanpa spawn proses & kirim populasi),
+    # sama dengan GAResult.time_to_target yang tidak menghitung seeding
+    t_start = time.perf_counter()
+    fits = score(pop)
+    history: List[float] = []
+    hit: Optional[float] = None
+    if cfg["target"] is not None and max(fits) >= cfg["target"]:
+        hit = 0.0
+    gen = 0
+    while hit is None and max(fits) < 1.0:
+        if abort.is_set() or (cfg["max_iter"] is not None and gen >= cfg["max_iter"]):
+            break
+        gen += 1
+        pop = crossover(fits, pop, selection=cfg["selection"], repair=cfg["repair"])
+        fits = score(pop)
+        if reached(max(fits), "crossover", cfg["target"]):
+            hit = time.perf_counter() - t_start
+        else:
+            pop = mutation(
+                pop, cfg["mutation_rate"], cfg["repair"], cfg["targeted_mutation"]
+            )
+            fits = score(pop)
+            if cfg["memetic"] is not None:
+                improve_elites(
+                    pop,
+                    fits,
+                    cfg["memetic_elites"],
+                    cfg["memetic"],
+                    cfg["memetic_evals"],
+                    cfg["memetic_time"],
+                )
+            if reached(max(fits), "mutation", cfg["target"]):
+                hit = time.perf_counter() - t_start
+        history.append(max(fits))
+        if hit is not None:
+            break
+
+        last = cfg["max_iter"] is not None and gen >= cfg["max_iter"]
+        if gen % cfg["interval"] == 0 and outs and not last:
+            ranked = sorted(range(len(pop)), key=lambda j: fits[j], reverse=True)
+            payload = [encode(pa, pop[j]) for j in ranked[: cfg["migrants"]]]
+            for j in outs:
+                inboxes[j].put((gen, i, payload))
+
+            incoming, stop = _collect(i, gen, ins, inboxes, mailbox, stopped, abort)
+            if stop:
+                break  # tetangga sudah selesai → berhenti di batas epoch yang sama
+            if incoming:
+                worst = sorted(range(len(pop)), key=lambda j: fits[j])
+                for j, m in zip(worst, incoming):
+                    pop[j] = decode(pa, m)
+                fits = score(pop)
+
+    # semua jalur keluar mengirim tanda berhenti, supaya tetangga tidak menunggu
+    for j in outs:
+        inboxes[j].put((gen, i, None))
+    b = fits.index(max(fits))
+    out_q.put(
+        {
+            "island": i,
+            "best": encode(pa, pop[b]),
+            "fitness": fits[b],
+            "iteration": gen,
+            "time_to_target": hit,
+            "history": history,
+        }
+    )
+
+
+def run_islands(
+    population: List[Individuals],
+    islands: int,
+    seed: Optional[int] = None,
+    interval: int = 5,
+    migrants: int = 2,
+    topology: str = "ring",
+    backend: str = "python",
+    selection: str = "roulette",
+    repair: str = "legacy",
+    mutation_rate: float = 0.3,
+    targeted_mutation: bool = False,
+    memetic: Optional[str] = None,
+    memetic_elites: int = 2,
+    memetic_evals: int = 200,
+    memetic_time: Optional[float] = None,
+    max_iter: Optional[int] = None,
+    target: Optional[float] = None,
+) -> IslandResult:
+    """
+    Bagi 'population' ke 'islands' pulau (round-robin) lalu evolusikan paralel.
+    Return individu terbaik dari semua pulau + waktu mencapai target.
+    """
+    if islands < 1:
+        raise ValueError("islands harus >= 1")
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown topology: {topology}. Use one of {TOPOLOGIES}")
+    if len(population) < 2 * islands:
+        raise ValueError("tiap pulau butuh minimal 2 individu")
+
+    # table & nama hari dibekukan di sini supaya semua pulau pakai index yang sama
+    local = PopulationArray.from_individuals(population)
+    day_names = list(dict.fromkeys(list(DAY_NAMES.values()) + local.day_names))
+    local.day_names[:] = day_names
+    for k, ind in enumerate(population):
+        local.set_individual(k, ind)
+    rows = [
+        (
+            local.gene[k, : local.lengths[k]].tolist(),
+            local.placement[k, : local.lengths[k]].tolist(),
+            local.day_name[k, : local.lengths[k]].tolist(),
+        )
+        for k in range(local.n_pop)
+    ]
+
+    t0 = time.perf_counter()
+    shared = {
+        "table": local.table,
+        "day_names": day_names,
+        "width": local.width,
+        "k": islands,
+        "cfg": {
+            "seed": seed if seed is not None else random.getrandbits(64),
+            "interval": max(1, interval),
+            "migrants": migrants,
+            "topology": topology,
+            "backend": backend,
+            "selection": selection,
+            "repair": repair,
+            "mutation_rate": mutation_rate,
+            "targeted_mutation": targeted_mutation,
+            "memetic": memetic,
+            "memetic_elites": memetic_elites,
+            "memetic_evals": memetic_evals,
+            "memetic_time": memetic_time,
+            "max_iter": max_iter,
+            "target": target,
+        },
+    }
+    inboxes = [mp.Queue() for _ in range(islands)]
+    out_q = mp.Queue()
+    abort = mp.Event()
+    procs = [
+        mp.Process(
+            target=_island_main,
+            args=(i, rows[i::islands], shared, inboxes, out_q, abort),
+        )
+        for i in range(islands)
+    ]
+    for p in procs:
+        p.start()
+    try:
+        results = []
+        while len(results) < islands:
+            try:
+                results.append(out_q.get(timeout=0.5))
+            except queue.Empty:
+                crashed = [p.exitcode for p in procs if p.exitcode not in (None, 0)]
+                if crashed:
+                    abort.set()
+                    raise RuntimeError(f"proses pulau gagal (exitcode {crashed[0]})")
+        results.sort(key=lambda r: r["island"])
+    finally:
+        # buang migran yang tidak sempat dibaca supaya feeder thread pulau bisa selesai
+        while any(p.is_alive() for p in procs):
+            for q in inboxes:
+                try:
+                    while True:
+                        q.get_nowait()
+                except queue.Empty:
+                    pass
+            for p in procs:
+                p.join(timeout=0.05)
+    elapsed = time.perf_counter() - t0
+
+    best = max(results, key=lambda r: r["fitness"])
+    hits = [r["time_to_target"] for r in results if r["time_to_target"] is not None]
+    scratch = PopulationArray.allocate(1, local.width, local.table, day_names)
+    payload = best["best"]
+    for r in results:
+        del r["best"]
+    return IslandResult(
+        best=decode(scratch, payload),
+        fitness=best["fitness"],
+        iteration=max(r["iteration"] for r in results),
+        elapsed=elapsed,
+        time_to_target=min(hits) if hits else None,
+        islands=results,
+    )
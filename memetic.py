@@ -0,0 +1,193 @@
+"""
+Langkah memetic: local search terbatas pada individu elit tiap generasi.
+
+Gerakan (semuanya dinilai dengan delta_fitness.ConflictState, tanpa rescoring):
+- geser waktu satu gene ±1..4 GRID
+- pindah ruang dalam preferred_lab (kapasitas cukup)
+- pindah hari (jam sama kalau sah, kalau tidak start sah terdekat)
+- tukar slot dua gene berdurasi sama (ruang tujuan harus cocok untuk keduanya)
+
+Hanya gene yang sedang bentrok yang dicoba (maks. 'sample' gene per langkah).
+
+    method="descent" → ambil gerakan terbaik selama menurunkan penalty
+    method="tabu"    → ambil gerakan terbaik yang tidak tabu walau tidak
+                       memperbaiki; gene yang baru dipindah tabu 'tenure'
+                       langkah (kecuali menghasilkan penalty terbaik baru).
+                       Di akhir kromosom dikembalikan ke kondisi terbaik.
+
+Budget: max_evals gerakan yang dinilai per individu dan/atau deadline
+(time.perf_counter()) bersama untuk semua elit satu generasi.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import metrics
+from assistant_schedule import DAY_NAMES
+from data_type import Individuals
+from delta_fitness import ConflictState
+from fitness import GRID
+from seeder import _allowed_in_day, feasible_starts
+
+METHODS = ("descent", "tabu")
+SHIFTS = (1, -1, 2, -2, 3, -3, 4, -4)
+N_DAYS = 6  # hari 0..5 (0 = Senin = DAY_NAMES[1]), sama dengan mutation.mutate_individual
+
+
+@dataclass
+class SearchResult:
+    fitness: float
+    penalty: float
+    evaluations: int  # gerakan yang dinilai (delta)
+    moves: int  # gerakan yang diterapkan
+
+
+def _room_ok(g, room_id: int) -> bool:
+    if room_id == g.room_id:
+        return True
+    return any(
+        r.id == room_id and g.capacity <= r.room_capacity for r in g.preferred_lab or []
+    )
+
+
+def _day_start(day: int, s: int, e: int) -> Optional[int]:
+    """Start di hari 'day': jam sama kalau sah, kalau tidak start sah terdekat."""
+    if _allowed_in_day(day, s, e):
+        return s
+    starts = feasible_starts(day, e - s)
+    return min(starts, key=lambda x: abs(x - s)) if starts else None
+
+
+def _moves(state: ConflictState, j: int, by_dur: Dict[int, List[int]], rng, partners: int):
+    """(delta, j, k, fields) untuk gerakan gene j; k = partner swap atau None."""
+    g = state.individu.chromosome[j]
+    s, e = g.start_time, g.end_time
+    here = state.placement_penalty(j)
+
+    for mul in SHIFTS:
+        s2, e2 = s + mul * GRID, e + mul * GRID
+        if _allowed_in_day(g.day, s2, e2):
+            d = state.placement_penalty(j, start_time=s2, end_time=e2) - here
+            yield d, j, None, {"start_time": s2, "end_time": e2}
+
+    for r in g.preferred_lab or []:
+        if r.id != g.room_id and g.capacity <= r.room_capacity:
+            yield state.placement_penalty(j, room_id=r.id) - here, j, None, {"room_id": r.id}
+
+    for day in range(N_DAYS):
+        if day == g.day:
+            continue
+        s2 = _day_start(day, s, e)
+        if s2 is not None:
+            e2 = s2 + (e - s)
+            d = state.placement_penalty(j, day=day, start_time=s2, end_time=e2) - here
+            fields = {"day": day, "day_name": DAY_NAMES[day + 1], "start_time": s2, "end_time": e2}
+            yield d, j, None, fields
+
+    others = [k for k in by_dur.get(e - s, ()) if k != j]
+    chrom = state.individu.chromosome
+    for k in rng.sample(others, k=min(partners, len(others))):
+        h = chrom[k]
+        if _room_ok(g, h.room_id) and _room_ok(h, g.room_id):
+            yield state.swap_delta(j, k), j, k, None
+
+
+@metrics.timed("memetic")
+def local_search(
+    individu: Individuals,
+    method: str = "tabu",
+    max_evals: int = 200,
+    deadline: Optional[float] = None,
+    tenure: int = 7,
+    sample: int = 4,
+    partners: int = 3,
+    rng=random,
+) -> SearchResult:
+    """Perbaiki 'individu' in-place (gene baru, gene lama tidak diubah → aman untuk clone)."""
+    if method not in METHODS:
+        raise ValueError(f"Unknown memetic method: {method}. Use one of {METHODS}")
+    state = ConflictState(individu)
+    chrom = individu.chromosome
+    by_dur: Dict[int, List[int]] = {}
+    for j, g in enumerate(chrom):
+        by_dur.setdefault(g.end_time - g.start_time, []).append(j)
+
+    best_pen, best_chrom = state.penalty, list(chrom)
+    tabu_until: Dict[int, int] = {}
+    evals = moves = step = 0
+    while state.penalty > 0 and evals < max_evals:
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        step += 1
+        bad = [j for j in range(len(chrom)) if state.placement_penalty(j) > 0]
+        if len(bad) > sample:
+            bad = rng.sample(bad, sample)
+
+        pick = None
+        for j in bad:
+            for d, a, b, fields in _moves(state, j, by_dur, rng, partners):
+                evals += 1
+                tabu = tabu_until.get(a, 0) >= step or (
+                    b is not None and tabu_until.get(b, 0) >= step
+                )
+                # aspirasi: gerakan tabu boleh kalau menghasilkan penalty terbaik baru
+                if tabu and state.penalty + d >= best_pen:
+                    continue
+                if pick is None or d < pick[0]:
+                    pick = (d, a, b, fields)
+                if evals >= max_evals:
+                    break
+            if evals >= max_evals:
+                break
+
+        if pick is None or (method == "descent" and pick[0] >= 0):
+            break
+        d, a, b, fields = pick
+        if b is None:
+            state.apply_move(a, shared=False, **fields)
+        else:
+            state.apply_swap(a, b)
+            tabu_until[b] = step + tenure
+        tabu_until[a] = step + tenure
+        moves += 1
+        if state.penalty < best_pen:
+            best_pen, best_chrom = state.penalty, list(chrom)
+
+    if state.penalty > best_pen:
+        chrom[:] = best_chrom
+    # skor sudah diketahui dari delta → generasi berikutnya tidak perlu rescoring
+    individu.fitness_cache = 1.0 / (1.0 + best_pen)
+    m = metrics.active
+    if m is not None:
+        m.incr("memetic_evaluations", evals)
+        m.incr("memetic_moves", moves)
+    return SearchResult(1.0 / (1.0 + best_pen), best_pen, evals, moves)
+
+
+def improve_elites(
+    pop: List[Individuals],
+    fits: List[float],
+    elites: int = 2,
+    method: str = "tabu",
+    max_evals: int = 200,
+    time_budget: Optional[float] = None,
+) -> int:
+    """
+    Local search pada 'elites' individu terbaik; 'fits' dan fitness_cache
+    elit diperbarui dari delta (sama dengan fitness()). time_budget = detik
+    untuk semua elit. Return total gerakan yang dinilai.
+    """
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    ranked = sorted(range(len(pop)), key=lambda k: fits[k], reverse=True)
+    total = 0
+    for k in ranked[:elites]:
+        if fits[k] >= 1.0:
+            continue
+        res = local_search(pop[k], method, max_evals, deadline)
+        fits[k] = res.fitness
+        total += res.evaluations
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+    return total
@@ -0,0 +1,169 @@
+"""
+Instrumentasi opt-in: waktu per fase per generasi + counter.
+
+    import metrics
+    with metrics.collect() as m:
+        solve(GAConfig(seed=1, max_iter=20))
+    m.dump_json("metrics.json")
+    m.dump_folded("profile.folded")  # flamegraph.pl / speedscope
+
+Selama tidak aktif (default), 'active' = None: hot path cukup cek
+`metrics.active is not None` sekali per panggilan (bukan per gene), dan
+phase() mengembalikan context manager no-op yang sama.
+
+- phase(name): fase bersarang; waktu disimpan per generasi (inklusif) dan
+  sebagai stack "a;b;c" dengan self time untuk format folded flamegraph.
+- incr(name, n): counter global + per generasi.
+- next_generation(gen): dipanggil loop GA di awal tiap generasi.
+"""
+
+import functools
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ("m", "name", "t0", "child")
+
+    def __init__(self, m: "Metrics", name: str):
+        self.m, self.name = m, name
+
+    def __enter__(self):
+        self.child = 0.0
+        self.m._stack.append(self)
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        dt = time.perf_counter() - self.t0
+        m = self.m
+        m._stack.pop()
+        gen = m.current
+        gen[self.name] = gen.get(self.name, 0.0) + dt
+        m.totals[self.name] = m.totals.get(self.name, 0.0) + dt
+        key = ";".join([p.name for p in m._stack] + [self.name])
+        m.stacks[key] = m.stacks.get(key, 0.0) + dt - self.child
+        if m._stack:
+            m._stack[-1].child += dt
+        return False
+
+
+def _has_data(gen: dict) -> bool:
+    return gen["generation"] is not None or len(gen) > 2 or bool(gen["counters"])
+
+
+class Metrics:
+    def __init__(self):
+        self.counters: Dict[str, int] = {}
+        self.totals: Dict[str, float] = {}  # detik per fase (inklusif)
+        self.stacks: Dict[str, float] = {}  # "a;b;c" → self time (detik)
+        # generasi[i]: {"generation": g, "<fase>": detik, "counters": {...}}
+        self.generations: List[dict] = []
+        self.current: dict = {"generation": None, "counters": {}}
+        self._stack: List[_Phase] = []
+
+    def phase(self, name: str) -> _Phase:
+        return _Phase(self, name)
+
+    def incr(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+        c = self.current["counters"]
+        c[name] = c.get(name, 0) + n
+
+    def next_generation(self, generation: int):
+        if _has_data(self.current):
+            self.generations.append(self.current)
+        self.current = {"generation": generation, "counters": {}}
+
+    def _all_generations(self) -> List[dict]:
+        return self.generations + ([self.current] if _has_data(self.current) else [])
+
+    def to_dict(self) -> dict:
+        return {
+            "totals": dict(self.totals),
+            "counters": dict(self.counters),
+            "generations": self._all_generations(),
+        }
+
+    def dump_json(self, path: str):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def dump_folded(self, path: str):
+        """Format folded stack (satu baris 'a;b;c <mikrodetik>'), untuk flamegraph.pl/speedscope."""
+        with open(path, "w") as f:
+            for key, sec in sorted(self.stacks.items()):
+                us = int(round(sec * 1e6))
+                if us > 0:
+                    f.write(f"{key} {us}\n")
+
+
+active: Optional[Metrics] = None
+
+
+def enable(m: Optional[Metrics] = None) -> Metrics:
+    global active
+    active = m if m is not None else Metrics()
+    return active
+
+
+def disable() -> Optional[Metrics]:
+    global active
+    prev, active = active, None
+    return prev
+
+
+@contextmanager
+def collect(m: Optional[Metrics] = None):
+    """Aktifkan instrumentasi di dalam blok 'with'; metrics sebelumnya dipulihkan."""
+    global active
+    prev = active
+    cur = enable(m)
+    try:
+        yield cur
+    finally:
+        active = prev
+
+
+def phase(name: str):
+    """Context manager fase; no-op (objek yang sama) kalau instrumentasi mati."""
+    m = active
+    return _NULL if m is None else _Phase(m, name)
+
+
+def incr(name: str, n: int = 1):
+    m = active
+    if m is not None:
+        m.incr(name, n)
+
+
+def timed(name: str):
+    """Decorator: panggilan fungsi dicatat sebagai fase 'name' (kalau aktif)."""
+
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            m = active
+            if m is None:
+                return fn(*args, **kwargs)
+            with _Phase(m, name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return deco
@@ -1,10 +1,22 @@
 from typing import List, Set
-from data_type import Room, Gene, AssistantSchedule, Individuals, ruang_list
-from seeder import generate_population, generate_gene, _snap, display_gene
-from fitness import fitness, GRID, DAY_CLOSE, DAY_OPEN
-from crossover import crossover, repair_individual
+from data_type import Room, Gene, AssistantSchedule, Individuals
+from seeder import (
+    generate_population,
+    generate_gene,
+    _snap,
+    display_gene,
+    is_feasible_start,
+    random_start,
+)
+from fitness import fitness, breakdown, GRID, DAY_CLOSE, DAY_OPEN
+from crossover import crossover
+from repair import get_repair
+from occupancy import OccupancyGrid
+import metrics
 import random
 import argparse
+from functools import partial
+import json
 import sys
 
 
@@ -13,10 +25,16 @@ def parse_args():
         description="GA scheduler runner with CLI args for individual length and population size"
     )
     p.add_argument(
-        "length_individu", type=int, help="Jumlah gen per individu (mis. 10)"
+        "length_individu",
+        type=int,
+        nargs="?",
+        help="Jumlah gen per individu (mis. 10); tidak perlu dengan --resume",
     )
     p.add_argument(
-        "length_population", type=int, help="Jumlah individu dalam populasi (mis. 20)"
+        "length_population",
+        type=int,
+        nargs="?",
+        help="Jumlah individu dalam populasi (mis. 20); tidak perlu dengan --resume",
     )
     p.add_argument(
         "--seed",
@@ -24,38 +42,201 @@ def parse_args():
         default=None,
         help="Optional random seed untuk reproducibility (default: None)",
     )
+    p.add_argument(
+        "--fitness-backend",
+        choices=["python", "numpy", "bitset"],
+        default="python",
+        help="Engine fitness: 'python' (heap per individu), 'numpy' (batch satu populasi) atau 'bitset' (bitmask slot)",
+    )
+    p.add_argument(
+        "--selection",
+        choices=["roulette", "sus", "tournament"],
+        default="roulette",
+        help="Operator seleksi untuk crossover (default: roulette)",
+    )
+    p.add_argument(
+        "--repair",
+        choices=["legacy", "conflict"],
+        default="legacy",
+        help="Repair setelah crossover/mutasi: 'legacy' (sisir semua gene) atau 'conflict' (hanya gene yang bentrok, repair.py)",
+    )
+    p.add_argument(
+        "--targeted-mutation",
+        action="store_true",
+        help="Mutasi memilih gene dari daftar gene yang bentrok (bukan acak dari seluruh kromosom)",
+    )
+    p.add_argument(
+        "--operators",
+        choices=["classic", "mixed", "adaptive"],
+        default="classic",
+        help="Operator GA: 'classic' (crossover.py + mutation.py), 'mixed' (try_crossover1 + try_mutation1, bobot statis) atau 'adaptive' (bobot dipelajari, operator_select.py); selain classic hanya serial",
+    )
+    p.add_argument(
+        "--operator-cost",
+        choices=["cpu", "calls"],
+        default="cpu",
+        help="Credit operator adaptif: kenaikan fitness per detik CPU ('cpu') atau per panggilan ('calls', deterministik)",
+    )
+    p.add_argument(
+        "--operator-weights",
+        default=None,
+        help="JSON bobot awal operator adaptif, mis. 'operator_stats' dari record terakhir --log-jsonl",
+    )
+    p.add_argument(
+        "--memetic",
+        choices=["tabu", "descent"],
+        default=None,
+        help="Local search (memetic.py) pada individu elit tiap generasi; tidak untuk --workers",
+    )
+    p.add_argument("--memetic-elites", type=int, default=2, help="Jumlah elit yang di-local-search")
+    p.add_argument(
+        "--memetic-evals",
+        type=int,
+        default=200,
+        help="Budget gerakan yang dinilai (delta) per individu",
+    )
+    p.add_argument(
+        "--memetic-time",
+        type=float,
+        default=None,
+        help="Budget detik per generasi untuk semua elit (opsional)",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Jalankan seeding, repair/mutasi/fitness paralel di N proses (populasi di shared memory)",
+    )
+    p.add_argument(
+        "--islands",
+        type=int,
+        default=None,
+        help="Island model: bagi populasi ke N pulau, tiap pulau satu proses",
+    )
+    p.add_argument(
+        "--migration-interval",
+        type=int,
+        default=5,
+        help="Migrasi antar pulau tiap M generasi (default: 5)",
+    )
+    p.add_argument(
+        "--migrants",
+        type=int,
+        default=2,
+        help="Jumlah individu terbaik yang dikirim per migrasi (default: 2)",
+    )
+    p.add_argument(
+        "--topology",
+        choices=["ring", "full"],
+        default="ring",
+        help="Topologi migrasi antar pulau (default: ring)",
+    )
+    p.add_argument(
+        "--log-jsonl",
+        default=None,
+        help="Tulis ringkasan tiap generasi (best/mean/worst, bentrok, waktu) ke file JSONL",
+    )
+    p.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Simpan checkpoint (populasi, fitness, generasi, state RNG) ke file ini",
+    )
+    p.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=10,
+        help="Checkpoint tiap N generasi (default: 10)",
+    )
+    p.add_argument(
+        "--resume",
+        default=None,
+        metavar="CHECKPOINT",
+        help="Lanjutkan run serial dari checkpoint (config & seed ikut checkpoint)",
+    )
+    p.add_argument(
+        "--metrics",
+        default=None,
+        help="Aktifkan instrumentasi; tulis waktu per fase per generasi + counter ke JSON ini",
+    )
+    p.add_argument(
+        "--profile",
+        default=None,
+        help="Aktifkan instrumentasi; tulis profil folded-stack (flamegraph) ke file ini",
+    )
     return p.parse_args()
 
 
-def mutation(pops: List[Individuals], rate=0.3):
+def mutate_individual(
+    ind: Individuals, rate=0.3, repair="legacy", targeted=False
+) -> bool:
+    """
+    Mutasi satu individu (in-place) lalu repair. Return True kalau dimutasi.
+    targeted=True → gene dipilih dari yang bentrok (fitness.breakdown), kalau ada.
+    """
+    if not (random.random() < rate and ind.chromosome):
+        return False
+    m = metrics.active
+    k = max(1, len(ind.chromosome) // 10)
+    pool = range(len(ind.chromosome))
+    if targeted:
+        genes = breakdown(ind).genes
+        if genes:
+            pool = genes
+            if m is not None:
+                m.incr("mutation_targeted")
+    idxs = random.sample(pool, k=min(k, len(pool)))
+    grid = OccupancyGrid(ind.chromosome)
+    for j in idxs:
+        g = ind.chromosome[j]
+        grid.remove_gene(g)
+        r = random.random()
+        if r < 0.4:
+            # try switch to a preferred room that fits capacity and is free
+            for rroom in g.preferred_lab or []:
+                if rroom.id == g.room_id:
+                    continue
+                if g.capacity > rroom.room_capacity:
+                    continue
+                if not grid.is_free(g.day, rroom.id, g.start_time, g.end_time):
+                    continue
+                g = ind.mutable_gene(j)
+                g.room_id = rroom.id
+                if m is not None:
+                    m.incr("mutation_room_swaps")
+                break
+        elif r < 0.8:
+            # ±30 minutes if within bounds (start sah menurut tabel, ruang masih kosong)
+            step = GRID
+            for delta in random.sample([step, -step, 2 * step, -2 * step], k=4):
+                s2, e2 = g.start_time + delta, g.end_time + delta
+                if is_feasible_start(g.day, s2, e2) and grid.is_free(
+                    g.day, g.room_id, s2, e2
+                ):
+                    g = ind.mutable_gene(j)
+                    g.start_time, g.end_time = s2, e2
+                    if m is not None:
+                        m.incr("mutation_grid_shifts")
+                    break
+        else:
+            # change day within 0..5; kalau start lama tidak sah di hari baru, ambil start sah acak
+            g = ind.mutable_gene(j)
+            g.day = random.randint(0, 5)
+            if not is_feasible_start(g.day, g.start_time, g.end_time):
+                s2 = random_start(g.day, g.end_time - g.start_time)
+                if s2 is not None:
+                    g.end_time = s2 + (g.end_time - g.start_time)
+                    g.start_time = s2
+            if m is not None:
+                m.incr("mutation_day_changes")
+        grid.add_gene(g)
+    get_repair(repair)(ind)
+    return True
+
+
+@metrics.timed("mutation")
+def mutation(pops: List[Individuals], rate=0.3, repair="legacy", targeted=False):
     for ind in pops:
-        if random.random() < rate and ind.chromosome:
-            k = max(1, len(ind.chromosome) // 10)
-            idxs = random.sample(range(len(ind.chromosome)), k=k)
-            for j in idxs:
-                g = ind.chromosome[j]
-                r = random.random()
-                if r < 0.4:
-                    # try switch to a preferred room that fits capacity and is free
-                    for rroom in g.preferred_lab or []:
-                        if rroom.id == g.room_id:
-                            continue
-                        if g.capacity > rroom.room_capacity:
-                            continue
-                        g.room_id = rroom.id
-                        break
-                elif r < 0.8:
-                    # ±30 minutes if within bounds
-                    step = GRID
-                    for delta in random.sample([step, -step, 2 * step, -2 * step], k=4):
-                        s2, e2 = g.start_time + delta, g.end_time + delta
-                        if DAY_OPEN <= s2 and e2 <= DAY_CLOSE:
-                            g.start_time, g.end_time = s2, e2
-                            break
-                else:
-                    # change day within 0..5
-                    g.day = random.randint(0, 5)
-            repair_individual(ind)
+        mutate_individual(ind, rate, repair, targeted)
     return pops
 
 
@@ -101,58 +282,173 @@ def mutation(pops: List[Individuals], rate=0.3):
 
 def main():
     args = parse_args()
+    m = metrics.enable() if (args.metrics or args.profile) else None
+    try:
+        run(args)
+    finally:
+        if m is not None:
+            metrics.disable()
+            if args.metrics:
+                m.dump_json(args.metrics)
+            if args.profile:
+                m.dump_folded(args.profile)
 
+
+def run(args):
     # print(args.length_individu, args.length_population)
 
-    if args.length_individu <= 0 or args.length_population <= 0:
-        print("length_individu dan length_population harus > 0", file=sys.stderr)
+    if args.memetic is not None and args.workers is not None and args.islands is None:
+        print("--memetic belum didukung untuk --workers", file=sys.stderr)
+        sys.exit(1)
+
+    if args.operators != "classic" and (args.workers is not None or args.islands is not None):
+        print("--operators selain classic hanya untuk loop serial", file=sys.stderr)
         sys.exit(1)
+    operator_weights = None
+    if args.operator_weights is not None:
+        with open(args.operator_weights) as f:
+            operator_weights = json.load(f)
+        # boleh satu record JSONL utuh dari --log-jsonl
+        operator_weights = operator_weights.get("operator_stats", operator_weights)
+
+    state = None
+    if args.resume is not None:
+        if args.islands is not None or args.workers is not None:
+            print("--resume hanya untuk loop serial", file=sys.stderr)
+            sys.exit(1)
+        from checkpoint import load
 
-    if args.seed is not None:
-        random.seed(args.seed)
+        state = load(args.resume)
+        population = None
+        print(f"resume dari generasi {state.generation}")
+    else:
+        if (args.length_individu or 0) <= 0 or (args.length_population or 0) <= 0:
+            print("length_individu dan length_population harus > 0", file=sys.stderr)
+            sys.exit(1)
 
-    # Mapping argumen:
-    # - arg1 = length_individu
-    # - arg2 = length_population
-    # generate_population(expectation): (length_population, length_individu)
-    population = generate_population(args.length_population, args.length_individu)
+        if args.seed is not None:
+            random.seed(args.seed)
+
+        # Mapping argumen:
+        # - arg1 = length_individu
+        # - arg2 = length_population
+        # generate_population(expectation): (length_population, length_individu)
+        # dengan --seed / --workers tiap individu punya stream RNG sendiri (identik berapapun worker)
+        population = generate_population(
+            args.length_population,
+            args.length_individu,
+            seed=args.seed,
+            workers=args.workers,
+        )
     print("done")
-    iteration = 0
-    step_vals = []
-
-    fitnesses = fitness(population)
-    if max(fitnesses) > 0.9:
-        print(f"Pada iterasi {int(iteration+1)}: {max(fitnesses)}")
-        index = fitnesses.index(max(fitnesses))
-        print(f"index of fitness 1 individu: {index}")
-        print(population[index].to_dataframe())
-        population[index].save_dataframe()
-    while max(fitnesses) < 1.0:
-        iteration += 1
-        cross = crossover(fitnesses, population)
-        fitnesses = fitness(cross)
-        print(f"[{iteration}] max fitness from crossover: {max(fitnesses)}")
-        if max(fitnesses) > 0.9:
-            print(f"Pada iterasi {int(iteration+1)}: {max(fitnesses)}")
-            step_vals.append(max(fitnesses))
-            index = fitnesses.index(max(fitnesses))
-            print(f"index of fitness 1 individu: {index}")
-            print(cross[index].to_dataframe())
-            cross[index].save_dataframe()
-            break
-
-        mutate = mutation(cross)
-        fitnesses = fitness(mutate)
-        print(f"[{iteration}] max fitness from mutation: {max(fitnesses)}")
-        if max(fitnesses) >= 0.99:
-            print(f"Pada iterasi {int(iteration+1)}: {max(fitnesses)}")
-            step_vals.append(max(fitnesses))
-            index = fitnesses.index(max(fitnesses))
-            print(f"index of fitness 1 individu: {index}")
-            print(mutate[index].to_dataframe())
-            mutate[index].save_dataframe()
-            break
-
-
-# if __name__ == "__main__":
-main()
+
+    if args.islands is not None:
+        from islands import run_islands
+
+        res = run_islands(
+            population,
+            args.islands,
+            seed=args.seed,
+            interval=args.migration_interval,
+            migrants=args.migrants,
+            topology=args.topology,
+            backend=args.fitness_backend,
+            selection=args.selection,
+            repair=args.repair,
+            targeted_mutation=args.targeted_mutation,
+            memetic=args.memetic,
+            memetic_elites=args.memetic_elites,
+            memetic_evals=args.memetic_evals,
+            memetic_time=args.memetic_time,
+        )
+        print(f"Pada iterasi {int(res.iteration+1)}: {res.fitness}")
+        print(res.best.to_dataframe())
+        res.best.save_dataframe()
+        return
+
+    if args.workers is not None:
+        from parallel import run_parallel
+
+        best, best_fit, iteration = run_parallel(
+            population,
+            args.workers,
+            seed=args.seed,
+            mutate_fn=partial(
+                mutate_individual,
+                repair=args.repair,
+                targeted=args.targeted_mutation,
+            ),
+            backend=args.fitness_backend,
+            selection=args.selection,
+            repair=args.repair,
+        )
+        print(f"Pada iterasi {int(iteration+1)}: {best_fit}")
+        print(best.to_dataframe())
+        best.save_dataframe()
+        return
+
+    from checkpoint import Checkpointer
+    from ga import GAConfig, evolve
+
+    if state is not None:
+        config = state.ga_config()
+    else:
+        config = GAConfig(
+            seed=args.seed,
+            fitness_backend=args.fitness_backend,
+            selection=args.selection,
+            repair=args.repair,
+            targeted_mutation=args.targeted_mutation,
+            operators=args.operators,
+            operator_cost=args.operator_cost,
+            operator_weights=operator_weights,
+            memetic=args.memetic,
+            memetic_elites=args.memetic_elites,
+            memetic_evals=args.memetic_evals,
+            memetic_time=args.memetic_time,
+        )
+    # resume tanpa --checkpoint → lanjut menulis ke file checkpoint yang sama
+    ck_path = args.checkpoint or args.resume
+    ck = None
+    if ck_path is not None:
+        ck = (
+            Checkpointer.resume_from(state, ck_path, args.checkpoint_every)
+            if state is not None
+            else Checkpointer(ck_path, args.checkpoint_every, config)
+        )
+    log = None
+    if args.log_jsonl:
+        log = open(args.log_jsonl, "a" if state is not None else "w")
+    try:
+        for rec in evolve(config, population=population, resume=state):
+            if log:
+                log.write(json.dumps(rec.to_dict()) + "\n")
+            if ck is not None and ck.due(rec):
+                ck.save(rec)
+            if rec.stage == "resume":
+                continue
+            if rec.stage == "init":
+                if rec.best > 0.9:
+                    print(f"Pada iterasi {int(rec.generation+1)}: {rec.best}")
+                    print(f"index of fitness 1 individu: {rec.best_index}")
+                    print(rec.individual.to_dataframe())
+                    rec.individual.save_dataframe()
+                continue
+            print(f"[{rec.generation}] max fitness from {rec.stage}: {rec.best}")
+            if rec.reached:
+                print(f"Pada iterasi {int(rec.generation+1)}: {rec.best}")
+                print(f"index of fitness 1 individu: {rec.best_index}")
+                print(rec.individual.to_dataframe())
+                rec.individual.save_dataframe()
+        if rec.operator_stats is not None:
+            weights = {k: v["weights"] for k, v in rec.operator_stats.items()}
+            print(f"bobot operator akhir: {json.dumps(weights)}")
+    finally:
+        if ck is not None:
+            ck.wait()
+        if log:
+            log.close()
+
+
+if __name__ == "__main__":
+    main()
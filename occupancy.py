@@ -0,0 +1,112 @@
+"""
+Indeks okupansi ruang per (day, room, slot GRID 30 menit).
+
+Tiap (day, room) punya list hitungan pemakaian per slot sejak 00:00, jadi
+cek bebas / reserve / release cukup O(jumlah slot interval), tanpa scan
+seluruh gene di hari itu. Hitungan (bukan bool) supaya gene yang masih
+bentrok tetap bisa di-release dengan benar.
+
+Waktu diasumsikan sudah di grid GRID (seeder, repair & mutasi selalu
+snap/geser per GRID). Interval yang tidak pas grid dianggap menempati
+semua slot yang disentuhnya.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from data_type import Gene, Room
+from fitness import DAY_CLOSE, DAY_OPEN, GRID
+
+SLOTS_PER_DAY = 24 * 3600 // GRID
+
+
+def slot_bounds(s: int, e: int) -> Tuple[int, int]:
+    """Index slot [lo, hi) yang ditempati interval [s, e)."""
+    lo = s // GRID
+    return (lo if lo > 0 else 0), -(-e // GRID)
+
+
+class OccupancyGrid:
+    def __init__(self, genes: Iterable[Gene] = ()):
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for g in genes:
+            self.add_gene(g)
+
+    def _row(self, day: int, room_id: int) -> List[int]:
+        row = self.cells.get((day, room_id))
+        if row is None:
+            row = self.cells[(day, room_id)] = [0] * SLOTS_PER_DAY
+        return row
+
+    # ---------- update ----------
+    def reserve(self, day: int, room_id: int, s: int, e: int):
+        row = self._row(day, room_id)
+        lo, hi = slot_bounds(s, e)
+        row[lo:hi] = [c + 1 for c in row[lo:hi]]
+
+    def release(self, day: int, room_id: int, s: int, e: int):
+        row = self._row(day, room_id)
+        lo, hi = slot_bounds(s, e)
+        row[lo:hi] = [c - 1 for c in row[lo:hi]]
+
+    def add_gene(self, g: Gene):
+        self.reserve(g.day, g.room_id, g.start_time, g.end_time)
+
+    def remove_gene(self, g: Gene):
+        self.release(g.day, g.room_id, g.start_time, g.end_time)
+
+    # ---------- query ----------
+    def is_free(self, day: int, room_id: int, s: int, e: int) -> bool:
+        row = self.cells.get((day, room_id))
+        if row is None:
+            return True
+        lo, hi = slot_bounds(s, e)
+        return not any(row[lo:hi])
+
+    def is_clashing(self, g: Gene) -> bool:
+        """True kalau slot gene (yang sudah di-reserve) juga dipakai gene lain."""
+        row = self.cells.get((g.day, g.room_id))
+        if row is None:
+            return False
+        lo, hi = slot_bounds(g.start_time, g.end_time)
+        return hi > lo and max(row[lo:hi]) > 1
+
+    def first_free_slot(
+        self,
+        day: int,
+        room_id: int,
+        dur: int,
+        earliest: int = DAY_OPEN,
+        latest: int = DAY_CLOSE,
+        allowed=None,
+        starts: Optional[Iterable[int]] = None,
+    ) -> Optional[int]:
+        """
+        Start paling awal (di grid) pada [earliest, latest - dur] yang ruangnya bebas.
+        allowed(day, s, e) opsional untuk aturan tambahan (mis. _allowed_in_day).
+        starts opsional: kandidat start yang sudah pasti sah (urut naik, mis.
+        seeder.feasible_starts) — dipakai menggantikan scan grid + allowed.
+        """
+        row = self.cells.get((day, room_id))
+        if starts is None:
+            first = -(-earliest // GRID) * GRID
+            starts = range(first, latest - dur + 1, GRID)
+        else:
+            allowed = None
+        for s in starts:
+            if s < earliest or s + dur > latest:
+                continue
+            lo, hi = slot_bounds(s, s + dur)
+            if row is None or not any(row[lo:hi]):
+                if allowed is None or allowed(day, s, s + dur):
+                    return s
+        return None
+
+    def free_rooms(
+        self, day: int, s: int, e: int, rooms: Iterable[Room], capacity: int = 0
+    ) -> List[Room]:
+        """Ruang di 'rooms' yang bebas di [s, e) dan muat 'capacity' peserta."""
+        return [
+            r
+            for r in rooms
+            if capacity <= r.room_capacity and self.is_free(day, r.id, s, e)
+        ]
@@ -0,0 +1,104 @@
+"""
+Pemilihan operator adaptif (adaptive pursuit, Thierens 2005).
+
+Tiap operator punya peluang dipilih p (awal = bobot statis yang dinormalisasi)
+dan kualitas q = rata-rata eksponensial dari reward:
+
+    reward = max(kenaikan fitness, 0) / biaya
+    biaya  = detik CPU operator (cost="cpu") atau 1 per panggilan (cost="calls")
+
+Setelah tiap credit(), p operator dengan q tertinggi dikejar ke p_max dan yang
+lain ke p_min (p_max = 1 - (K-1)·p_min), jadi operator yang jarang berguna
+tetap sesekali dicoba. Selama belum ada reward positif, p tidak diubah.
+
+cost="cpu" mengikuti biaya nyata tapi membuat run ber-seed tidak identik
+bit-per-bit (waktu CPU berbeda tiap run); cost="calls" deterministik.
+
+    ap = AdaptivePursuit({"one_point": 2, "two_point": 3})
+    name = ap.choose()
+    ...
+    ap.credit(name, gain, seconds)
+    ap.to_dict()["weights"]  # bisa dipakai lagi sebagai bobot awal
+    AdaptivePursuit.from_dict(ap.to_dict())  # state lengkap (checkpoint/resume)
+"""
+
+import random
+from typing import Dict
+
+COSTS = ("cpu", "calls")
+
+
+class AdaptivePursuit:
+    def __init__(
+        self,
+        weights: Dict[str, float],
+        p_min: float = None,
+        alpha: float = 0.3,
+        beta: float = 0.3,
+        cost: str = "cpu",
+    ):
+        if not weights:
+            raise ValueError("weights kosong")
+        if cost not in COSTS:
+            raise ValueError(f"Unknown cost: {cost}. Use one of {COSTS}")
+        total = float(sum(weights.values()))
+        if total <= 0 or any(w < 0 for w in weights.values()):
+            raise ValueError("bobot harus >= 0 dan totalnya > 0")
+        self.names = list(weights)
+        k = len(self.names)
+        self.p_min = min(0.05, 0.5 / k) if p_min is None else p_min
+        if k * self.p_min >= 1:
+            raise ValueError("p_min terlalu besar untuk jumlah operator ini")
+        self.p_max = 1.0 - (k - 1) * self.p_min
+        self.alpha, self.beta, self.cost = alpha, beta, cost
+        self.p: Dict[str, float] = {n: weights[n] / total for n in self.names}
+        self.q: Dict[str, float] = dict.fromkeys(self.names, 0.0)
+        self.calls: Dict[str, int] = dict.fromkeys(self.names, 0)
+        self.gain: Dict[str, float] = dict.fromkeys(self.names, 0.0)
+        self.seconds: Dict[str, float] = dict.fromkeys(self.names, 0.0)
+
+    def choose(self, rng=random) -> str:
+        return rng.choices(self.names, weights=[self.p[n] for n in self.names])[0]
+
+    def credit(self, name: str, gain: float, seconds: float):
+        """Catat hasil satu pemakaian operator 'name' (gain = kenaikan fitness)."""
+        self.calls[name] += 1
+        self.gain[name] += gain
+        self.seconds[name] += seconds
+        c = max(seconds, 1e-6) if self.cost == "cpu" else 1.0
+        self.q[name] += self.alpha * (max(gain, 0.0) / c - self.q[name])
+
+        best = max(self.names, key=self.q.__getitem__)
+        if self.q[best] <= 0:
+            return
+        for n in self.names:
+            target = self.p_max if n == best else self.p_min
+            self.p[n] += self.beta * (target - self.p[n])
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        return dict(self.p)
+
+    def to_dict(self) -> dict:
+        """
+        Statistik per operator (JSON); 'weights' bisa dipakai sebagai bobot awal
+        run lain. Float disimpan utuh supaya from_dict() memulihkan state persis.
+        """
+        return {
+            "weights": {n: self.p[n] for n in self.names},
+            "quality": {n: self.q[n] for n in self.names},
+            "calls": dict(self.calls),
+            "gain": dict(self.gain),
+            "seconds": dict(self.seconds),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict, **kwargs) -> "AdaptivePursuit":
+        """Kebalikan to_dict(): p, q, calls, gain & seconds dipulihkan apa adanya."""
+        ap = cls(d["weights"], **kwargs)
+        ap.p = {n: float(d["weights"][n]) for n in ap.names}
+        ap.q = {n: float(d["quality"][n]) for n in ap.names}
+        ap.calls = {n: int(d["calls"][n]) for n in ap.names}
+        ap.gain = {n: float(d["gain"][n]) for n in ap.names}
+        ap.seconds = {n: float(d["seconds"][n]) for n in ap.names}
+        return ap
@@ -0,0 +1,262 @@
+"""
+Mode paralel untuk runner GA (mutation.py --workers N).
+
+Populasi disimpan di shared memory sebagai PopulationArray (data_type.py):
+    gene  → index ke table gene statis (mata kuliah, asisten, preferred_lab, group)
+    placement (day, start, end, room) → penempatan yang berubah tiap generasi
+Table cuma dikirim sekali ke worker saat pool dibuat, jadi tiap generasi
+yang lewat antar proses hanya index individu & skor fitness.
+
+Seleksi + crossover (manipulasi baris array, murah) jalan di proses utama.
+Repair, mutasi dan fitness per individu dibagi ke worker. RNG tiap individu
+di-seed dari (seed, generasi, tahap, index) sehingga hasil sama persis
+berapapun jumlah worker.
+
+seed_population() membagi pembangkitan populasi awal ke worker dengan pola
+yang sama: individu ke-k selalu dibangkitkan dari seeder.individual_rng(seed, k).
+"""
+
+import multiprocessing as mp
+import random
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+from assistant_schedule import DAY_NAMES
+from context import GAContext
+from data_type import Gene, Individuals, PopulationArray
+from fitness import fitness
+from repair import get_repair
+from seeder import generate_one, individual_rng
+from selection import get_selection
+
+
+class SharedPopulation:
+    """PopulationArray (data_type.py) yang kolom-kolomnya menumpang di shared memory."""
+
+    def __init__(
+        self,
+        n_pop: int,
+        width: int,
+        table: List[Gene],
+        day_names: List[str],
+        name: Optional[str] = None,
+    ):
+        size = max(1, PopulationArray.nbytes(n_pop, width))
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.pa = PopulationArray.allocate(
+            n_pop, width, table, day_names, buffer=self.shm.buf
+        )
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self):
+        self.pa = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# ================== worker ==================
+
+_W: dict = {}
+
+
+def _init_worker(
+    shm_name, n_pop, width, table, day_names, mutate_fn, backend, repair="legacy"
+):
+    _W["shared"] = SharedPopulation(n_pop, width, table, day_names, name=shm_name)
+    _W["mutate"] = mutate_fn
+    _W["backend"] = backend
+    _W["repair"] = get_repair(repair)
+
+
+def _task_seed(base_seed: int, generation: int, stage: str, k: int) -> str:
+    return f"{base_seed}:{generation}:{stage}:{k}"
+
+
+def _run_task(task) -> List[Tuple[int, float]]:
+    stage, base_seed, generation, items = task
+    pa: PopulationArray = _W["shared"].pa
+    n_table, n_names = len(pa.table), len(pa.day_names)
+    out = []
+    for k, reps in items:
+        ind = pa.individual(k)
+        random.seed(_task_seed(base_seed, generation, stage, k))
+        if stage == "repair":
+            for _ in range(reps):
+                _W["repair"](ind)
+        elif stage == "mutate":
+            _W["mutate"](ind)
+        if stage != "eval":
+            pa.set_individual(k, ind)
+            # table & day_names adalah salinan per proses, jadi tidak boleh bertambah di worker
+            if len(pa.table) != n_table or len(pa.day_names) != n_names:
+                raise RuntimeError("operator di worker tidak boleh membuat gene baru")
+        out.append((k, fitness([ind], backend=_W["backend"])[0]))
+    return out
+
+
+def _init_seed_worker(ctx: GAContext):
+    _W["ctx"] = ctx
+
+
+def _seed_task(task) -> List[Tuple[int, Individuals]]:
+    n_ind, base_seed, ks = task
+    ctx: GAContext = _W["ctx"]
+    return [
+        (k, generate_one(n_ind, ctx.rooms, ctx, individual_rng(base_seed, k)))
+        for k in ks
+    ]
+
+
+# ================== main process ==================
+
+
+def _crossover_rows(
+    pa: PopulationArray,
+    fitnesses: List[float],
+    rng: random.Random,
+    rate=0.5,
+    selection="roulette",
+) -> List[int]:
+    """
+    Versi array dari crossover.crossover(): seleksi + one-point langsung pada
+    baris PopulationArray. Return index individu yang benar-benar di-crossover.
+    """
+    N = pa.n_pop
+    pa.take(get_selection(selection)(fitnesses, N, rng=rng))
+
+    L = int(pa.lengths.min())
+    cand = [i for i in range(N) if rng.random() < rate]
+    if len(cand) < 2 or L < 2:
+        return []
+
+    crossed = []
+    for i in range(0, len(cand) - 1, 2):
+        a, b = cand[i], cand[i + 1]
+        pa.swap_tails(a, b, rng.randint(1, L - 1))
+        crossed += [a, b]
+    return crossed
+
+
+def _chunks(items: list, n_chunks: int) -> List[list]:
+    size = max(1, -(-len(items) // n_chunks))
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _relink(ind: Individuals, ctx: GAContext, rooms: Dict[tuple, object]):
+    """Ganti salinan asisten & Room hasil pickle dengan objek milik ctx (dipakai bersama lagi)."""
+    pool = ctx.assistants
+    for g in ind.chromosome:
+        g.assistant = [pool.get(a.id) for a in g.assistant]
+        g.preferred_lab = [
+            rooms[(r.id, r.room_name, r.room_capacity)] for r in g.preferred_lab
+        ]
+
+
+def seed_population(
+    n_ind: int, n_pop: int, ctx: GAContext, seed: int, workers: int
+) -> List[Individuals]:
+    """
+    Populasi awal dibangkitkan paralel. ctx (Rooms, pool asisten, katalog) dibuat
+    di proses utama lalu dikirim sekali ke tiap worker; individu ke-k memakai
+    stream individual_rng(seed, k), jadi hasilnya identik dengan jalur serial.
+    """
+    # pastikan semua data acak di ctx sudah dibuat sebelum pool (bukan di worker)
+    ctx.rooms, ctx.assistants, ctx.subjects
+    tasks = [(n_ind, seed, ks) for ks in _chunks(list(range(n_pop)), workers * 4)]
+    population: List[Individuals] = [None] * n_pop
+    with mp.Pool(workers, initializer=_init_seed_worker, initargs=(ctx,)) as pool:
+        for part in pool.imap_unordered(_seed_task, tasks):
+            for k, ind in part:
+                population[k] = ind
+
+    rooms = {(r.id, r.room_name, r.room_capacity): r for r in ctx.rooms}
+    for ind in population:
+        _relink(ind, ctx, rooms)
+    return population
+
+
+def run_parallel(
+    population: List[Individuals],
+    workers: int,
+    seed: Optional[int] = None,
+    mutate_fn: Callable[[Individuals], object] = None,
+    backend: str = "python",
+    max_iter: Optional[int] = None,
+    selection="roulette",
+    repair="legacy",
+) -> Tuple[Individuals, float, int]:
+    """
+    Loop GA paralel. Return (individu terbaik, fitness-nya, jumlah iterasi).
+    Berhenti sama seperti main(): > 0.9 setelah crossover, >= 0.99 setelah mutasi.
+    """
+    if mutate_fn is None:
+        raise ValueError("mutate_fn wajib diisi (mis. mutation.mutate_individual)")
+    base_seed = seed if seed is not None else random.getrandbits(64)
+    rng = random.Random(base_seed)
+
+    # table & nama hari dibekukan sebelum pool dibuat supaya semua proses sama
+    local = PopulationArray.from_individuals(population)
+    day_names = list(dict.fromkeys(list(DAY_NAMES.values()) + local.day_names))
+    shared = SharedPopulation(local.n_pop, local.width, local.table, day_names)
+    pa = shared.pa
+    pa.gene[:] = -1
+    for k, ind in enumerate(population):
+        pa.set_individual(k, ind)
+
+    pool = mp.Pool(
+        workers,
+        initializer=_init_worker,
+        initargs=(
+            shared.name,
+            pa.n_pop,
+            pa.width,
+            pa.table,
+            pa.day_names,
+            mutate_fn,
+            backend,
+            repair,
+        ),
+    )
+    n_chunks = workers * 4
+
+    def run_stage(stage: str, generation: int, reps: Dict[int, int]) -> List[float]:
+        items = [(k, reps.get(k, 1)) for k in range(pa.n_pop)]
+        tasks = [(stage, base_seed, generation, c) for c in _chunks(items, n_chunks)]
+        fits = [0.0] * pa.n_pop
+        for part in pool.map(_run_task, tasks):
+            for k, f in part:
+                fits[k] = f
+        return fits
+
+    try:
+        iteration = 0
+        fitnesses = run_stage("eval", iteration, {})
+        while max(fitnesses) < 1.0 and (max_iter is None or iteration < max_iter):
+            iteration += 1
+            crossed = _crossover_rows(pa, fitnesses, rng, selection=selection)
+            # sama seperti crossover(): pasangan di-repair, lalu light pass semua
+            fitnesses = run_stage("repair", iteration, {k: 2 for k in crossed})
+            print(f"[{iteration}] max fitness from crossover: {max(fitnesses)}")
+            if max(fitnesses) > 0.9:
+                break
+
+            fitnesses = run_stage("mutate", iteration, {})
+            print(f"[{iteration}] max fitness from mutation: {max(fitnesses)}")
+            if max(fitnesses) >= 0.99:
+                break
+
+        best = fitnesses.index(max(fitnesses))
+        return pa.individual(best), fitnesses[best], iteration
+    finally:
+        pool.close()
+        pool.join()
+        shared.close()
@@ -0,0 +1,201 @@
+"""
+Repair berbasis daftar bentrok (conflict-driven).
+
+repair_individual (crossover.py) menyisir semua gene tiap hari dan hanya
+menangani bentrok ruang & group. repair_conflicts di sini:
+
+1. clamp gene yang di luar jam / nabrak lunch (sama seperti repair lama);
+2. sweep line per resource (hari+ruang, hari+group, hari+asisten), seperti
+   fitness._count_pairs, menghasilkan daftar pasangan gene yang bentrok;
+3. hanya gene di daftar itu yang dipindah, urut derajat bentrok (berbobot
+   ALPHA/BETA/GAMMA) terbesar dulu: pindah ruang dalam preferred_lab atau
+   geser ±1..4 GRID, dipilih yang paling menurunkan penalty (delta_fitness).
+
+Individu tanpa bentrok cukup satu sweep O(n log n); biaya sisanya sebanding
+jumlah gene yang bentrok. Deterministik (tanpa RNG), jadi bisa dipakai di
+operator mana pun tanpa menggeser stream random.
+
+    repair="legacy"   → crossover.repair_individual (default, hasil seed lama)
+    repair="conflict" → repair_conflicts
+"""
+
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import metrics
+from data_type import Individuals
+from delta_fitness import WEIGHTS, ConflictState, _bucket_keys
+from fitness import DAY_OPEN, GRID, _snap
+from seeder import _allowed_in_day, feasible_starts, is_feasible_start
+
+Repair = Callable[[Individuals], object]
+
+SHIFTS = (1, -1, 2, -2, 3, -3, 4, -4)
+
+
+def conflict_pairs(chromosome, keys=None) -> List[Tuple[int, int, int]]:
+    """
+    Semua pasangan bentrok (jenis, i, j), i <= j, dengan jenis ROOM/GROUP/ASST
+    (delta_fitness). Jumlah per jenis = fitness.conflicts(individu).
+    keys: _bucket_keys tiap gene kalau sudah dihitung caller.
+    """
+    if keys is None:
+        keys = [_bucket_keys(g) for g in chromosome]
+    return _pairs(chromosome, _buckets(keys))
+
+
+def _buckets(keys) -> Dict[tuple, List[int]]:
+    buckets: Dict[tuple, List[int]] = {}
+    for j, ks in enumerate(keys):
+        for key in ks:
+            buckets.setdefault(key, []).append(j)
+    return buckets
+
+
+def _pairs(chromosome, buckets: Dict[tuple, List[int]]) -> List[Tuple[int, int, int]]:
+    """Sweep seperti fitness._count_pairs per bucket (urut start lalu index gene)."""
+    pairs: List[Tuple[int, int, int]] = []
+    for (kind, _), members in buckets.items():
+        if len(members) < 2:
+            continue
+        members = sorted(members, key=lambda j: (chromosome[j].start_time, j))
+        active: List[Tuple[int, int]] = []  # heap (end, index) interval yang masih terbuka
+        for j in members:
+            g = chromosome[j]
+            while active and active[0][0] <= g.start_time:
+                heapq.heappop(active)
+            for _, i in active:
+                pairs.append((kind, i, j) if i < j else (kind, j, i))
+            heapq.heappush(active, (g.end_time, j))
+    return pairs
+
+
+def _best_move(state: ConflictState, j: int, here: float) -> Optional[dict]:
+    """
+    Pindahan gene j dengan delta penalty paling negatif (None kalau tidak ada).
+    here = state.placement_penalty(j) yang sudah dihitung caller.
+    """
+    chrom = state.individu.chromosome
+    g = chrom[j]
+    best, best_delta = None, 0.0
+
+    for r in g.preferred_lab or []:
+        if r.id == g.room_id or g.capacity > r.room_capacity:
+            continue
+        d = state.placement_penalty(j, room_id=r.id) - here
+        if d < best_delta:
+            best, best_delta = {"room_id": r.id}, d
+
+    # geser waktu: bucket gene j tidak berubah, jadi interval gene lain cukup
+    # dikumpulkan sekali lalu dihitung ulang per kandidat (aturan pair_counted,
+    # inline karena ini loop terpanas repair)
+    iv = [
+        (chrom[k].start_time, chrom[k].end_time, k, WEIGHTS[key[0]])
+        for key in state.keys[j]
+        for k in state.buckets[key]
+        if k != j
+    ]
+    # gene di grid: geseran GRID tetap di grid → cukup lookup tabel start
+    allowed = is_feasible_start if g.start_time % GRID == 0 else _allowed_in_day
+    for mul in SHIFTS:
+        s2, e2 = g.start_time + mul * GRID, g.end_time + mul * GRID
+        if not allowed(g.day, s2, e2):
+            continue
+        cost = 0.0
+        for xs, xe, k, w in iv:
+            if xs < s2 or (xs == s2 and k < j):
+                if xe > s2:
+                    cost += w
+            elif e2 > xs:
+                cost += w
+        d = cost - here
+        if d < best_delta:
+            best, best_delta = {"start_time": s2, "end_time": e2}, d
+    return best
+
+
+@metrics.timed("repair")
+def repair_conflicts(individu: Individuals, passes: int = 2) -> int:
+    """Perbaiki bentrok in-place (copy-on-write per gene). Return jumlah gene yang dipindah."""
+    m = metrics.active
+    chrom = individu.chromosome
+
+    for j, g in enumerate(chrom):
+        if not _allowed_in_day(g.day, g.start_time, g.end_time):
+            dur = g.end_time - g.start_time
+            g = individu.mutable_gene(j)
+            starts = feasible_starts(g.day, dur)
+            g.start_time = starts[0] if starts else _snap(DAY_OPEN)
+            g.end_time = g.start_time + dur
+            if m is not None:
+                m.incr("repair_clamps")
+
+    # bucket tiap gene dihitung sekali; pass berikutnya pakai bucket di state
+    moves = 0
+    keys = [_bucket_keys(g) for g in chrom]
+    buckets = _buckets(keys)
+    state: Optional[ConflictState] = None
+    for _ in range(passes):
+        if state is None:
+            pairs = _pairs(chrom, buckets)
+        elif state.penalty:
+            pairs = _pairs(chrom, state.buckets)
+        else:
+            break  # jumlah bentrok dari delta sudah 0, tanpa sweep lagi
+        if m is not None:
+            m.incr("repair_conflict_pairs", len(pairs))
+        if not pairs:
+            break
+        degree: Dict[int, float] = {}
+        for kind, i, j in pairs:
+            w = WEIGHTS[kind]
+            degree[i] = degree.get(i, 0.0) + w
+            degree[j] = degree.get(j, 0.0) + w
+        if state is None:
+            # hanya individu yang bentrok yang butuh state delta; bucket &
+            # jumlah pasangan diambil dari sweep di atas
+            counts = [0, 0, 0]
+            for kind, _, _ in pairs:
+                counts[kind] += 1
+            state = ConflictState.from_sweep(individu, keys, buckets, counts)
+
+        moved = 0
+        for j in sorted(degree, key=lambda k: (-degree[k], k)):
+            here = state.placement_penalty(j)
+            if here == 0:
+                continue  # bentroknya sudah hilang karena gene lain dipindah
+            if m is not None:
+                m.incr("repair_conflict_attempts")
+            best = _best_move(state, j, here)
+            if best is not None:
+                # apply_move membuat Gene baru → tandai bukan milik bersama
+                state.apply_move(j, shared=False, **best)
+                moved += 1
+        if m is not None:
+            m.incr("repair_conflict_moves", moved)
+        moves += moved
+        if not moved:
+            break
+    return moves
+
+
+def _legacy(individu: Individuals):
+    from crossover import repair_individual
+
+    return repair_individual(individu)
+
+
+REPAIRS: Dict[str, Repair] = {
+    "legacy": _legacy,
+    "conflict": repair_conflicts,
+}
+
+
+def get_repair(repair: Union[str, Repair]) -> Repair:
+    """Terima nama ('legacy', 'conflict') atau callable(individu)."""
+    if callable(repair):
+        return repair
+    try:
+        return REPAIRS[repair]
+    except KeyError:
+        raise ValueError(f"Unknown repair: {repair}. Use one of {sorted(REPAIRS)}") from None
@@ -1,37 +1,33 @@
-import random, uuid
+import copy, random, uuid
 
-from data_type import Room, Gene, AssistantSchedule, Individuals, ruang_list
+from data_type import Room, Gene, AssistantSchedule, Individuals, new_id
 
-from dataset import dataset_df
+from context import GAContext, default_context
 
 from dataclasses import asdict
 
-from typing import List, Tuple, Set
+from typing import Dict, List, Tuple, Set, Optional
 
-from assistant_schedule import generate_jadwal
-
-from fitness import DAY_CLOSE, DAY_OPEN, _snap, overlap
+from fitness import DAY_CLOSE, DAY_OPEN, GRID, _snap, overlap
+from occupancy import OccupancyGrid
+import metrics
 
 
 def generate_assistant(N) -> List[AssistantSchedule]:
-    result: List[AssistantSchedule] = []
-    for _ in range(N):
-        temp = generate_jadwal()
-        schedule = AssistantSchedule(
-            id=uuid.uuid4().hex,  # ← move UUID creation inside the loop
-            day_name=temp["Hari"].tolist(),
-            day=temp["Hari_ke"].tolist(),
-            start_time=temp["Mulai (detik)"].tolist(),
-            end_time=temp["Selesai (detik)"].tolist(),
-            duration=temp["Durasi (menit)"].tolist(),
-            sks=temp["SKS"].tolist(),
-        )
-        result.append(schedule)
-    return result
+    """N asisten baru (di luar pool), jadwal sibuk dibangkitkan sekaligus."""
+    from assistants import AssistantPool
+
+    return AssistantPool.generate(N).schedules
+
 
+def _ctx(ctx: Optional[GAContext]) -> GAContext:
+    return ctx if ctx is not None else default_context()
 
-def generate_rooms() -> Room:
+
+def generate_rooms(ruang_list: Optional[List[int]] = None) -> Room:
     result: Room
+    if ruang_list is None:
+        ruang_list = default_context().ruang_list
     room_id = random.choice(ruang_list)
     room_name = "Ruang " + str(room_id)
     room_capacity = random.randint(20, 30)
@@ -39,7 +35,12 @@ def generate_rooms() -> Room:
     return result
 
 
-Rooms = [generate_rooms() for _ in ruang_list]
+def __getattr__(name):
+    # Rooms dulu dibangun saat import; sekarang lazy dari context default
+    if name == "Rooms":
+        return default_context().rooms
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 FORBIDDEN_WINDOWS = {
     4: [(12 * 3600, 13 * 3600)],  # 12:00–13:00 harus kosong
@@ -60,30 +61,112 @@ def _allowed_in_day(day: int, s: int, e: int) -> bool:
     return True
 
 
-def generate_subject():
-    subject = dataset_df.sample(n=1).iloc[0]
-    subject_name = subject["nama_matakuliah"]
-    subject_id = subject["kode_matakuliah"]
-    semester = subject["semester"]
-    capacity = subject["jumlah_peserta"]
-    sks = subject["sks_praktek"]
-    class_code = subject["kode_kelas"]
+# ---------- tabel start yang sah per (day, durasi) ----------
+# (list urut, set) start di grid GRID yang lolos _allowed_in_day. Diisi lazy per
+# (day, dur) dan dibuang otomatis kalau DAY_OPEN / DAY_CLOSE / GRID di modul ini
+# di-rebind atau FORBIDDEN_WINDOWS diubah (juga in-place). Cek per lookup hanya
+# 3 perbandingan int + == dict kecil terhadap salinan terakhir, tanpa membangun key.
+_start_table: Dict[Tuple[int, int], Tuple[List[int], frozenset]] = {}
+_start_bounds = (None, None, None)  # (DAY_OPEN, DAY_CLOSE, GRID) saat tabel dibangun
+_start_windows: dict = {}  # deepcopy FORBIDDEN_WINDOWS saat tabel dibangun
+
+
+def clear_start_table():
+    """Buang tabel start (lookup berikutnya membangun ulang dari konfigurasi sekarang)."""
+    global _start_bounds
+    _start_table.clear()
+    _start_bounds = (None, None, None)
+
+
+def set_forbidden_windows(windows: Dict[int, List[Tuple[int, int]]]):
+    """Ganti FORBIDDEN_WINDOWS (in-place, jadi modul lain ikut melihat) dan buang tabel start."""
+    FORBIDDEN_WINDOWS.clear()
+    FORBIDDEN_WINDOWS.update({d: list(w) for d, w in windows.items()})
+    clear_start_table()
+
+
+def _start_entry(day: int, dur: int) -> Tuple[List[int], frozenset]:
+    global _start_bounds, _start_windows
+    b = _start_bounds
+    if (
+        b[0] != DAY_OPEN
+        or b[1] != DAY_CLOSE
+        or b[2] != GRID
+        or _start_windows != FORBIDDEN_WINDOWS
+    ):
+        _start_table.clear()
+        _start_bounds = (DAY_OPEN, DAY_CLOSE, GRID)
+        _start_windows = copy.deepcopy(FORBIDDEN_WINDOWS)
+    entry = _start_table.get((day, dur))
+    if entry is None:
+        first = -(-DAY_OPEN // GRID) * GRID
+        starts = [
+            s
+            for s in range(first, DAY_CLOSE - dur + 1, GRID)
+            if _allowed_in_day(day, s, s + dur)
+        ]
+        entry = _start_table[(day, dur)] = (starts, frozenset(starts))
+    return entry
+
+
+def feasible_starts(day: int, dur: int) -> List[int]:
+    """Semua start sah (urut naik) untuk kelas 'dur' detik di hari 'day'."""
+    return _start_entry(day, dur)[0]
+
+
+def is_feasible_start(day: int, s: int, e: int) -> bool:
+    """Sama dengan _allowed_in_day untuk interval di grid, lewat lookup set."""
+    return s in _start_entry(day, e - s)[1]
+
+
+def random_start(day: int, dur: int, rng=random) -> Optional[int]:
+    """Start sah acak (uniform) atau None kalau durasi tidak muat di hari itu."""
+    starts = _start_entry(day, dur)[0]
+    return rng.choice(starts) if starts else None
+
 
-    return (subject, subject_name, subject_id, semester, capacity, sks, class_code)
+def generate_subjects(
+    n: int, ctx: Optional[GAContext] = None, rng=random
+) -> List[Tuple]:
+    """n subject acak sekaligus dari SubjectTable (lihat generate_subject)."""
+    table = _ctx(ctx).subjects
+    return table.rows(table.sample(n, rng))
 
 
-def generate_gene(rooms: List[Room]) -> List[Gene]:
+def generate_subject(ctx: Optional[GAContext] = None):
+    """
+    (index baris, subject_name, subject_id, semester, capacity, sks, class_code).
+    Elemen pertama dulu Series pandas; sekarang index baris di SubjectTable.
+    """
+    return generate_subjects(1, ctx)[0]
+
+
+def generate_gene(
+    rooms: List[Room],
+    grid: Optional[OccupancyGrid] = None,
+    ctx: Optional[GAContext] = None,
+    subject: Optional[Tuple] = None,
+    rng=random,
+) -> List[Gene]:
+    """
+    grid (opsional): okupansi ruang gene lain di individu yang sama. Kalau ada,
+    tiap kelas diarahkan ke preferred_lab yang masih bebas / slot bebas pertama,
+    lalu slotnya di-reserve.
+    subject (opsional): baris hasil generate_subjects(); default ambil satu acak.
+    rng: sumber acak (default modul random); id gene juga diambil dari sini.
+    """
     result: List[Gene] = []
 
-    subject, subject_name, subject_id, semester, capacity, sks, class_code = (
-        generate_subject()
-    )
+    if subject is None:
+        subject = generate_subjects(1, ctx, rng)[0]
+    _, subject_name, subject_id, semester, capacity, sks, class_code = subject
     duration = 120 if sks == 1 else 180
     dur_sec = duration * 60
 
-    assistants = generate_assistant(random.randint(2, 5))
-    preferred_lab: List[Room] = random.sample(rooms, random.randint(1, 4))
-    chosen_room = random.choice(preferred_lab)
+    # asisten tetap per mata kuliah dari pool, bukan dibangkitkan ulang per gene
+    assistants = _ctx(ctx).assistants.for_subject(subject_id)
+    preferred_lab: List[Room] = rng.sample(rooms, rng.randint(1, 4))
+    chosen_room = rng.choice(preferred_lab)
     room_id: int = chosen_room.id
 
     def split_by_rooms(cap: int, max_cap: int) -> List[int]:
@@ -99,45 +182,15 @@ def generate_gene(rooms: List[Room]) -> List[Gene]:
     days = ["Senin", "Selasa", "Rabu", "Kamis", "Jumat", "Sabtu"]
 
     def _sample_start_for_day(day_idx: int, dur_sec: int) -> tuple[int, int]:
-        """Pilih (start, end) yang sah. Jumat menghindari 12–13."""
-        # default: satu jendela penuh
-        windows = [(DAY_OPEN, DAY_CLOSE)]
-        # jika punya forbidden, pecah jadi beberapa jendela aman
-        if day_idx in FORBIDDEN_WINDOWS:
-            for fs, fe in FORBIDDEN_WINDOWS[day_idx]:
-                windows = [
-                    (DAY_OPEN, fs),  # sebelum lunch
-                    (fe, DAY_CLOSE),  # sesudah lunch
-                ]
-
-        # pilih window yang cukup panjang
-        candidates = []
-        for ws, we in windows:
-            if we - ws >= dur_sec:
-                candidates.append((ws, we))
-        if not candidates:
+        """Pilih (start, end) yang sah dari tabel start (Jumat otomatis hindari 12–13)."""
+        start = random_start(day_idx, dur_sec, rng)
+        if start is None:
             return None, None  # biarkan caller fallback/repair
-
-        # coba beberapa kali sampling grid
-        for _ in range(80):
-            ws, we = random.choice(candidates)
-            latest = we - dur_sec
-            start = _snap(random.randint(ws, latest))
-            end = start + dur_sec
-            if _allowed_in_day(day_idx, start, end):
-                return start, end
-
-        # gagal sampling -> fallback: paksa di awal window pertama
-        ws, we = candidates[0]
-        start = _snap(ws)
-        end = start + dur_sec
-        if _allowed_in_day(day_idx, start, end):
-            return start, end
-        return None, None
+        return start, start + dur_sec
 
     for index, cap in enumerate(capacities):
         # pilih hari
-        day_idx = random.randint(0, 5)
+        day_idx = rng.randint(0, 5)
         day_name = days[day_idx]
 
         # sampling waktu yang aman (Jumat hindari 12–13)
@@ -147,6 +200,23 @@ def generate_gene(rooms: List[Room]) -> List[Gene]:
             start = _snap(DAY_OPEN)
             end = start + dur_sec
 
+        gene_room = room_id
+        if grid is not None:
+            if not grid.is_free(day_idx, gene_room, start, end):
+                free = grid.free_rooms(day_idx, start, end, preferred_lab, cap)
+                if free:
+                    gene_room = rng.choice(free).id
+                else:
+                    s2 = grid.first_free_slot(
+                        day_idx,
+                        gene_room,
+                        dur_sec,
+                        starts=feasible_starts(day_idx, dur_sec),
+                    )
+                    if s2 is not None:
+                        start, end = s2, s2 + dur_sec
+            grid.reserve(day_idx, gene_room, start, end)
+
         result.append(
             Gene(
                 subject_name,
@@ -160,8 +230,9 @@ def generate_gene(rooms: List[Room]) -> List[Gene]:
                 day_idx,
                 start,
                 end,
-                room_id,
+                gene_room,
                 f"{class_code}-{index+1},",
+                new_id(rng),
             )
         )
     return result
@@ -174,6 +245,7 @@ def display_gene(gene: Gene):
             print(f"{attr}: {value}")
             # setelah ketemu room_id, cari Room-nya
             if attr == "room_id":
+                Rooms = default_context().rooms
                 room = next((r for r in Rooms if r.id == value), None)
                 if room:
                     room_idx = Rooms.index(room)
@@ -186,10 +258,18 @@ def display_gene(gene: Gene):
     print()
 
 
-def generate_individu(rooms, n_ind) -> Individuals:
+def generate_individu(
+    rooms,
+    n_ind,
+    grid: Optional[OccupancyGrid] = None,
+    ctx: Optional[GAContext] = None,
+    rng=random,
+) -> Individuals:
     result = Individuals([])
-    for _ in range(n_ind):
-        result.chromosome.extend(generate_gene(rooms))
+    grid = grid if grid is not None else OccupancyGrid()
+    # subject diambil sekali per batch, bukan per gene
+    for subject in generate_subjects(n_ind, ctx, rng):
+        result.chromosome.extend(generate_gene(rooms, grid, ctx, subject, rng))
     return result
 
 
@@ -249,58 +329,87 @@ def _merge_unique(base: List[Gene], extra: List[Gene]) -> List[Gene]:
 # ================== CORE ==================
 
 
-def generate_population(n_ind: int, n_pop: int) -> List[Individuals]:
+def generate_one(n_ind: int, rooms: List[Room], ctx: GAContext, rng=random) -> Individuals:
+    """
+    Satu individu ~n_ind gen (langkah 1–4 generate_population), semua acak dari 'rng'.
+    """
+    # generate awal
+    generated: Individuals = generate_individu(rooms, n_ind, ctx=ctx, rng=rng)
+
+    # 1) buang duplikat dulu
+    generated.chromosome = _dedup_chromosome(generated.chromosome)
+
+    # 2) kalau kurang dari target, coba tambah dari batch lain (unik saja)
+    MAX_ATTEMPTS = 10  # biar gak infinite loop
+    attempts = 0
+    while len(generated.chromosome) < n_ind and attempts < MAX_ATTEMPTS:
+        remaining = n_ind - len(generated.chromosome)
+        # boleh generate pas 'remaining', atau n_ind lagi (bebas—pakai remaining lebih efisien)
+        generated_2: Individuals = generate_individu(
+            rooms, remaining, OccupancyGrid(generated.chromosome), ctx, rng
+        )
+        # pastikan generated_2 juga bebas duplikat internalnya
+        generated_2.chromosome = _dedup_chromosome(generated_2.chromosome)
+
+        # merge unik
+        generated.chromosome = _merge_unique(
+            generated.chromosome, generated_2.chromosome
+        )
+        attempts += 1
+
+    # 3) kalau masih lebih dari target, buang acak
+    if len(generated.chromosome) > n_ind:
+        surplus = len(generated.chromosome) - n_ind
+        # pilih index yang akan dibuang
+        idx_to_remove = set(rng.sample(range(len(generated.chromosome)), surplus))
+        generated.chromosome = [
+            g for i, g in enumerate(generated.chromosome) if i not in idx_to_remove
+        ]
+
+    # 4) kalau masih kurang setelah semua usaha, kita biarkan apa adanya
+    # (opsional: raise warning/logging)
+    return generated
+
+
+def individual_rng(base_seed: int, k: int) -> random.Random:
+    """Stream RNG sendiri untuk individu ke-k (tidak tergantung urutan / worker)."""
+    return random.Random(f"{base_seed}:seed:{k}")
+
+
+@metrics.timed("seeding")
+def generate_population(
+    n_ind: int,
+    n_pop: int,
+    ctx: Optional[GAContext] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> List[Individuals]:
     """
     Bangkitkan populasi berukuran n_pop.
     - Tiap Individu diusahakan tepat n_ind gen.
     - Duplikat dihapus berdasar (subject_id, group).
     - Jika kurang, generate batch tambahan dan merge unik sampai terpenuhi (batas percobaan).
     - Jika lebih, buang acak sampai pas.
+    - ctx: sumber dataset & Rooms (default: default_context()).
+    - seed / workers: kalau salah satu diisi, individu ke-k dibangkitkan dari
+      stream individual_rng(seed, k), dibagi ke 'workers' proses. Hasilnya sama
+      persis berapapun jumlah worker. Tanpa keduanya: pakai `random` global (lama).
     """
-    global Rooms
-
-    population: List[Individuals] = []
-
-    for _ in range(n_pop):
-        # generate awal
-        generated: Individuals = generate_individu(Rooms, n_ind)
-
-        # 1) buang duplikat dulu
-        generated.chromosome = _dedup_chromosome(generated.chromosome)
-
-        # 2) kalau kurang dari target, coba tambah dari batch lain (unik saja)
-        MAX_ATTEMPTS = 10  # biar gak infinite loop
-        attempts = 0
-        while len(generated.chromosome) < n_ind and attempts < MAX_ATTEMPTS:
-            remaining = n_ind - len(generated.chromosome)
-            # boleh generate pas 'remaining', atau n_ind lagi (bebas—pakai remaining lebih efisien)
-            generated_2: Individuals = generate_individu(Rooms, remaining)
-            # pastikan generated_2 juga bebas duplikat internalnya
-            generated_2.chromosome = _dedup_chromosome(generated_2.chromosome)
-
-            # merge unik
-            generated.chromosome = _merge_unique(
-                generated.chromosome, generated_2.chromosome
-            )
-            attempts += 1
-
-        # 3) kalau masih lebih dari target, buang acak
-        if len(generated.chromosome) > n_ind:
-            surplus = len(generated.chromosome) - n_ind
-            # pilih index yang akan dibuang
-            idx_to_remove = set(
-                random.sample(range(len(generated.chromosome)), surplus)
-            )
-            generated.chromosome = [
-                g for i, g in enumerate(generated.chromosome) if i not in idx_to_remove
-            ]
+    ctx = _ctx(ctx)
+    Rooms = ctx.rooms
 
-        # 4) kalau masih kurang setelah semua usaha, kita biarkan apa adanya
-        # (opsional: raise warning/logging)
+    if seed is not None or workers is not None:
+        base_seed = seed if seed is not None else random.getrandbits(64)
+        if workers is not None and workers > 1:
+            from parallel import seed_population
 
-        population.append(generated)
+            return seed_population(n_ind, n_pop, ctx, base_seed, workers)
+        return [
+            generate_one(n_ind, Rooms, ctx, individual_rng(base_seed, k))
+            for k in range(n_pop)
+        ]
 
-    return population
+    return [generate_one(n_ind, Rooms, ctx) for _ in range(n_pop)]
 
 
 # population = generate_population(40, 20)
@@ -0,0 +1,96 @@
+"""
+Operator seleksi berbasis array fitness. Semua fungsi mengembalikan list
+index individu (bukan salinan), jadi pemanggil yang menentukan kapan/cara
+meng-clone (lihat Individuals.clone()).
+
+- roulette_indices  : alias method (Vose), O(N) build + O(1) per pick
+- sus_indices       : stochastic universal sampling dengan bisect, O(N + k log N)
+- tournament_indices: k-tournament, O(k * size)
+"""
+
+import random
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Callable, List, Sequence, Union
+
+Selection = Callable[..., List[int]]
+
+
+def roulette_indices(fitnesses: Sequence[float], k: int, rng=random) -> List[int]:
+    n = len(fitnesses)
+    if n == 0:
+        return []
+    total = float(sum(fitnesses))
+    if total <= 0:
+        # fallback: uniform
+        return [rng.randrange(n) for _ in range(k)]
+
+    # tabel alias (Vose)
+    scaled = [f * n / total for f in fitnesses]
+    prob = [0.0] * n
+    alias = [0] * n
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = (scaled[l] + scaled[s]) - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
+    for i in large + small:  # sisa akibat pembulatan float
+        prob[i] = 1.0
+
+    picks = []
+    for _ in range(k):
+        i = rng.randrange(n)
+        picks.append(i if rng.random() < prob[i] else alias[i])
+    return picks
+
+
+def sus_indices(fitnesses: Sequence[float], k: int, rng=random) -> List[int]:
+    n = len(fitnesses)
+    if n == 0 or k <= 0:
+        return []
+    total = float(sum(fitnesses)) or 1e-9
+    cdf = list(accumulate(f / total for f in fitnesses))
+
+    step = 1.0 / k
+    start = rng.random() * step
+    return [min(bisect_left(cdf, start + i * step), n - 1) for i in range(k)]
+
+
+def tournament_indices(
+    fitnesses: Sequence[float], k: int, rng=random, size: int = 3
+) -> List[int]:
+    n = len(fitnesses)
+    if n == 0:
+        return []
+    size = max(1, min(size, n))
+    picks = []
+    for _ in range(k):
+        best = rng.randrange(n)
+        for _ in range(size - 1):
+            c = rng.randrange(n)
+            if fitnesses[c] > fitnesses[best]:
+                best = c
+        picks.append(best)
+    return picks
+
+
+SELECTIONS = {
+    "roulette": roulette_indices,
+    "sus": sus_indices,
+    "tournament": tournament_indices,
+}
+
+
+def get_selection(selection: Union[str, Selection]) -> Selection:
+    """Terima nama ('roulette', 'sus', 'tournament') atau callable(fitnesses, k) → indices."""
+    if callable(selection):
+        return selection
+    try:
+        return SELECTIONS[selection]
+    except KeyError:
+        raise ValueError(
+            f"Unknown selection: {selection}. Use one of {sorted(SELECTIONS)}"
+        ) from None
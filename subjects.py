@@ -0,0 +1,69 @@
+"""
+Katalog mata kuliah (kelas praktikum) dalam bentuk kolom NumPy.
+
+Dulu seeder memanggil dataset_df.sample(n=1).iloc[0] per gene (indexing
+pandas + bikin Series tiap kali). Di sini kolom yang dipakai seeder
+di-compile sekali, lalu subject diambil per batch: index diacak secara
+vektor, lalu baris diambil sekaligus sebagai skalar Python.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# atribut SubjectTable → kolom dataset
+SUBJECT_COLUMNS = {
+    "subject_name": "nama_matakuliah",
+    "subject_id": "kode_matakuliah",
+    "semester": "semester",
+    "capacity": "jumlah_peserta",
+    "sks": "sks_praktek",
+    "class_code": "kode_kelas",
+}
+
+
+@dataclass
+class SubjectTable:
+    subject_name: np.ndarray
+    subject_id: np.ndarray
+    semester: np.ndarray
+    capacity: np.ndarray
+    sks: np.ndarray
+    class_code: np.ndarray
+
+    @classmethod
+    def from_columns(cls, cols: Dict[str, np.ndarray]) -> "SubjectTable":
+        """Dari dataset.load_columns() (array di-copy, lepas dari mmap cache)."""
+        return cls(**{k: np.array(cols[c]) for k, c in SUBJECT_COLUMNS.items()})
+
+    def __len__(self) -> int:
+        return len(self.subject_id)
+
+    def sample(self, n: int, rng=random) -> np.ndarray:
+        """
+        n index baris, uniform dengan pengembalian (sama seperti
+        dataset_df.sample(n=1) berulang). Seed numpy diambil dari 'rng'
+        supaya random.seed(...) tetap mengunci hasilnya.
+        """
+        gen = np.random.default_rng(rng.getrandbits(64))
+        return gen.integers(0, len(self), size=n)
+
+    def rows(self, idx) -> List[Tuple]:
+        """
+        (index, subject_name, subject_id, semester, capacity, sks, class_code)
+        per index, urutan sama dengan seeder.generate_subject().
+        """
+        idx = np.asarray(idx)
+        return list(
+            zip(
+                idx.tolist(),
+                self.subject_name[idx].tolist(),
+                self.subject_id[idx].tolist(),
+                self.semester[idx].tolist(),
+                self.capacity[idx].tolist(),
+                self.sks[idx].tolist(),
+                self.class_code[idx].tolist(),
+            )
+        )
@@ -0,0 +1,80 @@
+"""
+ConflictState (delta_fitness) harus memberi penalty yang sama dengan
+fitness.conflicts, juga untuk gene berdurasi 0 dan asisten yang tercantum
+dua kali, sebelum dan sesudah apply_*().
+
+    python -m unittest test_delta_fitness   (atau pytest test_delta_fitness.py)
+"""
+
+import random
+import unittest
+
+from delta_fitness import ConflictState
+from fitness import ALPHA, BETA, GAMMA, GRID, conflicts
+from seeder import generate_population
+
+
+def _penalty(ind) -> float:
+    room, group, asst = conflicts(ind)
+    return ALPHA * room + BETA * group + GAMMA * asst
+
+
+def _odd(ind, rng: random.Random):
+    """Sisipkan gene berdurasi 0 dan asisten dobel ke individu."""
+    for j in rng.sample(range(len(ind.chromosome)), len(ind.chromosome) // 3):
+        g = ind.mutable_gene(j)
+        if rng.random() < 0.5:
+            g.end_time = g.start_time
+        elif g.assistant:
+            g.assistant = list(g.assistant) + [g.assistant[0]]
+    return ind
+
+
+class ConflictStateTest(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.rng = random.Random(3)
+        self.pop = [_odd(ind, self.rng) for ind in generate_population(30, 6)]
+
+    def test_initial_penalty(self):
+        for ind in self.pop:
+            self.assertEqual(ConflictState(ind).penalty, _penalty(ind))
+
+    def test_zero_length_pairs(self):
+        ind = self.pop[0]
+        for j in range(1, len(ind.chromosome)):
+            g = ind.mutable_gene(j)
+            g.day, g.room_id = ind.chromosome[0].day, ind.chromosome[0].room_id
+            g.start_time = ind.chromosome[0].start_time
+            g.end_time = g.start_time + (0 if j % 2 else GRID)
+        self.assertEqual(ConflictState(ind).penalty, _penalty(ind))
+
+    def test_deltas_and_apply(self):
+        rng = self.rng
+        for ind in self.pop:
+            state = ConflictState(ind)
+            n = len(ind.chromosome)
+            for _ in range(40):
+                j = rng.randrange(n)
+                if rng.random() < 0.5:
+                    k = rng.randrange(n)
+                    if k == j:
+                        continue
+                    d = state.swap_delta(j, k)
+                    got = state.apply_swap(j, k)
+                else:
+                    g = ind.chromosome[j]
+                    shift = rng.choice((-2, -1, 1, 2)) * GRID
+                    fields = {
+                        "day": rng.randrange(5),
+                        "start_time": g.start_time + shift,
+                        "end_time": g.end_time + shift,
+                    }
+                    d = state.move_delta(j, **fields)
+                    got = state.apply_move(j, **fields)
+                self.assertEqual(d, got)
+                self.assertEqual(state.penalty, _penalty(ind))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Resume dari checkpoint harus melanjutkan run persis seperti run yang tidak
+pernah berhenti (classic, mixed, adaptive).
+
+    python -m unittest test_resume   (atau pytest test_resume.py)
+"""
+
+import os
+import tempfile
+import unittest
+
+from checkpoint import Checkpointer, load
+from context import GAContext
+from ga import GAConfig, evolve
+
+MAX_ITER = 9
+STOP_AT = 6  # run "dibunuh" setelah checkpoint generasi ini
+
+
+def _config(operators: str) -> GAConfig:
+    return GAConfig(
+        n_gene=40,
+        n_pop=10,
+        seed=5,
+        fitness_backend="bitset",
+        max_iter=MAX_ITER,
+        operators=operators,
+        operator_cost="calls",
+    )
+
+
+def _trace(records):
+    """(generasi, stage, fitness populasi, bobot operator) per record."""
+    out = []
+    for rec in records:
+        stats = rec.operator_stats
+        weights = {k: v["weights"] for k, v in stats.items()} if stats else None
+        out.append((rec.generation, rec.stage, list(rec.fitnesses), weights))
+    return out
+
+
+class ResumeTest(unittest.TestCase):
+    def _check(self, operators: str):
+        full = _trace(evolve(_config(operators), GAContext()))
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "run.ckpt")
+            config = _config(operators)
+            ck = Checkpointer(path, every=3, config=config)
+            for rec in evolve(config, GAContext()):
+                if ck.due(rec):
+                    ck.save(rec)
+                if rec.stage == "mutation" and rec.generation == STOP_AT:
+                    break
+            ck.wait()
+
+            state = load(path)
+            self.assertEqual(state.generation, STOP_AT)
+            # tanpa ctx: context dibangun ulang dari seed (_resume_context)
+            resumed = _trace(evolve(state.ga_config(), resume=state))
+
+        cut = [r[:2] for r in full].index((STOP_AT, "mutation"))
+        self.assertEqual(resumed[0][0], STOP_AT)
+        self.assertEqual(resumed[0][2:], full[cut][2:])
+        self.assertEqual(resumed[1:], full[cut + 1 :])
+
+    def test_classic(self):
+        self._check("classic")
+
+    def test_mixed(self):
+        self._check("mixed")
+
+    def test_adaptive(self):
+        self._check("adaptive")
+
+
+class BackgroundTableTest(unittest.TestCase):
+    def test_parent_learns_table(self):
+        # gene baru (operators mixed) ditulis anak; parent harus ikut tahu,
+        # supaya table hanya ditulis ulang saat memang bertambah
+        config = _config("mixed")
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "run.ckpt")
+            ck = Checkpointer(path, every=1, config=config, background=True)
+            for rec in evolve(config, GAContext()):
+                if ck.due(rec):
+                    n, name = len(ck.table), ck._table_file
+                    ck.save(rec)
+                    ck.wait()
+                    self.assertEqual(ck._table_file != name, len(ck.table) > n)
+                    self.assertEqual(load(path).table_file, ck._table_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tabel start sah (seeder._start_entry) harus ikut konfigurasi jam & jendela
+terlarang yang berlaku, termasuk kalau diubah langsung.
+
+    python -m unittest test_seeder   (atau pytest test_seeder.py)
+"""
+
+import copy
+import unittest
+
+import seeder
+
+HOUR = 3600
+
+
+class StartTableTest(unittest.TestCase):
+    def setUp(self):
+        self.saved = (
+            copy.deepcopy(seeder.FORBIDDEN_WINDOWS),
+            seeder.DAY_OPEN,
+            seeder.DAY_CLOSE,
+            seeder.GRID,
+        )
+
+    def tearDown(self):
+        windows, seeder.DAY_OPEN, seeder.DAY_CLOSE, seeder.GRID = self.saved
+        seeder.set_forbidden_windows(windows)
+
+    def _consistent(self, day: int, dur: int):
+        starts = seeder.feasible_starts(day, dur)
+        for s in range(0, 24 * HOUR, seeder.GRID):
+            allowed = seeder._allowed_in_day(day, s, s + dur)
+            self.assertEqual(s in starts, allowed, (day, s, dur))
+            self.assertEqual(seeder.is_feasible_start(day, s, s + dur), allowed)
+
+    def test_windows_changed_in_place(self):
+        self.assertTrue(seeder.is_feasible_start(2, 9 * HOUR, 11 * HOUR))
+        seeder.FORBIDDEN_WINDOWS[2] = [(9 * HOUR, 10 * HOUR)]
+        self.assertFalse(seeder.is_feasible_start(2, 9 * HOUR, 11 * HOUR))
+        self._consistent(2, 2 * HOUR)
+        seeder.FORBIDDEN_WINDOWS[2].append((14 * HOUR, 15 * HOUR))
+        self._consistent(2, 2 * HOUR)
+        del seeder.FORBIDDEN_WINDOWS[2]
+        self.assertTrue(seeder.is_feasible_start(2, 9 * HOUR, 11 * HOUR))
+
+    def test_set_forbidden_windows(self):
+        seeder.feasible_starts(4, 2 * HOUR)
+        seeder.set_forbidden_windows({})
+        self._consistent(4, 2 * HOUR)
+
+    def test_day_bounds_changed(self):
+        seeder.feasible_starts(1, 2 * HOUR)
+        seeder.DAY_OPEN, seeder.DAY_CLOSE = 8 * HOUR, 12 * HOUR
+        self.assertEqual(seeder.feasible_starts(1, 2 * HOUR)[0], 8 * HOUR)
+        self._consistent(1, 2 * HOUR)
+        seeder.GRID = 15 * 60
+        self._consistent(1, 2 * HOUR)
+
+
+if __name__ == "__main__":
+    unittest.main()
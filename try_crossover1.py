@@ -1,8 +1,10 @@
 import random
-import copy
+import time
 from dataclasses import replace
 from typing import List, Tuple
-from data_type import Room, Gene, AssistantSchedule, Individuals
+from data_type import Room, Gene, AssistantSchedule, Individuals, share_genes
+from fitness import fitness
+from selection import get_selection, sus_indices
 
 
 # =========================
@@ -11,26 +13,7 @@ from data_type import Room, Gene, AssistantSchedule, Individuals
 def sus_select(
     fitnesses: List[float], pop: List[Individuals], k: int
 ) -> List[Individuals]:
-    total = sum(fitnesses) or 1e-9
-    probs = [f / total for f in fitnesses]
-    cdf = []
-    acc = 0.0
-    for p in probs:
-        acc += p
-        cdf.append(acc)
-
-    step = 1.0 / k
-    start = random.random() * step
-    pointers = [start + i * step for i in range(k)]
-
-    selected = []
-    j = 0
-    for ptr in pointers:
-        while j < len(cdf) and cdf[j] < ptr:
-            j += 1
-        idx = min(j, len(pop) - 1)
-        selected.append(copy.deepcopy(pop[idx]))
-    return selected
+    return [pop[i].clone() for i in sus_indices(fitnesses, k)]
 
 
 # =========================
@@ -39,10 +22,10 @@ def sus_select(
 def cx_one_point(a: Individuals, b: Individuals) -> Tuple[Individuals, Individuals]:
     L = len(a.chromosome)
     if L < 2:
-        return copy.deepcopy(a), copy.deepcopy(b)
+        return a.clone(), b.clone()
     pt = random.randint(1, L - 1)
-    c1 = Individuals(chromosome=copy.deepcopy(a.chromosome[:pt] + b.chromosome[pt:]))
-    c2 = Individuals(chromosome=copy.deepcopy(b.chromosome[:pt] + a.chromosome[pt:]))
+    c1 = Individuals(chromosome=share_genes(a.chromosome[:pt] + b.chromosome[pt:]))
+    c2 = Individuals(chromosome=share_genes(b.chromosome[:pt] + a.chromosome[pt:]))
     return c1, c2
 
 
@@ -52,12 +35,12 @@ def cx_two_point(a: Individuals, b: Individuals) -> Tuple[Individuals, Individua
         return cx_one_point(a, b)
     i, j = sorted(random.sample(range(1, L), 2))
     c1 = Individuals(
-        chromosome=copy.deepcopy(
+        chromosome=share_genes(
             a.chromosome[:i] + b.chromosome[i:j] + a.chromosome[j:]
         )
     )
     c2 = Individuals(
-        chromosome=copy.deepcopy(
+        chromosome=share_genes(
             b.chromosome[:i] + a.chromosome[i:j] + b.chromosome[j:]
         )
     )
@@ -71,12 +54,12 @@ def cx_uniform_gene(
     c1_genes, c2_genes = [], []
     for k in range(L):
         if random.random() < p:
-            c1_genes.append(copy.deepcopy(a.chromosome[k]))
-            c2_genes.append(copy.deepcopy(b.chromosome[k]))
+            c1_genes.append(a.chromosome[k])
+            c2_genes.append(b.chromosome[k])
         else:
-            c1_genes.append(copy.deepcopy(b.chromosome[k]))
-            c2_genes.append(copy.deepcopy(a.chromosome[k]))
-    return Individuals(c1_genes), Individuals(c2_genes)
+            c1_genes.append(b.chromosome[k])
+            c2_genes.append(a.chromosome[k])
+    return Individuals(share_genes(c1_genes)), Individuals(share_genes(c2_genes))
 
 
 def cx_uniform_schedule_fields(
@@ -101,6 +84,7 @@ def cx_uniform_schedule_fields(
             start_time=sched_src.start_time,
             end_time=sched_src.end_time,
             room_id=sched_src.room_id,
+            shared=False,
         )
 
     L = len(a.chromosome)
@@ -118,13 +102,37 @@ def cx_uniform_schedule_fields(
 # =========================
 # Crossover main
 # =========================
+CX_OPERATORS = {
+    "one_point": cx_one_point,
+    "two_point": cx_two_point,
+    "uniform_gene": cx_uniform_gene,
+    "uniform_schedule_fields": cx_uniform_schedule_fields,
+}
+# bobot statis; uniform_schedule_fields paling eksploratif tapi tetap menjaga identitas
+CX_WEIGHTS = {
+    "one_point": 2,
+    "two_point": 3,
+    "uniform_gene": 3,
+    "uniform_schedule_fields": 4,
+}
+
+
 def crossover(
-    fitnesses: List[float], pop: List[Individuals], rate: float = 0.5, elite_k: int = 2
+    fitnesses: List[float],
+    pop: List[Individuals],
+    rate: float = 0.5,
+    elite_k: int = 2,
+    selection="sus",
+    adaptive=None,
 ) -> List[Individuals]:
     """
-    - Seleksi: SUS + elitism (top-k langsung lolos).
+    - Seleksi: SUS (default; bisa 'roulette' / 'tournament' / callable lewat
+      'selection') + elitism (top-k langsung lolos).
     - Pasangan dikawinkan dengan peluang 'rate'.
-    - Operator crossover dipilih acak berbobot.
+    - Operator crossover dipilih acak berbobot (CX_WEIGHTS), atau lewat
+      'adaptive' (operator_select.AdaptivePursuit atas nama di CX_OPERATORS):
+      tiap operator di-credit kenaikan fitness anak terbaik vs parent terbaik
+      per detik CPU (anak dievaluasi sekali lagi di sini).
     """
     N = len(pop)
     if N == 0:
@@ -132,25 +140,18 @@ def crossover(
 
     # --- elitism ---
     ranked_idx = sorted(range(N), key=lambda i: fitnesses[i], reverse=True)
-    elites = [copy.deepcopy(pop[i]) for i in ranked_idx[:elite_k]]
+    elites = [pop[i].clone() for i in ranked_idx[:elite_k]]
 
-    # --- selection via SUS untuk sisa ---
-    parents = sus_select(fitnesses, pop, k=N - elite_k)
+    # --- selection untuk sisa ---
+    picks = list(get_selection(selection)(fitnesses, N - elite_k))
 
     # --- buat pasangan ---
-    random.shuffle(parents)
+    random.shuffle(picks)
+    parents = [pop[i].clone() for i in picks]
     children: List[Individuals] = []
 
     # daftar operator & bobot
-    ops = [
-        (cx_one_point, 2),
-        (cx_two_point, 3),
-        (cx_uniform_gene, 3),
-        (
-            cx_uniform_schedule_fields,
-            4,
-        ),  # paling eksploratif tapi tetap menjaga identitas
-    ]
+    ops = [(CX_OPERATORS[n], w) for n, w in CX_WEIGHTS.items()]
     total_w = sum(w for _, w in ops)
 
     # kawinkan berpasangan
@@ -164,8 +165,19 @@ def crossover(
 
         if random.random() >= rate:
             # no crossover → cloning
-            children.append(copy.deepcopy(p1))
-            children.append(copy.deepcopy(p2))
+            children.append(p1.clone())
+            children.append(p2.clone())
+            continue
+
+        if adaptive is not None:
+            name = adaptive.choose()
+            t = time.process_time()
+            c1, c2 = CX_OPERATORS[name](p1, p2)
+            dt = time.process_time() - t
+            parent_best = max(fitnesses[picks[i]], fitnesses[picks[i + 1]])
+            adaptive.credit(name, max(fitness([c1, c2])) - parent_best, dt)
+            children.append(c1)
+            children.append(c2)
             continue
 
         # pilih operator berbobot
@@ -190,5 +202,5 @@ def crossover(
         # pad with clones
         pool = elites + parents
         while len(next_gen) < N:
-            next_gen.append(copy.deepcopy(random.choice(pool)))
+            next_gen.append(random.choice(pool).clone())
     return next_gen
@@ -1,12 +1,16 @@
 import random
-from typing import List, Tuple
+import time
+from typing import List, Optional, Tuple
 from data_type import Room, Gene, AssistantSchedule, Individuals
 from fitness import overlap, fitness
+from delta_fitness import ConflictState
+from occupancy import OccupancyGrid
 
 # from try_crossover1 import crossover
 
 from crossover import crossover
-from seeder import generate_population, generate_gene, display_gene, Rooms
+from seeder import generate_population, generate_gene, display_gene
+from context import GAContext, default_context
 
 
 # --- helper asumsi durasi dari SKS (2 SKS = 100 menit → 1 SKS = 50 menit) ---
@@ -24,31 +28,43 @@ def clamp_time(start: int, dur: int) -> Tuple[int, int]:
     return s, s + dur
 
 
-def assistant_is_free(asst: AssistantSchedule, day: int, start: int, end: int) -> bool:
+def _ctx(ctx: Optional[GAContext]) -> GAContext:
+    return ctx if ctx is not None else default_context()
+
+
+def assistant_is_free(
+    asst: AssistantSchedule, day: int, start: int, end: int, ctx: Optional[GAContext] = None
+) -> bool:
     # interpretasi: entries adalah slot SIBUK; bebas jika tak ada overlap
-    for i, d in enumerate(asst.day):
-        if d != day:
-            continue
-        if overlap(asst.start_time[i], asst.end_time[i], start, end):
-            return False
-    return True
+    # (lewat bitmask sibuk mingguan di AvailabilityIndex)
+    return _ctx(ctx).availability.is_free(asst, day, start, end)
 
 
-def available_assistants(g: Gene, day: int, start: int, end: int) -> int:
-    uniq = {a.id: a for a in g.assistant}.values()
-    return sum(1 for a in uniq if assistant_is_free(a, day, start, end))
+def available_assistants(
+    g: Gene, day: int, start: int, end: int, ctx: Optional[GAContext] = None
+) -> int:
+    # lookup tabel jumlah asisten bebas untuk roster gene ini
+    return _ctx(ctx).availability.count_free(g.assistant, day, start, end)
 
 
 # --- OPERATOR MUTASI ---
 
 
-def op_time_shift(g: Gene) -> Gene:
+def op_time_shift(g: Gene, grid: Optional[OccupancyGrid] = None) -> Gene:
     # geser ±k*STEP secara acak, pertahankan durasi
+    # grid (opsional, gene g sudah di-release): utamakan pergeseran ke slot ruang yang kosong
     dur = (
         g.end_time - g.start_time
         if g.end_time > g.start_time
         else duration_from_sks(g.sks)
     )
+    if grid is not None:
+        deltas = [sign * k * STEP for k in range(1, 5) for sign in (-1, 1)]
+        random.shuffle(deltas)
+        for delta in deltas:
+            start, end = clamp_time(g.start_time + delta, dur)
+            if start != g.start_time and grid.is_free(g.day, g.room_id, start, end):
+                return Gene(**{**g.__dict__, "start_time": start, "end_time": end})
     k = random.randint(1, 4)  # 0.5–2 jam
     delta = random.choice([-1, 1]) * k * STEP
     start = g.start_time + delta
@@ -68,74 +84,51 @@ def op_day_swap(g: Gene) -> Gene:
     return Gene(**{**g.__dict__, "day": new_day, "start_time": start, "end_time": end})
 
 
-def op_room_preferred(g: Gene) -> Gene:
+def op_room_preferred(g: Gene, grid: Optional[OccupancyGrid] = None) -> Gene:
     # pilih room dari preferred_lab kalau ada; kalau kosong, biarkan
+    # grid (opsional, gene g sudah di-release): utamakan lab yang bebas di slot ini
+    if grid is not None:
+        free = [
+            r
+            for r in grid.free_rooms(
+                g.day, g.start_time, g.end_time, g.preferred_lab or [], g.capacity
+            )
+            if r.id != g.room_id
+        ]
+        if free:
+            return Gene(**{**g.__dict__, "room_id": random.choice(free).id})
     if g.preferred_lab:
         new_room = random.choice(g.preferred_lab).id
         return Gene(**{**g.__dict__, "room_id": new_room})
     return g
 
 
-def op_fit_for_two_asst(g: Gene) -> Gene:
+def op_fit_for_two_asst(g: Gene, ctx: Optional[GAContext] = None) -> Gene:
     """
-    local search kecil: cari kombinasi (day, start) yang membuat >=2 asisten bebas.
-    Coba beberapa candidate di sekitar waktu sekarang dan beberapa jam favorit.
+    Pindahkan gene ke (day, start) yang membuat >=2 asisten bebas.
+    Slot kandidat diambil dari tabel jumlah asisten bebas roster gene ini
+    (AvailabilityIndex), jadi cukup lookup, bukan coba-coba 80 kandidat.
     """
     dur = (
         g.end_time - g.start_time
         if g.end_time > g.start_time
         else duration_from_sks(g.sks)
     )
+    index = _ctx(ctx).availability
+    days = range(1, 8)
 
-    # kandidat hari: hari sekarang + beberapa lainnya
-    cand_days = [g.day] + random.sample(
-        [d for d in range(1, 8) if d != g.day], k=min(3, 6)
-    )
-    # kandidat waktu: sekitar start sekarang + grid tiap 30 menit
-    around = [g.start_time + STEP * i for i in range(-3, 4)]
-    grid = list(range(DAY_START, DAY_END - dur + 1, STEP))
-    candidates_time = list({t for t in around if DAY_START <= t <= DAY_END - dur})
-    # tambah 5 titik random dari grid supaya eksplor
-    candidates_time += random.sample(grid, k=min(5, len(grid)))
-
-    random.shuffle(cand_days)
-    random.shuffle(candidates_time)
-
-    best = (
-        available_assistants(g, g.day, g.start_time, g.end_time),
-        g.day,
-        g.start_time,
-    )
-    if best[0] >= 2:
+    current = available_assistants(g, g.day, g.start_time, g.end_time, ctx)
+    if current >= 2:
         return g  # sudah cukup
 
-    tried = 0
-    for d in cand_days:
-        for s in candidates_time:
-            tried += 1
-            s2, e2 = clamp_time(s, dur)
-            avail = available_assistants(g, d, s2, e2)
-            if avail > best[0]:
-                best = (avail, d, s2)
-                if avail >= 2:
-                    return Gene(
-                        **{
-                            **g.__dict__,
-                            "day": d,
-                            "start_time": s2,
-                            "end_time": s2 + dur,
-                        }
-                    )
-
-            if tried > 80:  # batasi effort
-                break
-        if tried > 80:
-            break
-
-    # kalau belum dapat >=2, ambil best yang didapat (mungkin 1)
-    _, bd, bs = best
-    if bd != g.day or bs != g.start_time:
-        return Gene(**{**g.__dict__, "day": bd, "start_time": bs, "end_time": bs + dur})
+    # semua slot dengan >=2 asisten bebas; kalau tidak ada, ambil yang terbaik (mungkin 1)
+    for need in range(2, current, -1):
+        cands = index.slots_with(
+            g.assistant, dur, need, days=days, earliest=DAY_START, latest=DAY_END
+        )
+        if cands:
+            d, s = random.choice(cands)
+            return Gene(**{**g.__dict__, "day": d, "start_time": s, "end_time": s + dur})
     return g
 
 
@@ -165,30 +158,59 @@ def op_swap_two_genes(ind: Individuals) -> None:
     )
     ind.chromosome[i] = g1_new
     ind.chromosome[j] = g2_new
+    ind.invalidate()
 
 
-def op_regenerate_gene() -> Gene:
-    # fallback regenerasi penuh (pakai seeder kamu)
+def op_regenerate_gene(ctx: Optional[GAContext] = None) -> Gene:
+    # fallback regenerasi penuh (pakai seeder kamu): Rooms, mata kuliah & roster
+    # asisten dari context run yang sama, acak dari `random` global (ikut seed run)
     # NOTE: generate_gene() terlihat mengembalikan list → ambil 1
+    ctx = _ctx(ctx)
     try:
-        return random.sample(generate_gene(Rooms), 1)[0]
+        return random.sample(generate_gene(ctx.rooms, ctx=ctx, rng=random), 1)[0]
     except:
         # kalau generate_gene() langsung return Gene, jadikan plan B
-        return generate_gene(Rooms)
+        return generate_gene(ctx.rooms, ctx=ctx, rng=random)
 
 
 # --- MUTATION UTAMA ---
 
 
+# Bobot operator statis (bisa diubah; juga bobot awal untuk AdaptivePursuit)
+MUTATION_WEIGHTS = {
+    "time_shift": 3,
+    "day_swap": 2,
+    "room_preferred": 2,
+    "fit_for_two_asst": 4,  # prioritaskan dapat 2 asisten
+    "swap_two_genes": 1,
+    "regenerate": 1,
+}
+
+
 def mutation(
-    pops: List[Individuals], rate=0.3, gene_rate=0.5, elite_k=2
+    pops: List[Individuals],
+    rate=0.3,
+    gene_rate=0.5,
+    elite_k=2,
+    accept_worse=True,
+    adaptive=None,
+    verbose=True,
+    ctx: Optional[GAContext] = None,
 ) -> List[Individuals]:
     """
     - rate: peluang individu diproses mutasi
     - gene_rate: peluang tiap gene diindividu tsb dimutasi
     - elite_k: individu terbaik yang DIJAGA tidak diutak-atik
+    - accept_worse: False → tiap usulan mutasi dicek lewat delta fitness
+      (ConflictState) dan ditolak kalau menambah penalty
+    - adaptive: operator_select.AdaptivePursuit atas nama di MUTATION_WEIGHTS;
+      operator dipilih dari situ dan di-credit perubahan fitness (delta) per
+      detik CPU
+    - ctx: GAContext run (Rooms, pool asisten, availability) untuk
+      fit_for_two_asst & regenerate; default context default
     """
-    print("Mutating Random Gene...")
+    if verbose:
+        print("Mutating Random Gene...")
 
     # --- elitism sederhana: jaga top-k agar tak rusak ---
     # kita butuh fitness untuk ranking; asumsi ada fungsi fitness(pop) → List[float]
@@ -199,16 +221,7 @@ def mutation(
     ranked_idx = sorted(range(len(pops)), key=lambda i: current_scores[i], reverse=True)
     elites = set(ranked_idx[:elite_k])
 
-    # Bobot operator (bisa diubah)
-    op_weights = [
-        ("time_shift", 3),
-        ("day_swap", 2),
-        ("room_preferred", 2),
-        ("fit_for_two_asst", 4),  # prioritaskan dapat 2 asisten
-        ("swap_two_genes", 1),
-        ("regenerate", 1),
-    ]
-    names, weights = zip(*op_weights)
+    names, weights = zip(*MUTATION_WEIGHTS.items())
 
     for i, ind in enumerate(pops):
         if i in elites:
@@ -217,32 +230,56 @@ def mutation(
         if random.random() >= rate:
             continue
 
+        # adaptive butuh delta fitness untuk credit, jadi state selalu dibuat
+        state = None if accept_worse and adaptive is None else ConflictState(ind)
+        # swap slot antar gene tidak mengubah okupansi, jadi grid cukup dibangun sekali
+        grid = OccupancyGrid(ind.chromosome)
+
         # peluang gene dipilih
         for j in range(len(ind.chromosome)):
             if random.random() >= gene_rate:
                 continue
 
-            op = random.choices(names, weights=weights, k=1)[0]
+            if adaptive is None:
+                op = random.choices(names, weights=weights, k=1)[0]
+            else:
+                op = adaptive.choose()
+                t, before = time.process_time(), state.fitness
 
             if op == "swap_two_genes":
-                op_swap_two_genes(ind)
+                if state is None:
+                    op_swap_two_genes(ind)
+                elif len(ind.chromosome) >= 2:
+                    a, b = random.sample(range(len(ind.chromosome)), 2)
+                    if accept_worse or state.swap_delta(a, b) <= 0:
+                        state.apply_swap(a, b)
+                if adaptive is not None:
+                    adaptive.credit(op, state.fitness - before, time.process_time() - t)
                 continue
 
             g = ind.chromosome[j]
+            grid.remove_gene(g)
             if op == "time_shift":
-                ng = op_time_shift(g)
+                ng = op_time_shift(g, grid)
             elif op == "day_swap":
                 ng = op_day_swap(g)
             elif op == "room_preferred":
-                ng = op_room_preferred(g)
+                ng = op_room_preferred(g, grid)
             elif op == "fit_for_two_asst":
-                ng = op_fit_for_two_asst(g)
+                ng = op_fit_for_two_asst(g, ctx)
             elif op == "regenerate":
-                ng = op_regenerate_gene()
+                ng = op_regenerate_gene(ctx)
             else:
                 ng = g
 
-            ind.chromosome[j] = ng
+            if state is None:
+                ind.chromosome[j] = ng
+                ind.invalidate()
+            elif ng is not g and (accept_worse or state.replace_delta({j: ng}) <= 0):
+                state.apply_replace({j: ng})
+            grid.add_gene(ind.chromosome[j])
+            if adaptive is not None:
+                adaptive.credit(op, state.fitness - before, time.process_time() - t)
 
             # opsional: tampilkan gene baru untuk debug
             # display_gene(ind.chromosome[j])
@@ -250,28 +287,33 @@ def mutation(
     return pops
 
 
-population = generate_population(40, 20)
-fitnesses = fitness(population)
-iteration = 0
-
-step = []
-
-while max(fitnesses) < 0.6:
-    iteration += 1
-    cross = crossover(fitnesses, population)
-    fitnesses = fitness(cross)
-    print(f"[{iteration}] max fitness from crossover: {max(fitnesses)}")
-    if max(fitnesses) > 0.9:
-        print(f"Pada iterasi {int(iteration+1)}: {max(fitnesses)}")
-        step.append(max(fitnesses))
-        break
-    mutate = mutation(cross)
-    fitnesses = fitness(mutate)
-    print(f"[{iteration}] max fitness from mutation: {max(fitnesses)}")
-    if max(fitnesses) > 0.9:
-        print(f"Pada iterasi {int(iteration+1)}: {max(fitnesses)}")
-        step.append(max(fitnesses))
-        break
-
-print(f'({",".join([str(i) for i in step])})')
-print(f'({",".join([str(i) for i in fitnesses])})')
+def main():
+    population = generate_population(40, 20)
+    fitnesses = fitness(population)
+    iteration = 0
+
+    step = []
+
+    while max(fitnesses) < 0.6:
+        iteration += 1
+        cross = crossover(fitnesses, population)
+        fitnesses = fitness(cross)
+        print(f"[{iteration}] max fitness from crossover: {max(fitnesses)}")
+        if max(fitnesses) > 0.9:
+            print(f"Pada iterasi {int(iteration+1)}: {max(fitnesses)}")
+            step.append(max(fitnesses))
+            break
+        mutate = mutation(cross)
+        fitnesses = fitness(mutate)
+        print(f"[{iteration}] max fitness from mutation: {max(fitnesses)}")
+        if max(fitnesses) > 0.9:
+            print(f"Pada iterasi {int(iteration+1)}: {max(fitnesses)}")
+            step.append(max(fitnesses))
+            break
+
+    print(f'({",".join([str(i) for i in step])})')
+    print(f'({",".join([str(i) for i in fitnesses])})')
+
+
+if __name__ == "__main__":
+    main()